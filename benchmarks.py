@@ -0,0 +1,292 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # ey sin ventana, corre en servidores -bynd
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pymunk
+from ring import Ring
+from escapes import EscapeDetector
+from simulation import PlinkoSimulation, WIDTH, HEIGHT, FPS
+from events import EventBus
+
+CENTER = (WIDTH // 2, HEIGHT // 2)
+
+def make_level(mode='escape', rings=15, rotating=False, first_radius=40, spacing=20):
+    # aaa nivel sintético reproducible, nada aleatorio -bynd
+    ball = {"radius": 12, "mass": 1, "elasticity": 0.7, "friction": 0.5}
+    ring_configs = []
+    for i in range(rings):
+        ring = {"radius": first_radius + i * spacing, "gap_angle": (i * 72) % 360, "gap_size": 60}
+        if rotating:
+            ring["rotation_speed"] = 30 if i % 2 == 0 else -25
+        ring_configs.append(ring)
+
+    level = {
+        "type": mode,
+        "description": f"Benchmark {mode}",
+        "timer": 60,
+        "rings": {"thickness": 8, "elasticity": 0.9, "friction": 0.3, "ring_configs": ring_configs},
+        "gravity": [0, 400],
+        "colors": {
+            "background": [20, 20, 30], "rings": [255, 180, 100], "ball": [255, 255, 255],
+            "timer_text": [255, 220, 100], "ball_alive": [255, 255, 255], "ball_dead": [120, 120, 120],
+            "ball_yes": [100, 255, 255], "ball_no": [255, 180, 100], "question_text": [200, 200, 200],
+            "yes_text": [100, 255, 255], "no_text": [255, 180, 100], "winner_text": [100, 255, 100]
+        }
+    }
+    if mode == '8ball':
+        level["question"] = "Will this benchmark stay fast?"
+        level["ball_yes"] = dict(ball, offset_x=-20)
+        level["ball_no"] = dict(ball, offset_x=20)
+    else:
+        level["ball"] = ball
+    if mode == 'elimination':
+        level["ball_timer"] = 1
+        level["max_balls"] = 50
+    if mode == 'swarm':
+        level["ball"] = dict(ball, radius=3)
+        level["ball_count"] = 2000
+    return level
+
+def measure(fn, repeat=5, number=1, setup=None):
+    # vavavava corremos fn number veces por ronda y guardamos ms por llamada -bynd
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(state)
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+        'repeat': repeat,
+        'number': number
+    }
+
+def quiet():
+    # chintrolas callamos los prints del juego mientras medimos -bynd
+    return contextlib.redirect_stdout(io.StringIO())
+
+def bench_ring_construction(results, quick):
+    # q chidoteee construir N anillos en un space nuevo -bynd
+    for count in (10, 50, 200):
+        for rotating in (False, True):
+            configs = make_level(rings=count, rotating=rotating)['rings']['ring_configs']
+
+            def build(_):
+                space = pymunk.Space()
+                for data in configs:
+                    Ring(space, CENTER, data['radius'], data['gap_angle'], data['gap_size'],
+                         8, 0.9, 0.3, data.get('rotation_speed', 0))
+
+            kind = 'rotating' if rotating else 'static'
+            with quiet():
+                results[f'ring_construction/{count}/{kind}'] = measure(build, repeat=3 if quick else 7)
+
+def bench_space_step(results, quick):
+    # ala throughput de space.step con anillos estáticos y rotando -bynd
+    steps = 60 if quick else 300
+    for rotating in (False, True):
+        level = make_level(rings=15, rotating=rotating)
+
+        def setup():
+            with quiet():
+                return PlinkoSimulation(level, events=EventBus())
+
+        def step(sim):
+            for _ in range(steps):
+                sim.space.step(1.0 / FPS)
+
+        kind = 'rotating' if rotating else 'static'
+        stats = measure(step, repeat=3 if quick else 5, setup=setup)
+        stats['steps'] = steps
+        stats['steps_per_s'] = steps / (stats['median_ms'] / 1000)
+        results[f'space_step/15/{kind}'] = stats
+
+def bench_check_escapes(results, quick):
+    # fokeis costo del detector según cuántas bolas hay -bynd
+    with quiet():
+        sim = PlinkoSimulation(make_level(rings=15, rotating=True), events=EventBus())
+    detector = EscapeDetector(sim.rings, CENTER)
+    rng = np.random.default_rng(0)  # ey seed fija, siempre las mismas posiciones -bynd
+    number = 20 if quick else 100
+    for balls in (1, 10, 100, 1000):
+        positions = rng.uniform((0, 0), (WIDTH, HEIGHT), size=(balls, 2))
+        point_list = [tuple(p) for p in positions.tolist()]
+
+        def per_ball(_):
+            for pos in point_list:
+                detector.check(pos)
+
+        def batched(_):
+            detector.check_many(positions)
+
+        results[f'check_escapes/{balls}/per_ball'] = measure(per_ball, number=number)
+        results[f'check_escapes/{balls}/numpy'] = measure(batched, number=number)
+
+def bench_draw(results, quick):
+    # aaa tiempo de draw() completo por modo de juego -bynd
+    from game import PlinkoGame
+    frames = 60 if quick else 240
+    for mode in ('escape', 'elimination', '8ball', 'swarm'):
+        if mode == 'swarm':
+            # chintrolas anillos más separados para q quepan las 2000 bolas -bynd
+            level = make_level(mode=mode, rings=5, rotating=True, first_radius=170, spacing=40)
+        else:
+            level = make_level(mode=mode, rings=15, rotating=True)
+
+        def setup():
+            with quiet():
+                game = PlinkoGame(headless=True, config=level, events=EventBus())
+                # chintrolas calentamos caches y el primer frame completo -bynd
+                for _ in range(30):
+                    game.update()
+                    game.draw()
+            return game
+
+        # vavavava solo se cronometra draw() dentro del mismo loop, la física corre fuera del reloj -bynd
+        samples = []
+        for _ in range(3):
+            game = setup()
+            drawing = 0.0
+            with quiet():
+                for _ in range(frames):
+                    game.update()
+                    start = time.perf_counter()
+                    game.draw()
+                    drawing += time.perf_counter() - start
+            samples.append(drawing / frames * 1000)
+        results[f'draw/{mode}'] = {
+            'median_ms': statistics.median(samples),
+            'min_ms': min(samples),
+            'max_ms': max(samples),
+            'repeat': len(samples),
+            'frames': frames
+        }
+
+def bench_reset(results, quick):
+    # ey reinicio en su lugar contra construir la simulación desde cero -bynd
+    for mode, rotating in (('escape', False), ('escape', True), ('elimination', True), ('8ball', True)):
+        level = make_level(mode=mode, rings=15, rotating=rotating)
+
+        def setup():
+            with quiet():
+                sim = PlinkoSimulation(level, seed=0, events=EventBus())
+                # chintrolas jugamos un rato para q haya algo q deshacer -bynd
+                for _ in range(300):
+                    sim.step(1.0 / FPS)
+            return sim
+
+        def reset(sim):
+            with quiet():
+                sim.reset()
+
+        def fresh(_):
+            with quiet():
+                PlinkoSimulation(level, seed=0, events=EventBus())
+
+        kind = 'rotating' if rotating else 'static'
+        number = 5 if quick else 20
+        # fokeis un solo reset por partido jugado: el segundo ya no tendría nada q deshacer -bynd
+        results[f'reset/{mode}/{kind}/in_place'] = measure(reset, repeat=number, number=1, setup=setup)
+        results[f'reset/{mode}/{kind}/fresh'] = measure(fresh, repeat=3 if quick else 7, number=number)
+
+def bench_startup(results, quick):
+    # vavavava de `python main.py` hasta el primer paso de física y hasta el primer frame, en un proceso nuevo cada vez -bynd
+    # chintrolas python pelón va aparte para saber cuánto es del intérprete -bynd
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'startup.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(make_level(mode='escape', rings=15, rotating=True), f)
+
+        commands = {
+            'startup/python': [sys.executable, '-c', 'pass'],
+            'startup/first_step': [sys.executable, main_py, path, '--no-render', '--turbo', '--frames', '1'],
+            'startup/first_frame': [sys.executable, main_py, path, '--turbo', '--frames', '1']
+        }
+        for name, command in commands.items():
+            def launch(_):
+                subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            results[name] = measure(launch, repeat=3 if quick else 7)
+
+BENCHMARKS = {
+    'ring_construction': bench_ring_construction,
+    'space_step': bench_space_step,
+    'check_escapes': bench_check_escapes,
+    'reset': bench_reset,
+    'draw': bench_draw,
+    'startup': bench_startup
+}
+
+def metadata():
+    # vavavava con qué se corrió, para comparar peras con peras -bynd
+    import pygame
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pymunk': pymunk.version,
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+def compare(results, baseline, threshold):
+    # q chidoteee comparamos contra la línea base guardada -bynd
+    regressions = []
+    for name, stats in sorted(results.items()):
+        base = baseline.get('results', {}).get(name)
+        if not base or not base.get('median_ms'):
+            print(f"   {name:<40} {stats['median_ms']:9.3f} ms   (nuevo)")
+            continue
+        ratio = stats['median_ms'] / base['median_ms']
+        flag = ''
+        if ratio > threshold:
+            flag = '  ⚠️ más lento'
+            regressions.append(name)
+        print(f"   {name:<40} {stats['median_ms']:9.3f} ms   x{ratio:.2f}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de Plinko (sin ventana)")
+    parser.add_argument('--only', nargs='*', choices=sorted(BENCHMARKS), help="solo estos grupos")
+    parser.add_argument('--quick', action='store_true', help="menos repeticiones")
+    parser.add_argument('--out', default='bench_results.json', help="JSON con los resultados")
+    parser.add_argument('--baseline', default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument('--threshold', type=float, default=1.2, help="qué tanto más lento cuenta como regresión")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f"⏱️ {name}...")
+        BENCHMARKS[name](results, args.quick)
+
+    report = {'meta': metadata(), 'results': results}
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Resultados guardados en {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regresiones arriba de x{args.threshold}")
+            sys.exit(1)
+    else:
+        for name, stats in sorted(results.items()):
+            print(f"   {name:<40} {stats['median_ms']:9.3f} ms")
+
+if __name__ == "__main__":
+    main()
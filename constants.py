@@ -0,0 +1,9 @@
+import os
+
+# ey constantes de pantalla en 9:16 para móviles -bynd
+# chintrolas aquí aparte para q el render no tenga q importar pymunk -bynd
+WIDTH, HEIGHT = 450, 800
+FPS = 60
+
+# vavavava importar constants antes q pygame le quita el banner de bienvenida (sale en cada worker) -bynd
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
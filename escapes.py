@@ -0,0 +1,101 @@
+import math
+import numpy as np
+from bisect import bisect_left
+from ringset import RingSet
+
+# ey la bola cuenta como fuera cuando pasa radio + este margen -bynd
+ESCAPE_MARGIN = 20
+
+class EscapeDetector:
+    def __init__(self, rings, center):
+        # aaa índice de anillos vivos ordenados por radio -bynd
+        self.center = center
+        self.all_rings = list(rings)
+        # chintrolas con un RingSet los ángulos de todos los gaps salen de un solo cálculo -bynd
+        self.ring_set = rings if isinstance(rings, RingSet) else None
+        self.rebuild()
+
+    def rebuild(self):
+        # vavavava reconstruimos el índice solo con los anillos vivos -bynd
+        self.rings = sorted((ring for ring in self.all_rings if not ring.destroyed), key=lambda ring: ring.radius)
+        self.limits = [ring.radius + ESCAPE_MARGIN for ring in self.rings]
+        self.limits_array = np.array(self.limits, dtype=np.float64)
+
+    def discard(self, ring):
+        # ey sacamos un anillo destruido del índice -bynd
+        if ring in self.rings:
+            self.rebuild()
+
+    def candidates(self, distance):
+        # chintrolas solo los anillos q la bola ya dejó atrás pueden tener escape -bynd
+        count = bisect_left(self.limits, distance)
+        rings = self.rings[:count]
+        if any(ring.destroyed for ring in rings):
+            # fokeis alguien destruyó un anillo, limpiamos el índice -bynd
+            self.rebuild()
+            rings = self.rings[:bisect_left(self.limits, distance)]
+        return rings
+
+    def escaped_through(self, ring, angle):
+        # q chidoteee misma regla q Ring.check_ball_escaped con el ángulo ya calculado -bynd
+        current_gap_angle = ring.get_current_gap_angle()
+        gap_start = (current_gap_angle - ring.gap_size / 2) % 360
+        gap_end = (current_gap_angle + ring.gap_size / 2) % 360
+        return ring.is_in_gap(angle, gap_start, gap_end)
+
+    def check(self, ball_pos, rings=None):
+        # ey anillos por los q escapó una bola, del más chico al más grande -bynd
+        # chintrolas con rings solo se checan esos (los q reportó el sensor del gap) -bynd
+        dx = ball_pos[0] - self.center[0]
+        dy = ball_pos[1] - self.center[1]
+        distance = math.sqrt(dx*dx + dy*dy)
+
+        # ala lo normal es q la bola siga adentro del anillo más chico y ya -bynd
+        if not self.limits or distance <= self.limits[0]:
+            return []
+
+        angle = math.degrees(math.atan2(dy, dx)) % 360
+        candidates = self.candidates(distance)
+        if rings is not None:
+            candidates = [ring for ring in candidates if ring in rings]
+        return [ring for ring in candidates if self.escaped_through(ring, angle)]
+
+    def check_many(self, positions):
+        # vavavava muchas bolas de un jalón, positions es un array (N, 2) -bynd
+        # chintrolas regresa lista de (índice de bola, anillo) -bynd
+        hits = []
+        if not self.limits or len(positions) == 0:
+            return hits
+
+        offsets = np.asarray(positions, dtype=np.float64) - self.center
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        outside = np.nonzero(distances > self.limits_array[0])[0]
+        if len(outside) == 0:
+            return hits
+
+        # q chidoteee un paso vectorizado por anillo, no un loop por bola -bynd
+        distances = distances[outside]
+        angles = np.degrees(np.arctan2(offsets[outside, 1], offsets[outside, 0])) % 360
+        gaps = self.ring_set.gap_angles().tolist() if self.ring_set is not None else None
+        stale = False
+        for ring, limit in zip(self.rings, self.limits):
+            passed = distances > limit
+            if not passed.any():
+                break  # ala van ordenados, si nadie pasó este tampoco los de afuera -bynd
+            if ring.destroyed:
+                stale = True
+                continue
+            current_gap_angle = gaps[ring.index] if gaps is not None else ring.get_current_gap_angle()
+            gap_start = (current_gap_angle - ring.gap_size / 2) % 360
+            gap_end = (current_gap_angle + ring.gap_size / 2) % 360
+            if gap_start < gap_end:
+                in_gap = (angles >= gap_start) & (angles <= gap_end)
+            else:
+                in_gap = (angles >= gap_start) | (angles <= gap_end)
+            hits.extend((index, ring) for index in outside[passed & in_gap].tolist())
+        if stale:
+            self.rebuild()
+
+        # fokeis mismo orden q antes: por bola y del anillo más chico al más grande -bynd
+        hits.sort(key=lambda hit: hit[0])
+        return hits
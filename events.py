@@ -0,0 +1,152 @@
+import json
+import threading
+from collections import deque, namedtuple
+
+# ey tipos de evento q suelta la simulación -bynd
+RING_DESTROYED = 'ring_destroyed'
+BALL_SPAWNED = 'ball_spawned'
+BALL_KILLED = 'ball_killed'
+ESCAPE = 'escape'
+MATCH_END = 'match_end'
+TIMER_EXPIRED = 'timer_expired'
+EVENT_TYPES = (RING_DESTROYED, BALL_SPAWNED, BALL_KILLED, ESCAPE, MATCH_END, TIMER_EXPIRED)
+
+class Event(namedtuple('Event', 'type time step data')):
+    # aaa un evento con su tiempo simulado y el paso en q pasó -bynd
+    __slots__ = ()
+
+    def to_dict(self):
+        # vavavava plano para JSON -bynd
+        return {'type': self.type, 'time': self.time, 'step': self.step, **self.data}
+
+
+class EventBus:
+    def __init__(self, sinks=()):
+        # chintrolas sin sinks publicar no cuesta nada, la simulación ni arma el evento -bynd
+        self.sinks = []
+        for sink in sinks:
+            self.subscribe(sink)
+
+    def subscribe(self, sink, types=None):
+        # q chidoteee types opcional: solo le llegan esos tipos -bynd
+        for kind in types or ():
+            if kind not in EVENT_TYPES:
+                raise ValueError(f"Tipo de evento desconocido: {kind}")
+        self.sinks.append((sink, frozenset(types) if types else None))
+        return sink
+
+    def unsubscribe(self, sink):
+        self.sinks = [(s, types) for s, types in self.sinks if s is not sink]
+
+    def publish(self, event):
+        # ala repartimos a cada sink q lo quiera -bynd
+        for sink, types in self.sinks:
+            if types is None or event.type in types:
+                sink.handle(event)
+
+    def flush(self):
+        for sink, _ in self.sinks:
+            sink.flush()
+
+    def close(self):
+        # fokeis cerramos todos, los de archivo escriben lo q les quedó -bynd
+        for sink, _ in self.sinks:
+            sink.close()
+        self.sinks = []
+
+
+class NullSink:
+    # ey se traga todo, para medir el costo del bus sin I/O -bynd
+    def handle(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ConsoleSink(NullSink):
+    # vavavava los mismos mensajes con emoji de siempre, para jugar en la terminal -bynd
+    def handle(self, event):
+        data = event.data
+        if event.type == RING_DESTROYED:
+            print(f"💥 Anillo destruido! (Radio: {data['radius']:.0f})")
+        elif event.type == BALL_SPAWNED:
+            if data['mode'] == '8ball':
+                print(f"⚪⚪ Par de bolas spawneado (Yes: cyan, No: naranja)")
+            elif data['mode'] == 'elimination':
+                print(f"⚪ Nueva bola spawneada ({data['number']}/{data['max_balls']})")
+            elif data['mode'] == 'swarm':
+                print(f"⚪ {data['count']} bolas soltadas")
+        elif event.type == BALL_KILLED:
+            print(f"💀 Bola eliminada en posición ({data['x']:.0f}, {data['y']:.0f})")
+        elif event.type == ESCAPE:
+            if data['ball'] == 'YES':
+                print(f"💙 YES escapa por anillo R={data['radius']:.0f}! Puntos: {data['score']}")
+            elif data['ball'] == 'NO':
+                print(f"🧡 NO escapa por anillo R={data['radius']:.0f}! Puntos: {data['score']}")
+        elif event.type == TIMER_EXPIRED:
+            print("⏰ TIEMPO TERMINADO" if data['mode'] == '8ball' else "⏰ SE ACABÓ EL TIEMPO")
+        elif event.type == MATCH_END:
+            reason = data['reason']
+            if data['mode'] == '8ball':
+                print(f"🏆 Ganador: {data['winner']}")
+                print(f"   YES: {data['yes_score']} | NO: {data['no_score']}")
+            elif reason == 'all_rings':
+                if data['mode'] == 'swarm':
+                    print("🎉 ¡GANASTE! El swarm rompió todos los anillos")
+                else:
+                    print("🎉 ¡GANASTE! Escapaste de todos los anillos")
+            elif reason == 'no_balls':
+                if data['mode'] == 'swarm':
+                    print("💀 SE SALIERON TODAS LAS BOLAS")
+                else:
+                    print("💀 SE ACABARON LAS BOLAS")
+            print("=" * 50)
+
+
+class JsonlSink(NullSink):
+    def __init__(self, path, interval=0.5, **fields):
+        # aaa un evento por línea; la simulación solo apila, un hilo escribe cada interval segundos -bynd
+        # chintrolas fields se pegan a cada línea (ej. seed o nombre del nivel) -bynd
+        self.path = path
+        self.fields = fields
+        self.interval = interval
+        self.buffer = deque()
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+        self.file = open(path, 'a', encoding='utf-8')
+        self.written = 0
+        self.thread = threading.Thread(target=self.loop, name='jsonl-sink', daemon=True)
+        self.thread.start()
+
+    def handle(self, event):
+        # q chidoteee en el paso de la simulación solo un append, nada de I/O -bynd
+        self.buffer.append(event)
+
+    def loop(self):
+        # ala el hilo se despierta cada interval y vacía lo acumulado -bynd
+        while not self.stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        # fokeis sacamos lo q hay en el deque (append/popleft no necesitan lock) y escribimos fuera del paso -bynd
+        with self.lock:
+            events = [self.buffer.popleft() for _ in range(len(self.buffer))]
+            if not events or self.file.closed:
+                return
+            lines = [json.dumps({**self.fields, **event.to_dict()}, ensure_ascii=False) for event in events]
+            self.file.write('\n'.join(lines) + '\n')
+            self.file.flush()
+            self.written += len(lines)
+
+    def close(self):
+        # ey paramos el hilo y escribimos lo último -bynd
+        if self.file.closed:
+            return
+        self.stop.set()
+        self.thread.join()
+        self.flush()
+        self.file.close()
@@ -0,0 +1,176 @@
+import argparse
+import os
+import queue
+import subprocess
+import threading
+import time
+from constants import WIDTH, HEIGHT, FPS
+import pygame
+from game import PlinkoGame
+from shmframes import FramePublisher
+
+class RawRGBSink:
+    # ey stream crudo RGB24, un frame detrás de otro -bynd
+    ordered = True
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+
+    def write(self, index, data):
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+class PNGSequenceSink:
+    # vavavava un PNG por frame, el orden no importa así q varios hilos pueden escribir -bynd
+    ordered = False
+
+    def __init__(self, directory, size=(WIDTH, HEIGHT), pattern='frame_{:06d}.png'):
+        self.directory = directory
+        self.size = size
+        self.pattern = pattern
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, index, data):
+        surface = pygame.image.frombytes(data, self.size, 'RGB')
+        pygame.image.save(surface, os.path.join(self.directory, self.pattern.format(index)))
+
+    def close(self):
+        pass
+
+
+class PipeSink:
+    # chintrolas mandamos los frames crudos al stdin de otro proceso (ej. ffmpeg) -bynd
+    ordered = True
+
+    def __init__(self, command):
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, index, data):
+        self.process.stdin.write(data)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"El proceso terminó con código {self.process.returncode}")
+
+
+def ffmpeg_command(output, size=(WIDTH, HEIGHT), fps=FPS):
+    # q chidoteee comando de ffmpeg para leer RGB crudo del stdin -bynd
+    return ['ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{size[0]}x{size[1]}', '-r', str(fps),
+            '-i', '-', '-pix_fmt', 'yuv420p', output]
+
+
+class FrameExporter:
+    def __init__(self, sink, queue_size=32, writers=None):
+        # aaa cola acotada + hilos q escriben, el render nunca espera al disco -bynd
+        # fokeis solo espera si la cola se llena (para no comernos la RAM) -bynd
+        self.sink = sink
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        if sink.ordered:
+            writers = 1  # ala un stream necesita los frames en orden -bynd
+        else:
+            writers = writers or min(4, os.cpu_count() or 1)
+        self.threads = [threading.Thread(target=self.writer_loop, daemon=True) for _ in range(writers)]
+        for thread in self.threads:
+            thread.start()
+        self.frames = 0
+
+    def writer_loop(self):
+        # vavavava cada hilo saca frames de la cola hasta ver el None -bynd
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is None:
+                try:
+                    self.sink.write(*item)
+                except Exception as e:
+                    self.error = e
+
+    def submit(self, data):
+        # ey encolamos el buffer del frame -bynd
+        if self.error is not None:
+            raise self.error
+        self.queue.put((self.frames, data))
+        self.frames += 1
+
+    def close(self):
+        # chintrolas avisamos a cada hilo q ya no hay más y esperamos -bynd
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.sink.close()
+        if self.error is not None:
+            raise self.error
+
+
+def export_match(config_file, sink, seconds=None, tail=2.0, queue_size=32, writers=None, profile_path=None, seed=None, config=None):
+    # q chidoteee simulamos y renderizamos fuera de pantalla tan rápido como se pueda -bynd
+    # ey un FramePublisher recibe la superficie tal cual, sin tobytes ni cola (memoria compartida) -bynd
+    game = PlinkoGame(config_file, turbo=True, headless=True, config=config, seed=seed)
+    zero_copy = getattr(sink, 'zero_copy', False)
+    exporter = sink if zero_copy else FrameExporter(sink, queue_size, writers)
+
+    max_frames = int(seconds * FPS) if seconds else None
+    tail_frames = int(tail * FPS)
+    start = time.perf_counter()
+    try:
+        while max_frames is None or exporter.frames < max_frames:
+            game.profiler.begin_frame()
+            game.update()
+            game.draw()
+            exporter.submit(game.screen if zero_copy else pygame.image.tobytes(game.screen, 'RGB'))
+            game.profiler.lap('export')
+            game.profiler.end_frame()
+
+            # ala dejamos unos frames de la pantalla final y cortamos -bynd
+            if game.sim.game_over:
+                if tail_frames <= 0:
+                    break
+                tail_frames -= 1
+    finally:
+        exporter.close()
+        if profile_path:
+            game.profiler.write_json(profile_path)
+    return exporter.frames, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta un partido a frames sin ventana")
+    parser.add_argument('config', nargs='?', default='level_config.json', help="archivo JSON del nivel")
+    parser.add_argument('--format', choices=['png', 'raw', 'ffmpeg', 'shm'], default='png', help="tipo de salida")
+    parser.add_argument('--out', default='frames', help="carpeta (png), archivo (raw/ffmpeg) o nombre de la memoria compartida (shm)")
+    parser.add_argument('--seconds', type=float, default=None, help="segundos máximos de clip")
+    parser.add_argument('--tail', type=float, default=2.0, help="segundos extra de la pantalla final")
+    parser.add_argument('--writers', type=int, default=None, help="hilos de escritura (solo png)")
+    parser.add_argument('--queue', type=int, default=32, help="frames máximos en la cola")
+    parser.add_argument('--profile', default=None, help="guarda el resumen del profiler en este JSON")
+    parser.add_argument('--seed', type=int, default=None, help="seed del partido (mueve tantito el spawn)")
+    parser.add_argument('--slots', type=int, default=4, help="frames en el ring buffer (solo shm)")
+    parser.add_argument('--readers', type=int, default=1, help="lectores a esperar (solo shm)")
+    args = parser.parse_args()
+
+    if args.format == 'shm':
+        # chintrolas el ring buffer se arma con una superficie del mismo formato q el screen fuera de pantalla -bynd
+        sink = FramePublisher(pygame.Surface((WIDTH, HEIGHT)), args.out, args.slots, args.readers)
+        print(f"📡 Esperando {args.readers} lector(es) en {sink.name} (python shmframes.py {sink.name})...")
+        sink.wait_readers()
+    elif args.format == 'png':
+        sink = PNGSequenceSink(args.out)
+    elif args.format == 'raw':
+        sink = RawRGBSink(args.out)
+    else:
+        sink = PipeSink(ffmpeg_command(args.out))
+
+    frames, elapsed = export_match(args.config, sink, args.seconds, args.tail, args.queue, args.writers, args.profile, args.seed)
+    clip = frames / FPS
+    print(f"🎬 {frames} frames ({clip:.1f}s de clip) en {elapsed:.1f}s ({clip / elapsed:.1f}x tiempo real)")
+
+if __name__ == "__main__":
+    main()
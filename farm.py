@@ -0,0 +1,266 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from levels import LevelConfig
+from simulation import PlinkoSimulation
+from events import EventBus
+
+# ey qué sale de cada job: resultado JSON, replay o un clip renderizado -bynd
+MODES = ('result', 'replay', 'png', 'raw', 'ffmpeg')
+# chintrolas los más tardados se mandan primero, así no queda uno largo solito al final -bynd
+COST = {'ffmpeg': 0, 'png': 0, 'raw': 0, 'replay': 1, 'result': 2}
+# vavavava un nivel o un job mal escrito falla igual cada vez, no vale la pena reintentarlo -bynd
+BAD_INPUT = (ValueError, KeyError)
+
+def load_level(path):
+    # aaa aquí un nivel malo es error de su job, no cae al nivel por defecto como LevelConfig -bynd
+    if not os.path.isfile(path):
+        raise ValueError(f"No se encontró el nivel {path}")
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            level = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error al parsear {path}: {e}")
+    if not isinstance(level, dict) or not LevelConfig.validate_level(level):
+        raise ValueError(f"El nivel {path} tiene campos faltantes")
+    return level
+
+def make_parent(path):
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+def run_result(job, config):
+    # ey solo física, el resultado va a un JSON -bynd
+    sim = PlinkoSimulation(config, seed=job['seed'], events=EventBus())
+    result = sim.run(max_time=job.get('max_time'))
+    make_parent(job['output'])
+    with open(job['output'], 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    return result
+
+def run_replay(job, config):
+    # vavavava grabamos el partido para re-renderizarlo después -bynd
+    from replay import record_match
+    make_parent(job['output'])
+    result, steps = record_match(job['level'], job['output'], job['seed'], job.get('max_time'), config=config)
+    return result
+
+def run_render(job, config):
+    # q chidoteee clip fuera de pantalla, pygame se importa solo en los workers q renderizan -bynd
+    from export import export_match, PNGSequenceSink, RawRGBSink, PipeSink, ffmpeg_command
+    if job['mode'] == 'png':
+        sink = PNGSequenceSink(job['output'])
+    else:
+        make_parent(job['output'])
+        sink = RawRGBSink(job['output']) if job['mode'] == 'raw' else PipeSink(ffmpeg_command(job['output']))
+    frames, elapsed = export_match(job['level'], sink, job.get('seconds'), job.get('tail', 2.0),
+                                   seed=job['seed'], config=config)
+    return {'frames': frames}
+
+RUNNERS = {'result': run_result, 'replay': run_replay, 'png': run_render, 'raw': run_render, 'ffmpeg': run_render}
+
+def _init_worker():
+    # ala el Ctrl-C lo atiende el proceso principal, q mata el pool; los workers no imprimen tracebacks -bynd
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def run_job(job):
+    # aaa corre un job en el worker; cualquier error se regresa como registro, el pool sigue -bynd
+    start = time.perf_counter()
+    record = {'id': job['id'], 'attempt': job['attempt']}
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            config = load_level(job['level'])
+            record['result'] = RUNNERS[job['mode']](job, config)
+        record['status'] = 'done'
+    except Exception as e:
+        record['status'] = 'failed'
+        record['error'] = f"{type(e).__name__}: {e}"
+        record['retry'] = not isinstance(e, BAD_INPUT)
+    record['runtime'] = time.perf_counter() - start
+    return record
+
+def failed_record(job, error):
+    # fokeis el job no regresó nada (se murió su worker o no se pudo mandar), cuenta como intento fallido -bynd
+    return {'id': job['id'], 'attempt': job['attempt'], 'status': 'failed', 'error': error, 'retry': True, 'runtime': 0.0}
+
+def run_farm(jobs, workers=None, retries=2):
+    # chintrolas a lo más un job corriendo por worker y se rellena en cuanto uno termina, así nadie se queda esperando -bynd
+    # ala un job q falla se vuelve a encolar hasta retries veces; regresa cada intento conforme termina -bynd
+    workers = workers or os.cpu_count() or 1
+    by_id = {job['id']: job for job in jobs}
+    waiting = deque(dict(job, attempt=1) for job in sorted(jobs, key=lambda job: COST[job['mode']]))
+    # vavavava sospechosos de tumbar el pool: corren de uno en uno hasta saber quién fue -bynd
+    suspects = deque()
+    running = {}
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker)
+    pending = len(jobs)
+    try:
+        while pending:
+            if suspects:
+                if not running:
+                    job = suspects.popleft()
+                    running[executor.submit(run_job, job)] = (job, executor, True)
+            else:
+                while waiting and len(running) < workers:
+                    job = waiting.popleft()
+                    running[executor.submit(run_job, job)] = (job, executor, workers == 1)
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job, owner, alone = running.pop(future)
+                crashed = False
+                try:
+                    record = future.result()
+                except BrokenProcessPool:
+                    # vavavava un worker se murió (segfault, OOM, os._exit): el pool ya no sirve y lo q corría se perdió -bynd
+                    if owner is executor:
+                        executor.shutdown(wait=False)
+                        executor = ProcessPoolExecutor(workers, initializer=_init_worker)
+                    if not alone:
+                        # ey no sabemos cuál de los q corrían fue, nadie paga intento hasta q corra solo -bynd
+                        suspects.append(job)
+                        continue
+                    record = failed_record(job, "BrokenProcessPool: el worker se murió a medio job")
+                    crashed = True
+                except Exception as e:
+                    record = failed_record(job, f"{type(e).__name__}: {e}")
+
+                if record['status'] == 'failed' and record.get('retry') and record['attempt'] <= retries:
+                    # chintrolas el q tumbó el pool corriendo solo se reintenta solo, sin tumbar a los demás -bynd
+                    (suspects if crashed else waiting).append(dict(job, attempt=record['attempt'] + 1))
+                    record['status'] = 'retry'
+                else:
+                    pending -= 1
+                yield by_id[job['id']], record
+    except BaseException:
+        # ey con Ctrl-C no esperamos a los jobs q van corriendo, se matan los workers -bynd
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in multiprocessing.active_children():
+            process.terminate()
+        raise
+    executor.shutdown()
+
+def job_id(job):
+    return job.get('id') or f"{job['level']}:{job['mode']}:{job['seed']}:{job['output']}"
+
+def load_manifest(path):
+    # ey lista JSON de jobs, {"jobs": [...]} o un JSONL con un job por línea -bynd
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            raw = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+            raw = data['jobs'] if isinstance(data, dict) else data
+
+    jobs = []
+    seen = set()
+    for i, entry in enumerate(raw):
+        if 'level' not in entry or 'output' not in entry:
+            raise ValueError(f"Job {i}: necesita 'level' y 'output'")
+        job = dict(entry, mode=entry.get('mode', 'result'), seed=entry.get('seed'))
+        if job['mode'] not in MODES:
+            raise ValueError(f"Job {i}: modo '{job['mode']}' no existe, usa uno de {', '.join(MODES)}")
+        job['id'] = job_id(job)
+        if job['id'] in seen:
+            raise ValueError(f"Job {i}: id repetido '{job['id']}'")
+        seen.add(job['id'])
+        jobs.append(job)
+    return jobs
+
+def load_checkpoint(path):
+    # vavavava ids ya terminados; una línea a medias (se murió escribiendo) se ignora y ese job se repite -bynd
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('status') == 'done':
+                done.add(record['id'])
+    return done
+
+def open_checkpoint(path):
+    # chintrolas en modo append; si quedó una línea cortada le cerramos el renglón antes de seguir -bynd
+    make_parent(path)
+    cut = False
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            cut = f.read(1) != b'\n'
+    f = open(path, 'a', encoding='utf-8')
+    if cut:
+        f.write('\n')
+    return f
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Corre un manifiesto de jobs (nivel, modo, seed, salida) en un pool de procesos")
+    parser.add_argument('manifest', help="JSON o JSONL con los jobs")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="procesos (por defecto uno por core)")
+    parser.add_argument('--checkpoint', default=None, help="JSONL de jobs terminados (por defecto <manifest>.done.jsonl)")
+    parser.add_argument('--retries', type=int, default=2, help="reintentos por job q falla")
+    args = parser.parse_args()
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (ValueError, KeyError, json.JSONDecodeError) as e:
+        print(f"❌ Manifiesto inválido: {e}")
+        sys.exit(1)
+
+    # aaa lo q ya está en el checkpoint no se vuelve a correr -bynd
+    checkpoint = args.checkpoint or os.path.splitext(args.manifest)[0] + '.done.jsonl'
+    done_ids = load_checkpoint(checkpoint)
+    todo = [job for job in jobs if job['id'] not in done_ids]
+    print(f"🏭 {len(jobs)} jobs, {len(jobs) - len(todo)} ya hechos en {checkpoint}, faltan {len(todo)}")
+    if not todo:
+        return
+
+    finished = 0
+    failed = []
+    start = time.perf_counter()
+    with open_checkpoint(checkpoint) as log:
+        try:
+            for job, record in run_farm(todo, args.workers, args.retries):
+                elapsed = time.perf_counter() - start
+                if record['status'] == 'retry':
+                    print(f"🔁 {record['id']} intento {record['attempt']} falló: {record['error']}")
+                    continue
+
+                # ey cada job terminado se escribe y se baja a disco antes de seguir -bynd
+                finished += 1
+                entry = dict(record, level=job['level'], mode=job['mode'], seed=job['seed'], output=job['output'])
+                log.write(json.dumps(entry) + '\n')
+                log.flush()
+                os.fsync(log.fileno())
+
+                rate = finished / elapsed * 60 if elapsed else 0.0
+                if record['status'] == 'done':
+                    print(f"[{finished}/{len(todo)}] ✅ {record['id']} ({record['runtime']:.1f}s) | {rate:.1f} jobs/min")
+                else:
+                    failed.append(record['id'])
+                    print(f"[{finished}/{len(todo)}] ❌ {record['id']}: {record['error']} | {rate:.1f} jobs/min")
+        except KeyboardInterrupt:
+            print(f"\n⏸️ Interrumpido con {finished}/{len(todo)} jobs; el mismo comando sigue donde se quedó")
+            sys.exit(130)
+
+    elapsed = time.perf_counter() - start
+    print("=" * 50)
+    print(f"🏭 {finished - len(failed)} hechos, {len(failed)} fallidos en {elapsed:.1f}s "
+          f"({finished / elapsed * 60:.1f} jobs/min)")
+    if failed:
+        print(f"   Fallidos (se reintentan al volver a correr): {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
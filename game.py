@@ -1,376 +1,164 @@
-import pymunk
-import pymunk.pygame_util
-import pygame
 import sys
 import time
 from levels import LevelConfig
-from ring import Ring
-
-# ey constantes de pantalla en 9:16 para móviles -bynd
-WIDTH, HEIGHT = 450, 800
-FPS = 60
+from constants import WIDTH, HEIGHT, FPS
+import pygame
+from ui import HUD
+from sprites import RingRenderer, GraveyardLayer, BallSprite
+from profiler import FrameProfiler
+from timestep import FixedTimestep
+from hotreload import LevelWatcher, diff_levels, has_changes
 
 class PlinkoGame:
-    def __init__(self):
-        # aaa inicialización de pygame -bynd
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Plinko")
-        self.clock = pygame.time.Clock()
-        
-        # vavavava cargamos el nivel usando LevelConfig -bynd
-        self.level_config = LevelConfig()
-        self.config = self.level_config.get_level()
-        
-        # ey creamos el espacio de físicas -bynd
-        self.space = pymunk.Space()
-        self.space.gravity = tuple(self.config['gravity'])
-        
-        # chintrolas NO usamos draw_options, dibujamos todo manual -bynd
-        
-        # q chidoteee variables del juego -bynd
-        self.rings = []
-        self.game_mode = self.config.get('type', 'escape')
-        
-        # chintrolas variables según el modo -bynd
-        if self.game_mode == '8ball':
-            self.ball_yes = None
-            self.ball_no = None
-            self.yes_score = 0
-            self.no_score = 0
-            self.start_time = None
-            self.last_spawn_time = None
-            self.spawn_delay = self.config.get('ball_spawn_delay', 2)
-            self.winner = None
-        elif self.game_mode == 'elimination':
-            self.balls = []
-            self.current_ball = None
-            self.ball_timer = None
-            self.balls_used = 0
-            self.max_balls = self.config.get('max_balls', 10)
-            self.ball_lifetime = self.config.get('ball_timer', 3)
+    def __init__(self, config_file='level_config.json', turbo=False, headless=False, config=None, profile_path=None, sim=None, events=None,
+                 physics_hz=None, render=True, watch=False, text_cache=None, sprite_cache=None, publish=None, max_frames=None, seed=None):
+        # vavavava primero el nivel (LevelConfig o uno ya parseado), así un JSON malo avisa antes de abrir ventana -bynd
+        self.config_file = config_file
+        if config is None:
+            self.level_config = LevelConfig(config_file)
+            config = self.level_config.get_level()
+        self.physics_hz = physics_hz
+        if physics_hz:
+            # chintrolas la frecuencia de física de la línea de comandos le gana al JSON -bynd
+            config = dict(config, physics_hz=physics_hz)
+        self.config = config
+        
+        # aaa inicialización de pygame: solo video y fuentes, sin audio ni joysticks q no usamos -bynd
+        self.headless = headless
+        if headless:
+            # chintrolas sin ventana, dibujamos en una superficie fuera de pantalla -bynd
+            pygame.font.init()
+            self.screen = pygame.Surface((WIDTH, HEIGHT))
         else:
-            self.ball = None
-            self.start_time = None
+            pygame.display.init()
+            pygame.font.init()
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Plinko")
+        self.clock = pygame.time.Clock()
         
-        self.game_over = False
-        self.won = False
+        # ey la simulación vive aparte, aquí solo dibujamos -bynd
+        # fokeis se puede pasar otra q tenga la misma cara (ej. un replay), así no se importa pymunk -bynd
+        if sim is None:
+            from simulation import PlinkoSimulation
+            sim = PlinkoSimulation(self.config, seed=seed, events=events)
+        self.sim = sim
+        self.events = events
+        self.game_mode = self.sim.game_mode
         self.running = True
         
-        # ala creamos el nivel -bynd
-        self.setup_level()
+        # q chidoteee HUD retenido, sprites y regiones sucias del frame anterior -bynd
+        # ala los caches de fuentes y sprites se pueden compartir entre varios juegos (multigame.py) -bynd
+        self.text_cache = text_cache
+        self.sprite_cache = sprite_cache
+        self.setup_view()
+        
+        # ey con --watch el JSON se vigila y se recarga en caliente -bynd
+        self.watcher = LevelWatcher(config_file) if watch else None
+        
+        # vavavava con publish cada frame dibujado se copia a memoria compartida para otros procesos (shmframes.py) -bynd
+        # fokeis en vivo no esperamos a nadie: si el lector se atrasa el frame se tira -bynd
+        self.publisher = None
+        if publish:
+            from shmframes import FramePublisher
+            self.publisher = FramePublisher(self.screen, publish, block=False)
+        
+        # chintrolas en turbo no esperamos al reloj real, va a todo lo q da -bynd
+        self.turbo = turbo
+        # ey con max_frames el loop sale solo después de N frames (ej. para medir el arranque) -bynd
+        self.max_frames = max_frames
+        self.frames = 0
+        
+        # ey física a paso fijo (physics_hz) con varios pasos por frame; sin render solo corre la física -bynd
+        self.render = render
+        self.timestep = FixedTimestep(self.config.get('physics_hz', FPS))
+        self.interpolate = False
+        self.alpha = 1.0
+        self.prev_positions = {}
+        self.prev_rotations = None
+        self.prev_swarm = None
+        
+        # vavavava profiler por fase, barato para dejarlo prendido siempre -bynd
+        self.profiler = FrameProfiler()
+        self.profile_path = profile_path
+        self.show_profile = False
+        self.profile_overlay = None
         
         # fokeis mostramos info del nivel -bynd
         self.print_level_info()
     
-    def setup_level(self):
-        # vavavava configuramos todos los elementos del nivel -bynd
-        center = (WIDTH // 2, HEIGHT // 2)  # chintrolas centro de la pantalla -bynd
-        rings_config = self.config['rings']
-        
-        # ey iteramos sobre cada config de anillo -bynd
-        for ring_data in rings_config['ring_configs']:
-            ring = Ring(
-                space=self.space,
-                center=center,
-                radius=ring_data['radius'],
-                gap_angle=ring_data['gap_angle'],
-                gap_size=ring_data['gap_size'],
-                thickness=rings_config['thickness'],
-                elasticity=rings_config['elasticity'],
-                friction=rings_config['friction'],
-                rotation_speed=ring_data.get('rotation_speed', 0)
-            )
-            self.rings.append(ring)
-        
-        # q chidoteee iniciamos según el modo -bynd
-        if self.game_mode == '8ball':
-            self.spawn_8ball_pair()
-            self.start_time = time.time()
-            self.last_spawn_time = time.time()
-        elif self.game_mode == 'elimination':
-            self.spawn_new_ball()
-        else:
-            self.create_ball()
-            self.start_time = time.time()
-    
-    def spawn_8ball_pair(self):
-        # aaa spawneamos el par de bolas yes/no -bynd
-        center_x = WIDTH // 2
-        center_y = HEIGHT // 2
-        
-        # vavavava bola YES (cyan) -bynd
-        if 'ball_yes' in self.config:
-            ball_config = self.config['ball_yes']
-            offset_x = ball_config.get('offset_x', -20)
-            
-            mass = ball_config['mass']
-            radius = ball_config['radius']
-            
-            body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
-            body.position = (center_x + offset_x, center_y)
-            
-            shape = pymunk.Circle(body, radius)
-            shape.elasticity = ball_config['elasticity']
-            shape.friction = ball_config['friction']
-            shape.collision_type = 1  # ey tipo yes -bynd
-            
-            self.space.add(body, shape)
-            self.ball_yes = shape
-        
-        # chintrolas bola NO (naranja) -bynd
-        if 'ball_no' in self.config:
-            ball_config = self.config['ball_no']
-            offset_x = ball_config.get('offset_x', 20)
-            
-            mass = ball_config['mass']
-            radius = ball_config['radius']
-            
-            body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
-            body.position = (center_x + offset_x, center_y)
-            
-            shape = pymunk.Circle(body, radius)
-            shape.elasticity = ball_config['elasticity']
-            shape.friction = ball_config['friction']
-            shape.collision_type = 2  # q chidoteee tipo no -bynd
-            
-            self.space.add(body, shape)
-            self.ball_no = shape
-        
-        print(f"⚪⚪ Par de bolas spawneado (Yes: cyan, No: naranja)")
-    
-    def remove_ball(self, ball):
-        # ala removemos una bola del espacio -bynd
-        if ball and ball.body:
-            try:
-                self.space.remove(ball.body, ball)
-            except:
-                pass
-    
-    def create_ball(self):
-        # ala creamos una bola para modo escape -bynd
-        ball_config = self.config['ball']
-        center = (WIDTH // 2, HEIGHT // 2)
-        
-        mass = ball_config['mass']
-        radius = ball_config['radius']
-        
-        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
-        body.position = center
-        
-        shape = pymunk.Circle(body, radius)
-        shape.elasticity = ball_config['elasticity']
-        shape.friction = ball_config['friction']
-        
-        self.space.add(body, shape)
-        self.ball = shape
-    
-    def spawn_new_ball(self):
-        # aaa spawneamos nueva bola para modo elimination -bynd
-        if self.balls_used >= self.max_balls:
-            return False
-        
-        ball_config = self.config['ball']
-        center = (WIDTH // 2, HEIGHT // 2)
-        
-        mass = ball_config['mass']
-        radius = ball_config['radius']
-        
-        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
-        body.position = center
-        
-        shape = pymunk.Circle(body, radius)
-        shape.elasticity = ball_config['elasticity']
-        shape.friction = ball_config['friction']
-        
-        self.space.add(body, shape)
-        
-        # vavavava guardamos la bola con su estado -bynd
-        ball_data = {
-            'shape': shape,
-            'body': body,
-            'alive': True,
-            'spawn_time': time.time()
-        }
-        
-        self.balls.append(ball_data)
-        self.current_ball = ball_data
-        self.ball_timer = time.time()
-        self.balls_used += 1
-        
-        print(f"⚪ Nueva bola spawneada ({self.balls_used}/{self.max_balls})")
-        return True
-    
-    def kill_current_ball(self):
-        # chintrolas matamos la bola actual -bynd
-        if not self.current_ball or not self.current_ball['alive']:
-            return
-        
-        # q chidoteee convertimos a estático -bynd
-        ball_data = self.current_ball
-        old_body = ball_data['body']
-        old_shape = ball_data['shape']
-        
-        # ala removemos el body dinámico -bynd
-        self.space.remove(old_body, old_shape)
-        
-        # fokeis creamos uno estático en la misma posición -bynd
-        static_body = pymunk.Body(body_type=pymunk.Body.STATIC)
-        static_body.position = old_body.position
-        
-        ball_config = self.config['ball']
-        static_shape = pymunk.Circle(static_body, ball_config['radius'])
-        static_shape.elasticity = ball_config['elasticity']
-        static_shape.friction = ball_config['friction']
-        
-        self.space.add(static_body, static_shape)
-        
-        # aaa actualizamos los datos -bynd
-        ball_data['alive'] = False
-        ball_data['body'] = static_body
-        ball_data['shape'] = static_shape
-        
-        print(f"💀 Bola eliminada en posición ({old_body.position.x:.0f}, {old_body.position.y:.0f})")
-        
-        # ey spawneamos nueva bola -bynd
-        self.spawn_new_ball()
-    
-    def check_escapes(self):
-        # fokeis checamos si la bola escapó de algún anillo -bynd
-        if self.game_over:
-            return
+    def setup_view(self):
+        # aaa todo lo q se dibuja sale del config; al recargar se rearma reusando fuentes y sprites -bynd
+        self.hud = HUD(self.config, self.text_cache)
+        self.text_cache = self.hud.text
+        self.full_redraw = True
+        self.last_playfield = None
+        self.last_ball_rects = []
+        
+        # ala sprites de anillos + capa de fondo con los estáticos -bynd
+        self.ring_renderer = RingRenderer((WIDTH, HEIGHT), tuple(self.config['colors']['background']),
+                                          tuple(self.config['colors']['rings']), self.sprite_cache)
+        self.sprite_cache = self.ring_renderer.cache
+        
+        # fokeis las bolas muertas no se mueven, van horneadas en su propia capa -bynd
+        self.graveyard = None
+        if self.game_mode == 'elimination':
+            self.graveyard = GraveyardLayer((WIDTH, HEIGHT), tuple(self.config['colors']['ball_dead']),
+                                            self.config['ball']['radius'])
         
-        if self.game_mode == '8ball':
-            # vavavava checamos ambas bolas -bynd
-            if self.ball_yes and self.ball_yes.body:
-                yes_pos = self.ball_yes.body.position
-                for ring in self.rings:
-                    if not ring.destroyed and ring.check_ball_escaped((yes_pos.x, yes_pos.y)):
-                        self.yes_score += 1
-                        ring.destroy()  # q chidoteee destruimos el anillo -bynd
-                        self.remove_ball(self.ball_yes)
-                        self.ball_yes = None
-                        print(f"💙 YES escapa por anillo R={ring.radius:.0f}! Puntos: {self.yes_score}")
-                        break
-            
-            if self.ball_no and self.ball_no.body:
-                no_pos = self.ball_no.body.position
-                for ring in self.rings:
-                    if not ring.destroyed and ring.check_ball_escaped((no_pos.x, no_pos.y)):
-                        self.no_score += 1
-                        ring.destroy()  # ala destruimos el anillo -bynd
-                        self.remove_ball(self.ball_no)
-                        self.ball_no = None
-                        print(f"🧡 NO escapa por anillo R={ring.radius:.0f}! Puntos: {self.no_score}")
-                        break
-            
-        elif self.game_mode == 'elimination':
-            if not self.current_ball or not self.current_ball['alive']:
-                return
-            ball_pos = self.current_ball['body'].position
-            
-            for ring in self.rings:
-                if ring.check_ball_escaped((ball_pos.x, ball_pos.y)):
-                    ring.destroy()
-        else:
-            if not self.ball:
-                return
-            ball_pos = self.ball.body.position
-            
-            for ring in self.rings:
-                if ring.check_ball_escaped((ball_pos.x, ball_pos.y)):
-                    ring.destroy()
-            
-            # vavavava checamos si ganó -bynd
-            all_destroyed = all(ring.destroyed for ring in self.rings)
-            if all_destroyed and not self.game_over:
-                self.won = True
-                self.game_over = True
-                print("🎉 ¡GANASTE! Escapaste de todos los anillos")
-                print("=" * 50)
+        # q chidoteee en swarm todas las bolas son el mismo sprite -bynd
+        self.swarm_sprite = None
+        if self.game_mode == 'swarm':
+            self.swarm_sprite = BallSprite(self.config['ball']['radius'], tuple(self.config['colors'].get('ball', [255, 255, 255])))
     
-    def check_timer(self):
-        # ey checamos el tiempo según el modo -bynd
-        if self.game_over:
+    def reload_level(self, config):
+        # vavavava recarga en caliente: misma ventana y mismo space, solo lo q cambió en el JSON -bynd
+        start = time.perf_counter()
+        if self.physics_hz:
+            config = dict(config, physics_hz=self.physics_hz)
+        changes = diff_levels(self.config, config)
+        if not has_changes(changes):
             return
         
-        if self.game_mode == '8ball':
-            # q chidoteee timer global para 8ball -bynd
-            elapsed = time.time() - self.start_time
-            remaining = self.config.get('timer', 60) - elapsed
-            
-            if remaining <= 0:
-                self.game_over = True
-                # chintrolas determinamos ganador -bynd
-                if self.yes_score > self.no_score:
-                    self.winner = "YES"
-                elif self.no_score > self.yes_score:
-                    self.winner = "NO"
-                else:
-                    self.winner = "TIE"
-                
-                print(f"⏰ TIEMPO TERMINADO")
-                print(f"🏆 Ganador: {self.winner}")
-                print(f"   YES: {self.yes_score} | NO: {self.no_score}")
-                print("=" * 50)
-            
-            # ala respawnear bolas si no están -bynd
-            time_since_spawn = time.time() - self.last_spawn_time
-            if time_since_spawn >= self.spawn_delay:
-                if not self.ball_yes or not self.ball_no:
-                    if not self.ball_yes:
-                        self.remove_ball(self.ball_yes)
-                    if not self.ball_no:
-                        self.remove_ball(self.ball_no)
-                    self.spawn_8ball_pair()
-                    self.last_spawn_time = time.time()
-        
-        elif self.game_mode == 'elimination':
-            # chintrolas timer por bola -bynd
-            if self.current_ball and self.current_ball['alive']:
-                elapsed = time.time() - self.ball_timer
-                if elapsed >= self.ball_lifetime:
-                    self.kill_current_ball()
-                    
-                    # q chidoteee checamos si perdió -bynd
-                    if self.balls_used >= self.max_balls:
-                        alive_rings = sum(1 for ring in self.rings if not ring.destroyed)
-                        if alive_rings > 0:
-                            self.game_over = True
-                            self.won = False
-                            print("💀 SE ACABARON LAS BOLAS")
-                            print("=" * 50)
+        if changes['restart']:
+            # chintrolas otro modo o el swarm ya soltado no se parchan, partido nuevo con el mismo bus -bynd
+            from simulation import PlinkoSimulation
+            self.sim = PlinkoSimulation(config, seed=self.sim.seed, events=self.events)
+            self.game_mode = self.sim.game_mode
         else:
-            # ala timer global para modo escape -bynd
-            if not self.start_time:
-                return
-            
-            elapsed = time.time() - self.start_time
-            remaining = self.config['timer'] - elapsed
-            
-            if remaining <= 0:
-                self.game_over = True
-                self.won = False
-                print("⏰ SE ACABÓ EL TIEMPO")
-                print("=" * 50)
-    
-    def get_remaining_time(self):
-        # chintrolas calculamos tiempo restante -bynd
-        if self.game_mode == '8ball':
-            if not self.start_time:
-                return self.config.get('timer', 60)
-            elapsed = time.time() - self.start_time
-            return max(0, self.config.get('timer', 60) - elapsed)
-        elif self.game_mode == 'elimination':
-            if not self.current_ball or not self.current_ball['alive']:
-                return 0
-            elapsed = time.time() - self.ball_timer
-            return max(0, self.ball_lifetime - elapsed)
+            self.sim.apply_config(config, changes)
+        self.config = config
+        
+        if changes['physics_hz']:
+            # ey otro paso fijo, el acumulador arranca de cero -bynd
+            self.timestep = FixedTimestep(config.get('physics_hz', FPS))
+        self.prev_positions = {}
+        self.prev_rotations = None
+        self.prev_swarm = None
+        
+        # q chidoteee la vista se rearma (barato, los sprites por geometría se quedan en cache) -bynd
+        self.setup_view()
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        parts = []
+        if changes['restart']:
+            parts.append("partido nuevo")
         else:
-            if not self.start_time:
-                return self.config.get('timer', 30)
-            elapsed = time.time() - self.start_time
-            return max(0, self.config.get('timer', 30) - elapsed)
+            if changes['rebuild_all']:
+                parts.append("todos los anillos")
+            elif changes['rings'] or changes['removed']:
+                parts.append(f"anillos {changes['rings'] + changes['removed']}")
+            if changes['ring_material']:
+                parts.append("material de anillos")
+            if changes['gravity']:
+                parts.append("gravedad")
+            if changes['ball']:
+                parts.append("bolas")
+        if changes['colors']:
+            parts.append("colores")
+        parts += changes['other']
+        print(f"🔁 Nivel recargado en {elapsed:.1f}ms: {', '.join(parts)}")
+        if changes['restart']:
+            self.print_level_info()
     
     def handle_events(self):
         # q chidoteee manejo de eventos -bynd
@@ -383,224 +171,202 @@ class PlinkoGame:
                     self.restart_level()
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_p:
+                    # fokeis prendemos/apagamos el overlay del profiler -bynd
+                    self.show_profile = not self.show_profile
+                    self.profile_overlay = None
+                    self.full_redraw = True
     
     def restart_level(self):
         # aaa reiniciamos el nivel -bynd
         print("\n🔄 Reiniciando nivel...")
-        self.__init__()
+        # ey misma ventana, mismo config ya parseado y mismos sprites, solo la simulación vuelve al inicio -bynd
+        self.sim.reset()
+        self.prev_positions = {}
+        self.prev_rotations = None
+        self.prev_swarm = None
+        self.full_redraw = True
+        self.last_playfield = None
+        self.last_ball_rects = []
+        self.print_level_info()
     
-    def update(self):
-        # vavavava actualizamos el juego -bynd
-        if not self.game_over:
-            dt = 1.0 / FPS
-            self.space.step(dt)
-            self.check_escapes()
-            self.check_timer()
+    def update(self, steps=None):
+        # vavavava pasos fijos de física, por defecto los de un frame de 1/FPS exacto -bynd
+        if steps is None:
+            steps = self.timestep.frame()
+        for i in range(steps):
+            if self.interpolate and i == steps - 1:
+                # chintrolas guardamos el estado antes del último paso para dibujar entre los dos -bynd
+                self.capture()
+            self.sim.step(None, self.profiler)
+    
+    def capture(self):
+        # q chidoteee posiciones de bolas y ángulos de anillos antes del paso -bynd
+        self.prev_positions = {body: (body.position.x, body.position.y) for body, _, _ in self.get_ball_bodies()}
+        self.prev_rotations = self.sim.rings.rotations()
+        self.prev_swarm = self.sim.positions.copy() if self.swarm_sprite else None
+    
+    def ball_position(self, body):
+        # ala posición interpolada entre el paso anterior y el actual (alpha 1 = la actual) -bynd
+        pos = body.position
+        prev = self.prev_positions.get(body) if self.alpha < 1.0 else None
+        if prev is None:
+            return pos
+        alpha = self.alpha
+        return (prev[0] + (pos.x - prev[0]) * alpha, prev[1] + (pos.y - prev[1]) * alpha)
+    
+    def ring_rotations(self):
+        # fokeis rotaciones interpoladas de todos los anillos, None si no hace falta -bynd
+        prev = self.prev_rotations
+        if self.alpha >= 1.0 or prev is None:
+            return None
+        return prev + (self.sim.rings.rotations() - prev) * self.alpha
+    
+    def swarm_positions(self):
+        # ey el swarm entero de un jalón con NumPy, si se salieron bolas dibujamos las actuales -bynd
+        positions = self.sim.positions
+        prev = self.prev_swarm
+        if self.alpha >= 1.0 or prev is None or prev.shape != positions.shape:
+            return positions
+        return prev + (positions - prev) * self.alpha
     
     def draw(self):
-        # ey dibujamos todo en pantalla -bynd
-        bg_color = tuple(self.config['colors']['background'])
-        self.screen.fill(bg_color)
-        
-        # chintrolas dibujamos los anillos de forma limpia -bynd
-        ring_color = tuple(self.config['colors']['rings'])
-        for ring in self.rings:
-            if not ring.destroyed:
-                for body, shape in ring.segments:
-                    # q chidoteee obtenemos posiciones en espacio mundial -bynd
-                    if ring.body:
-                        # ala para anillos que rotan -bynd
-                        pv1 = body.local_to_world(shape.a)
-                        pv2 = body.local_to_world(shape.b)
-                    else:
-                        # fokeis para anillos estáticos -bynd
-                        pv1 = shape.a + body.position
-                        pv2 = shape.b + body.position
-                    
-                    # vavavava dibujamos línea gruesa -bynd
-                    pygame.draw.line(self.screen, ring_color,
-                                   (int(pv1.x), int(pv1.y)),
-                                   (int(pv2.x), int(pv2.y)),
-                                   int(ring.thickness * 2))
-        
-        # aaa dibujamos las bolas según el modo -bynd
+        # ey dibujamos todo en pantalla, solo empujamos lo q cambió -bynd
+        sim = self.sim
+        
+        # chintrolas juntamos regiones sucias: HUD, zona de anillos y bolas -bynd
+        profiler = self.profiler
+        dirty = self.hud.update(sim)
+        playfield = self.get_playfield_rect()
+        ball_rects = self.get_ball_rects()
+        if self.swarm_sprite:
+            # ala con miles de bolas por toda la pantalla sale más barato repintar todo -bynd
+            self.full_redraw = True
+        if self.full_redraw:
+            dirty = [self.screen.get_rect()]
+            self.full_redraw = False
+        else:
+            dirty += [playfield] + ball_rects
+            if self.last_playfield:
+                dirty.append(self.last_playfield)
+            dirty += self.last_ball_rects
+        self.last_playfield = playfield
+        self.last_ball_rects = ball_rects
+        if self.graveyard:
+            dirty += self.graveyard.sync(sim.dead_balls)
+        overlay = self.get_profile_overlay()
+        if overlay:
+            dirty.append(overlay.get_rect())
+        
+        # q chidoteee lo quieto q toca algo sucio también se repinta completo -bynd
+        pending = self.hud.get_rects()
+        while pending:
+            touching = [rect for rect in pending if rect.collidelist(dirty) != -1]
+            dirty += touching
+            pending = [rect for rect in pending if rect.collidelist(touching) == -1] if touching else []
+        profiler.lap('draw_ui')
+        
+        # chintrolas el fondo ya trae los anillos estáticos horneados -bynd
+        background = self.ring_renderer.get_background(sim.rings)
+        for rect in dirty:
+            self.screen.blit(background, rect, rect)
+        
+        # q chidoteee los anillos q rotan van encima -bynd
+        self.ring_renderer.draw_rotating(self.screen, sim.rings, self.ring_rotations())
+        profiler.lap('rings')
+        
+        # aaa primero la capa de bolas muertas, luego las vivas q tocan algo sucio -bynd
+        if self.graveyard:
+            self.graveyard.draw(self.screen, dirty)
+        if self.swarm_sprite:
+            self.swarm_sprite.draw_many(self.screen, self.swarm_positions())
+        for pos, radius, color in self.get_balls():
+            if self.get_ball_rect(pos, radius).collidelist(dirty) != -1:
+                pygame.draw.circle(self.screen, color, (int(pos[0]), int(pos[1])), int(radius))
+        profiler.lap('balls')
+        
+        # chintrolas dibujamos el UI encima de lo q se ensució -bynd
+        self.hud.draw(self.screen, dirty)
+        if overlay:
+            self.screen.blit(overlay, (0, 0))
+        profiler.lap('draw_ui')
+        
+        if not self.headless:
+            pygame.display.update(dirty)
+        profiler.lap('flip')
+    
+    def get_profile_overlay(self):
+        # ala overlay con p50/p95/p99, se regenera cada 30 frames -bynd
+        if not self.show_profile:
+            return None
+        if self.profile_overlay is not None and self.profiler.frames % 30:
+            return self.profile_overlay
+        
+        rows = [('fase', 'p50', 'p95', 'p99')]
+        for phase, stats in self.profiler.summary()['phases_ms'].items():
+            rows.append((phase, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"))
+        
+        columns = (8, 120, 175, 230)
+        overlay = pygame.Surface((285, len(rows) * 16 + 8), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, row in enumerate(rows):
+            for x, value in zip(columns, row):
+                text = self.hud.text.render(value, 'tiny', (180, 255, 180))
+                overlay.blit(text, (x, 4 + i * 16))
+        self.profile_overlay = overlay
+        return overlay
+    
+    def get_balls(self):
+        # vavavava (posición, radio, color) de cada bola q se mueve, ya interpolada -bynd
+        return [(self.ball_position(body), radius, color) for body, radius, color in self.get_ball_bodies()]
+    
+    def get_ball_bodies(self):
+        # q chidoteee (body, radio, color) de cada bola q se mueve según el modo -bynd
+        sim = self.sim
+        colors = self.config['colors']
+        balls = []
         if self.game_mode == 'elimination':
-            # q chidoteee dibujamos bolas muertas y vivas -bynd
-            for ball_data in self.balls:
-                shape = ball_data['shape']
-                body = ball_data['body']
-                
-                if ball_data['alive']:
-                    color = tuple(self.config['colors']['ball_alive'])
-                else:
-                    color = tuple(self.config['colors']['ball_dead'])
-                
-                pos = body.position
-                radius = self.config['ball']['radius']
-                pygame.draw.circle(self.screen, color, (int(pos.x), int(pos.y)), int(radius))
-        
+            # q chidoteee solo la viva, las muertas van en la capa del cementerio -bynd
+            ball_data = sim.current_ball
+            if ball_data and ball_data['alive']:
+                balls.append((ball_data['body'], self.config['ball']['radius'], tuple(colors['ball_alive'])))
+        elif self.game_mode == 'swarm':
+            # chintrolas el swarm se dibuja aparte con su sprite -bynd
+            return balls
         elif self.game_mode == '8ball':
-            # ala dibujamos bola YES -bynd
-            if self.ball_yes and self.ball_yes.body:
-                yes_color = tuple(self.config['colors']['ball_yes'])
-                yes_pos = self.ball_yes.body.position
-                yes_radius = self.config['ball_yes']['radius']
-                pygame.draw.circle(self.screen, yes_color,
-                                 (int(yes_pos.x), int(yes_pos.y)), int(yes_radius))
-            
-            # fokeis dibujamos bola NO -bynd
-            if self.ball_no and self.ball_no.body:
-                no_color = tuple(self.config['colors']['ball_no'])
-                no_pos = self.ball_no.body.position
-                no_radius = self.config['ball_no']['radius']
-                pygame.draw.circle(self.screen, no_color,
-                                 (int(no_pos.x), int(no_pos.y)), int(no_radius))
+            # ala bola YES y bola NO -bynd
+            if sim.ball_yes and sim.ball_yes.body:
+                balls.append((sim.ball_yes.body, self.config['ball_yes']['radius'], tuple(colors['ball_yes'])))
+            if sim.ball_no and sim.ball_no.body:
+                balls.append((sim.ball_no.body, self.config['ball_no']['radius'], tuple(colors['ball_no'])))
         else:
             # vavavava modo escape -bynd
-            if self.ball and self.ball.body:
-                ball_color = tuple(self.config['colors'].get('ball', [255, 255, 255]))
-                ball_pos = self.ball.body.position
-                ball_radius = self.config['ball']['radius']
-                pygame.draw.circle(self.screen, ball_color,
-                                 (int(ball_pos.x), int(ball_pos.y)), int(ball_radius))
-        
-        # chintrolas dibujamos el UI -bynd
-        self.draw_ui()
-        
-        pygame.display.flip()
+            if sim.ball and sim.ball.body:
+                balls.append((sim.ball.body, self.config['ball']['radius'], tuple(colors.get('ball', [255, 255, 255]))))
+        return balls
     
-    def draw_ui(self):
-        # ala dibujamos el timer y mensajes -bynd
-        font_huge = pygame.font.Font(None, 100)  # chintrolas ajustado para 9:16 -bynd
-        font_big = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 42)
-        font_small = pygame.font.Font(None, 32)
-        font_tiny = pygame.font.Font(None, 20)
-        
-        if self.game_mode == '8ball':
-            # chintrolas dibujamos pregunta arriba -bynd
-            question = self.config.get('question', 'Magic 8 Ball')
-            question_color = tuple(self.config['colors']['question_text'])
-            
-            # q chidoteee dividimos pregunta en dos líneas si es muy larga -bynd
-            if len(question) > 30:
-                words = question.split()
-                mid = len(words) // 2
-                line1 = ' '.join(words[:mid])
-                line2 = ' '.join(words[mid:])
-                
-                question_text1 = font_tiny.render(line1, True, question_color)
-                question_text2 = font_tiny.render(line2, True, question_color)
-                
-                q1_width = question_text1.get_width()
-                q2_width = question_text2.get_width()
-                
-                self.screen.blit(question_text1, (WIDTH // 2 - q1_width // 2, 20))
-                self.screen.blit(question_text2, (WIDTH // 2 - q2_width // 2, 45))
-            else:
-                question_text = font_tiny.render(question, True, question_color)
-                question_width = question_text.get_width()
-                self.screen.blit(question_text, (WIDTH // 2 - question_width // 2, 30))
-            
-            if not self.game_over:
-                # q chidoteee contadores YES y NO -bynd
-                yes_color = tuple(self.config['colors']['yes_text'])
-                no_color = tuple(self.config['colors']['no_text'])
-                
-                yes_text = font_medium.render(f"Yes: {self.yes_score}", True, yes_color)
-                no_text = font_medium.render(f"No: {self.no_score}", True, no_color)
-                
-                # ala posiciones ajustadas para 9:16 -bynd
-                self.screen.blit(yes_text, (30, HEIGHT - 120))
-                self.screen.blit(no_text, (WIDTH - 130, HEIGHT - 120))
-                
-                # ala timer abajo en el centro -bynd
-                timer_color = tuple(self.config['colors']['timer_text'])
-                time_text = font_big.render(f"{self.get_remaining_time():.2f}", True, timer_color)
-                time_width = time_text.get_width()
-                self.screen.blit(time_text, (WIDTH // 2 - time_width // 2, HEIGHT - 70))
-            else:
-                # fokeis pantalla de ganador -bynd
-                winner_color = tuple(self.config['colors']['winner_text'])
-                
-                if self.winner == "YES":
-                    winner_text = font_huge.render("YES", True, tuple(self.config['colors']['yes_text']))
-                elif self.winner == "NO":
-                    winner_text = font_huge.render("NO", True, tuple(self.config['colors']['no_text']))
-                else:
-                    winner_text = font_huge.render("TIE", True, (200, 200, 200))
-                
-                winner_width = winner_text.get_width()
-                self.screen.blit(winner_text, (WIDTH // 2 - winner_width // 2, HEIGHT // 2 - 60))
-                
-                # aaa puntaje final -bynd
-                score_text = font_small.render(f"{self.yes_score} - {self.no_score}", True, (200, 200, 200))
-                score_width = score_text.get_width()
-                self.screen.blit(score_text, (WIDTH // 2 - score_width // 2, HEIGHT // 2 + 40))
-                
-                # vavavava mensaje de reinicio -bynd
-                restart_msg = "Presiona R para reiniciar | ESC para salir"
-                restart_text = font_tiny.render(restart_msg, True, (200, 200, 200))
-                restart_width = restart_text.get_width()
-                self.screen.blit(restart_text, (WIDTH // 2 - restart_width // 2, HEIGHT // 2 + 100))
-        
-        else:
-            # q chidoteee UI para otros modos -bynd
-            remaining = self.get_remaining_time()
-            if self.game_mode == 'elimination':
-                if remaining < 1:
-                    timer_color = tuple(self.config['colors'].get('timer_warning', [255, 100, 100]))
-                else:
-                    timer_color = tuple(self.config['colors']['timer_text'])
-            else:
-                timer_color = tuple(self.config['colors']['timer_text'])
-            
-            time_text = font_big.render(f"{remaining:.2f}", True, timer_color)
-            time_width = time_text.get_width()
-            self.screen.blit(time_text, (WIDTH // 2 - time_width // 2, HEIGHT - 70))
-            
-            # fokeis mensajes de estado -bynd
-            if self.game_over:
-                if self.won:
-                    msg = "¡GANASTE!"
-                    color = (100, 255, 100)
-                else:
-                    msg = "GAME OVER"
-                    color = (255, 100, 100)
-                
-                text = font_small.render(msg, True, color)
-                self.screen.blit(text, (WIDTH // 2 - 100, 50))
-                
-                restart_msg = "Presiona R para reiniciar | ESC para salir"
-                restart_text = font_tiny.render(restart_msg, True, (200, 200, 200))
-                self.screen.blit(restart_text, (WIDTH // 2 - 180, 90))
-            else:
-                msg = self.config.get('description', 'Escapa de todos los anillos!')
-                text = font_tiny.render(msg, True, (255, 255, 255))
-                text_width = text.get_width()
-                self.screen.blit(text, (WIDTH // 2 - text_width // 2, 20))
-                
-                # chintrolas contador según modo -bynd
-                if self.game_mode == 'elimination':
-                    balls_msg = f"Bolas: {self.balls_used}/{self.max_balls}"
-                    balls_text = font_tiny.render(balls_msg, True, (200, 200, 200))
-                    self.screen.blit(balls_text, (20, HEIGHT - 70))
-                    
-                    dead_balls = sum(1 for b in self.balls if not b['alive'])
-                    dead_msg = f"Bolas muertas: {dead_balls}"
-                    dead_text = font_tiny.render(dead_msg, True, (150, 150, 150))
-                    self.screen.blit(dead_text, (20, HEIGHT - 40))
-                
-                # q chidoteee anillos restantes -bynd
-                if self.game_mode != '8ball':
-                    remaining_rings = sum(1 for ring in self.rings if not ring.destroyed)
-                    rings_msg = f"Anillos: {remaining_rings}/{len(self.rings)}"
-                    rings_text = font_tiny.render(rings_msg, True, (200, 200, 200))
-                    
-                    if self.game_mode == 'elimination':
-                        self.screen.blit(rings_text, (WIDTH - 200, HEIGHT - 40))
-                    else:
-                        self.screen.blit(rings_text, (20, HEIGHT - 40))
+    def get_ball_rect(self, pos, radius):
+        # fokeis rect q cubre una bola -bynd
+        size = int(radius) * 2 + 4
+        return pygame.Rect(int(pos[0]) - size // 2, int(pos[1]) - size // 2, size, size)
+    
+    def get_ball_rects(self):
+        # ala rects de las bolas q se mueven (las muertas se quedan quietas) -bynd
+        rects = []
+        for pos, radius, color in self.get_balls():
+            rects.append(self.get_ball_rect(pos, radius))
+        return rects
+    
+    def get_playfield_rect(self):
+        # ey caja del anillo más grande q sigue vivo -bynd
+        rings = self.sim.rings
+        alive = rings.alive()
+        if not alive.any():
+            return pygame.Rect(WIDTH // 2, HEIGHT // 2, 0, 0)
+        extent = int((rings.radius[alive] + rings.thickness[alive]).max()) + 2
+        rect = pygame.Rect(0, 0, extent * 2, extent * 2)
+        rect.center = (WIDTH // 2, HEIGHT // 2)
+        return rect.clip(self.screen.get_rect())
     
     def print_level_info(self):
         # aaa mostramos info del nivel en consola -bynd
@@ -613,29 +379,77 @@ class PlinkoGame:
         if self.game_mode == '8ball':
             print(f"❓ Pregunta: {self.config.get('question', 'N/A')}")
             print(f"⏱️ Timer total: {self.config.get('timer', 60)}s")
-            print(f"🔄 Spawn delay: {self.spawn_delay}s")
+            print(f"🔄 Spawn delay: {self.sim.spawn_delay}s")
         elif self.game_mode == 'elimination':
-            print(f"⚪ Bolas máximas: {self.max_balls}")
-            print(f"⏱️ Timer por bola: {self.ball_lifetime}s")
+            print(f"⚪ Bolas máximas: {self.sim.max_balls}")
+            print(f"⏱️ Timer por bola: {self.sim.ball_lifetime}s")
+        elif self.game_mode == 'swarm':
+            print(f"⚪ Bolas: {len(self.sim.swarm)}/{self.sim.ball_count}")
+            print(f"⏱️ Timer: {self.config.get('timer', 30)}s")
         else:
             print(f"⏱️ Timer: {self.config.get('timer', 30)}s")
         
-        print(f"⭕ Anillos: {len(self.rings)}")
+        print(f"⭕ Anillos: {len(self.sim.rings)}")
         print(f"🌍 Gravedad: {self.config['gravity']}")
         print("-" * 60)
         print("💡 Controles:")
         print("   R - Reiniciar nivel")
         print("   ESC - Salir")
+        print("   P - Overlay del profiler")
         print("=" * 60 + "\n")
     
     def run(self):
-        # q chidoteee el loop principal -bynd
+        # q chidoteee el loop principal: acumulador de tiempo real, N pasos fijos y un render interpolado -bynd
+        # chintrolas en turbo cada frame es 1/FPS exacto de física (timestep.frame()), sin interpolar -bynd
+        self.interpolate = self.render and not self.turbo
+        self.timestep.reset()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            self.profiler.begin_frame()
+            if not self.headless:
+                self.handle_events()
+            if self.watcher:
+                config = self.watcher.poll()
+                if config:
+                    self.reload_level(config)
+            self.profiler.lap('events')
+            if self.turbo:
+                self.update()
+            else:
+                self.update(self.timestep.tick())
+                self.alpha = self.timestep.alpha if self.interpolate else 1.0
+            
+            # ala atrasados nos saltamos el dibujo, la física nunca se alenta -bynd
+            if self.render:
+                if self.turbo or self.timestep.should_draw():
+                    self.draw()
+                    if self.publisher:
+                        self.publisher.submit(self.screen)
+                        self.profiler.lap('publish')
+            elif self.sim.game_over:
+                self.running = False
+            if self.turbo:
+                self.clock.tick()
+            else:
+                self.clock.tick(FPS)
+            self.profiler.lap('wait')
+            self.profiler.end_frame()
+            self.frames += 1
+            if self.max_frames and self.frames >= self.max_frames:
+                self.running = False
         
+        if not self.render:
+            print(f"📊 {self.sim.get_result()}")
+        if self.timestep.frames_skipped or self.timestep.dropped:
+            print(f"⏭️ Frames saltados: {self.timestep.frames_skipped} | física perdida: {self.timestep.dropped:.2f}s")
+        
+        if self.profile_path:
+            self.profiler.write_json(self.profile_path)
+        if self.events:
+            # ey los sinks de archivo escriben lo q les quedó en el buffer -bynd
+            self.events.close()
+        if self.publisher:
+            print(f"📡 Frames publicados: {self.publisher.frames} | tirados: {self.publisher.dropped}")
+            self.publisher.close()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+from levels import LevelConfig
+
+# ey lo q define la geometría de un anillo, si cambia se reconstruye solo ese -bynd
+RING_KEYS = ('radius', 'gap_angle', 'gap_size', 'rotation_speed')
+BALL_KEYS = ('ball', 'ball_yes', 'ball_no')
+HANDLED_KEYS = ('rings', 'gravity', 'colors', 'physics_hz') + BALL_KEYS
+
+def ring_key(ring):
+    # chintrolas rotation_speed ausente es lo mismo q 0 -bynd
+    return tuple(ring.get(key, 0) for key in RING_KEYS)
+
+def diff_levels(old, new):
+    # aaa qué cambió entre el nivel corriendo y el del archivo -bynd
+    changes = {
+        'restart': False,
+        'rings': [],
+        'removed': [],
+        'rebuild_all': False,
+        'ring_material': False,
+        'gravity': old.get('gravity') != new.get('gravity'),
+        'ball': any(old.get(key) != new.get(key) for key in BALL_KEYS),
+        'colors': old.get('colors') != new.get('colors'),
+        'physics_hz': old.get('physics_hz') != new.get('physics_hz'),
+        'other': sorted(key for key in set(old) | set(new)
+                        if key not in HANDLED_KEYS and old.get(key) != new.get(key))
+    }
+
+    # vavavava otro modo o bolas del swarm ya soltadas: eso no se parcha, se arma de nuevo -bynd
+    mode = new.get('type', 'escape')
+    if mode != old.get('type', 'escape'):
+        changes['restart'] = True
+    elif mode == 'swarm' and (changes['ball'] or old.get('ball_count') != new.get('ball_count')):
+        changes['restart'] = True
+
+    old_rings, new_rings = old['rings'], new['rings']
+    if old_rings.get('thickness') != new_rings.get('thickness') or old.get('gap_sensors') != new.get('gap_sensors'):
+        changes['rebuild_all'] = True
+    if old_rings.get('elasticity') != new_rings.get('elasticity') or old_rings.get('friction') != new_rings.get('friction'):
+        changes['ring_material'] = True
+
+    # q chidoteee anillo por anillo, por posición en ring_configs -bynd
+    old_configs, new_configs = old_rings['ring_configs'], new_rings['ring_configs']
+    changes['rings'] = [index for index, ring in enumerate(new_configs)
+                        if index >= len(old_configs) or ring_key(ring) != ring_key(old_configs[index])]
+    changes['removed'] = list(range(len(new_configs), len(old_configs)))
+    return changes
+
+def has_changes(changes):
+    # ala algo de todo esto cambió -bynd
+    return any(changes[key] for key in changes)
+
+
+class LevelWatcher:
+    def __init__(self, path, interval=0.25):
+        # fokeis vigilamos mtime + tamaño, lo más barato; solo se parsea si cambió -bynd
+        self.path = path
+        self.interval = interval
+        self.last_check = 0.0
+        self.stat = self.file_stat()
+
+    def file_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def poll(self):
+        # ey regresa el nivel nuevo ya validado, o None si no cambió o quedó a medias -bynd
+        now = time.perf_counter()
+        if now - self.last_check < self.interval:
+            return None
+        self.last_check = now
+
+        stat = self.file_stat()
+        if stat is None or stat == self.stat:
+            return None
+        self.stat = stat
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                level = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            # chintrolas el editor a veces guarda en dos pasos, seguimos con el nivel q corre -bynd
+            print(f"⚠️ No se pudo recargar {self.path}: {e}")
+            return None
+        if not LevelConfig.validate_level(level):
+            print(f"⚠️ {self.path} tiene campos faltantes, seguimos con el nivel actual")
+            return None
+        return level
@@ -1,4 +1,7 @@
+import hashlib
 import json
+import os
+import re
 
 class LevelConfig:
     def __init__(self, config_file='level_config.json'):
@@ -37,7 +40,8 @@ class LevelConfig:
             print(f"⚠️ El nivel tiene campos faltantes")
             return self.get_default_level()
     
-    def validate_level(self, level):
+    @staticmethod
+    def validate_level(level):
         # q chidoteee validamos que el nivel tenga estructura correcta -bynd
         game_type = level.get('type', 'escape')
         
@@ -65,6 +69,10 @@ class LevelConfig:
             if 'ball_timer' not in level or 'max_balls' not in level:
                 print(f"   ❌ Faltan 'ball_timer' o 'max_balls' para modo elimination")
                 return False
+        elif game_type == 'swarm':
+            if 'ball' not in level or 'ball_count' not in level:
+                print(f"   ❌ Faltan 'ball' o 'ball_count' para modo swarm")
+                return False
         else:  # escape o cualquier otro
             if 'ball' not in level:
                 print(f"   ❌ Falta 'ball' para modo escape")
@@ -128,3 +136,151 @@ class LevelConfig:
         }
         
         return info
+
+
+# ey para sacar el modo sin parsear todo el archivo: strings y llaves/corchetes del principio -bynd
+TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+PEEK_BYTES = 4096
+
+def top_level_type(text):
+    # chintrolas solo cuenta el "type" del objeto de afuera, no uno de un bloque anidado q venga antes -bynd
+    tokens = TOKEN_PATTERN.findall(text)
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token in ('{', '['):
+            depth += 1
+        elif token in ('}', ']'):
+            depth -= 1
+        elif depth == 1 and token == '"type"' and tokens[i + 1:i + 2] == [':'] and tokens[i + 2:i + 3]:
+            value = tokens[i + 2]
+            return json.loads(value) if value.startswith('"') else None
+    return None
+
+class LevelCatalog:
+    def __init__(self, path='.'):
+        # aaa catálogo de niveles: una carpeta de .json o un bundle {"levels": {...}} -bynd
+        self.path = path
+        self.index = {}
+        self.file_stats = {}
+        self.cache = {}
+        self.bundles = {}
+        self.scan()
+    
+    def file_stat(self, path):
+        # chintrolas mtime + tamaño, lo más barato para saber si cambió -bynd
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    
+    def peek_type(self, path):
+        # vavavava leemos solo el principio del archivo para sacar el modo -bynd
+        # vavavava si el "type" de afuera no sale en el principio, parseamos el archivo completo -bynd
+        with open(path, 'rb') as f:
+            head = f.read(PEEK_BYTES + 1)
+        level_type = top_level_type(head[:PEEK_BYTES].decode('utf-8', errors='ignore'))
+        if level_type is not None or len(head) <= PEEK_BYTES:
+            return level_type
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                level = json.load(f)
+        except (ValueError, UnicodeDecodeError):
+            return None  # ala el error de verdad sale al cargarlo con get_level -bynd
+        return level.get('type') if isinstance(level, dict) else None
+    
+    def scan(self):
+        # q chidoteee indexamos por nombre y modo sin parsear cada nivel -bynd
+        if os.path.isfile(self.path):
+            self.scan_bundle(self.path)
+            return
+        
+        index = {}
+        for entry in sorted(os.scandir(self.path), key=lambda e: e.name):
+            if not entry.is_file() or not entry.name.endswith('.json'):
+                continue
+            name = entry.name[:-len('.json')]
+            stat = self.file_stat(entry.path)
+            old = self.index.get(name)
+            if old and self.file_stats.get(entry.path) == stat:
+                # ala no cambió, reusamos lo q ya sabíamos -bynd
+                index[name] = old
+                continue
+            self.file_stats[entry.path] = stat
+            index[name] = {'file': entry.path, 'type': self.peek_type(entry.path), 'bundle': False}
+        self.index = index
+    
+    def scan_bundle(self, path):
+        # fokeis un bundle sí hay q parsearlo una vez para ver sus niveles -bynd
+        bundle = self.load_bundle(path)
+        self.index = {
+            name: {'file': path, 'type': level.get('type', 'escape'), 'bundle': True}
+            for name, level in bundle.items()
+        }
+    
+    def load_bundle(self, path):
+        # ey bundle parseado en cache por mtime/hash -bynd
+        stat = self.file_stat(path)
+        cached = self.bundles.get(path)
+        if cached and cached[0] == stat:
+            return cached[2]
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if cached and cached[1] == digest:
+            self.bundles[path] = (stat, digest, cached[2])
+            return cached[2]
+        levels = json.loads(raw.decode('utf-8')).get('levels', {})
+        self.bundles[path] = (stat, digest, levels)
+        return levels
+    
+    def list_available_levels(self, mode=None):
+        # vavavava nombres de niveles, opcional filtrados por modo -bynd
+        return [name for name, entry in self.index.items()
+                if mode is None or (entry['type'] or 'escape') == mode]
+    
+    def get_level(self, level_name):
+        # aaa parseamos y validamos solo el nivel q se pide, con cache -bynd
+        entry = self.index.get(level_name)
+        if entry is None:
+            raise KeyError(f"No existe el nivel '{level_name}' en {self.path}")
+        
+        path = entry['file']
+        stat = self.file_stat(path)
+        cached = self.cache.get(level_name)
+        if cached and cached[0] == stat:
+            return cached[2]
+        
+        if entry['bundle']:
+            level = self.load_bundle(path).get(level_name)
+            digest = self.bundles[path][1]
+            if cached and cached[1] == digest:
+                self.cache[level_name] = (stat, digest, cached[2])
+                return cached[2]
+        else:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            if cached and cached[1] == digest:
+                # chintrolas solo cambió el mtime, el contenido es el mismo -bynd
+                self.cache[level_name] = (stat, digest, cached[2])
+                return cached[2]
+            try:
+                level = json.loads(raw.decode('utf-8'))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Error al parsear {path}: {e}")
+        
+        if not isinstance(level, dict) or not LevelConfig.validate_level(level):
+            raise ValueError(f"El nivel '{level_name}' tiene campos faltantes")
+        
+        # q chidoteee ya parseado, actualizamos el modo del índice -bynd
+        entry['type'] = level.get('type', 'escape')
+        self.cache[level_name] = (stat, digest, level)
+        return level
+    
+    def get_level_info(self, level_name):
+        # fokeis info resumida de un nivel del catálogo -bynd
+        level = self.get_level(level_name)
+        return {
+            'type': level.get('type', 'unknown'),
+            'description': level.get('description', 'Sin descripción'),
+            'rings_no': level.get('rings_no', len(level.get('rings', {}).get('ring_configs', []))),
+            'timer': level.get('timer', 0)
+        }
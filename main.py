@@ -1,14 +1,66 @@
-from game import PlinkoGame
+import argparse
+from levels import LevelConfig, LevelCatalog
+from events import EventBus, ConsoleSink, JsonlSink
 
 def main():
+    # ey argumentos opcionales, por defecto todo igual q antes -bynd
+    parser = argparse.ArgumentParser(description="Plinko")
+    parser.add_argument('config', nargs='?', default='level_config.json', help="archivo JSON del nivel")
+    parser.add_argument('--levels', default=None, help="carpeta o bundle de niveles para usar con --level")
+    parser.add_argument('--level', default=None, help="nombre del nivel dentro del catálogo")
+    parser.add_argument('--list', action='store_true', help="lista los niveles del catálogo y sale")
+    parser.add_argument('--turbo', action='store_true', help="corre la simulación sin esperar al reloj real")
+    parser.add_argument('--profile', default=None, help="al salir guarda el resumen del profiler en este JSON")
+    parser.add_argument('--events', default=None, help="además de la consola, guarda los eventos en este JSONL")
+    parser.add_argument('--physics-hz', type=int, default=None, help="pasos de física por segundo (ej. 240), por defecto el del JSON o 60")
+    parser.add_argument('--watch', action='store_true', help="recarga el JSON en caliente cada q se guarda")
+    parser.add_argument('--publish', default=None, help="publica cada frame en esta memoria compartida (ver shmframes.py)")
+    parser.add_argument('--frames', type=int, default=None, help="sale después de N frames (ej. para medir el arranque)")
+    parser.add_argument('--no-render', action='store_true', help="solo física, sin ventana ni dibujo")
+    args = parser.parse_args()
+    
+    # chintrolas si hay catálogo, el nivel sale de ahí -bynd
+    config = None
+    source = args.config
+    if args.levels or args.level or args.list:
+        try:
+            catalog = LevelCatalog(args.levels or '.')
+        except OSError as e:
+            parser.error(f"No se pudo leer el catálogo: {e}")
+        if args.list:
+            for name in catalog.list_available_levels():
+                print(f"{name} ({catalog.index[name]['type'] or 'escape'})")
+            return
+        if not args.level:
+            parser.error("--levels necesita --level NOMBRE")
+        try:
+            config = catalog.get_level(args.level)
+        except (KeyError, ValueError) as e:
+            # ey nivel q no existe o q no pasa la validación: mensaje y no traceback -bynd
+            parser.error(e.args[0])
+        source = f"{catalog.path} ({args.level})"
+        if args.watch:
+            parser.error("--watch vigila un archivo de nivel, no un catálogo")
+    
+    if args.publish and args.no_render:
+        parser.error("--publish necesita dibujar, no va con --no-render")
+    
     # aaa mostramos el banner y arrancamos -bynd
     print("🎮 PLINKO - ESCAPE MODE")
     print("=" * 50)
-    print("Cargando nivel desde level_config.json...")
+    print(f"Cargando nivel desde {source}...")
     print()
+    if config is None:
+        config = LevelConfig(args.config).get_level()
     
-    # vavavava creamos y corremos el juego -bynd
-    game = PlinkoGame()
+    # vavavava pygame se importa hasta aquí: --list y el nivel ya validado salen sin cargarlo -bynd
+    from game import PlinkoGame
+    events = None
+    if args.events:
+        events = EventBus([ConsoleSink(), JsonlSink(args.events)])
+    game = PlinkoGame(args.config, turbo=args.turbo, headless=args.no_render, config=config, profile_path=args.profile,
+                      events=events, physics_hz=args.physics_hz, render=not args.no_render, watch=args.watch,
+                      publish=args.publish, max_frames=args.frames)
     game.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from levels import LevelConfig
+from simulation import PlinkoSimulation
+from events import EventBus
+
+# ey config compartida por cada worker, se manda una sola vez -bynd
+_worker_config = None
+
+def init_worker(config):
+    # aaa cada proceso guarda la config ya parseada (tuner.py usa el mismo arranque) -bynd
+    global _worker_config
+    _worker_config = config
+
+def worker_config():
+    return _worker_config
+
+def run_match(config, seed, max_time=None):
+    # vavavava corremos un partido 8ball sin pantalla y medimos cuánto tarda -bynd
+    # chintrolas bus sin sinks: los eventos ni se arman, devnull solo calla los avisos al construir -bynd
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PlinkoSimulation(config, seed=seed, events=EventBus())
+        result = sim.run(max_time=max_time)
+    result['runtime'] = time.perf_counter() - start
+    return result
+
+def _run_job(job):
+    # chintrolas wrapper para el pool, usa la config del worker -bynd
+    seed, max_time = job
+    return run_match(_worker_config, seed, max_time)
+
+def run_batch(config, matches, workers=None, base_seed=0, max_time=None):
+    # q chidoteee corremos N partidos en paralelo y vamos soltando resultados -bynd
+    if config.get('type', 'escape') != '8ball':
+        raise ValueError(f"El nivel es tipo '{config.get('type')}', se necesita '8ball'")
+
+    workers = workers or os.cpu_count() or 1
+    jobs = [(base_seed + i, max_time) for i in range(matches)]
+
+    # ala un proceso por core, chunksize 1 para q nadie se quede esperando -bynd
+    with multiprocessing.Pool(workers, initializer=init_worker, initargs=(config,)) as pool:
+        for result in pool.imap_unordered(_run_job, jobs, chunksize=1):
+            yield result
+
+def summarize(results):
+    # fokeis juntamos todo en tasas e histogramas -bynd
+    total = len(results)
+    winners = Counter(r['winner'] for r in results)
+    runtimes = sorted(r['runtime'] for r in results)
+
+    summary = {
+        'matches': total,
+        'win_rates': {w: (winners[w] / total if total else 0.0) for w in ('YES', 'NO', 'TIE')},
+        'yes_score_histogram': dict(sorted(Counter(r['yes_score'] for r in results).items())),
+        'no_score_histogram': dict(sorted(Counter(r['no_score'] for r in results).items())),
+        'runtime': {
+            'mean': sum(runtimes) / total if total else 0.0,
+            'min': runtimes[0] if total else 0.0,
+            'max': runtimes[-1] if total else 0.0
+        }
+    }
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo de partidos 8ball")
+    parser.add_argument('config', nargs='?', default='level_config.json', help="archivo JSON del nivel")
+    parser.add_argument('-n', '--matches', type=int, default=100, help="número de partidos")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="procesos (por defecto uno por core)")
+    parser.add_argument('--seed', type=int, default=0, help="seed del primer partido")
+    parser.add_argument('--max-time', type=float, default=None, help="tiempo simulado máximo por partido")
+    parser.add_argument('--json', default=None, help="guarda resultados y resumen en este archivo")
+    args = parser.parse_args()
+
+    config = LevelConfig(args.config).get_level()
+
+    # aaa vamos reportando conforme terminan los workers -bynd
+    results = []
+    winners = Counter()
+    start = time.perf_counter()
+    try:
+        for result in run_batch(config, args.matches, args.workers, args.seed, args.max_time):
+            results.append(result)
+            winners[result['winner']] += 1
+            done = len(results)
+            print(f"[{done}/{args.matches}] seed={result['seed']} {result['winner']} "
+                  f"{result['yes_score']}-{result['no_score']} ({result['runtime']:.2f}s) | "
+                  f"YES {winners['YES'] / done:.1%} NO {winners['NO'] / done:.1%} TIE {winners['TIE'] / done:.1%}")
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    summary['wall_time'] = elapsed
+    print("=" * 50)
+    print(f"🎱 {summary['matches']} partidos en {elapsed:.1f}s")
+    for winner, rate in summary['win_rates'].items():
+        print(f"   {winner}: {rate:.1%}")
+    print(f"   YES puntos: {summary['yes_score_histogram']}")
+    print(f"   NO puntos: {summary['no_score_histogram']}")
+    print(f"   Runtime por partido: {summary['runtime']['mean']:.2f}s promedio")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'results': results}, f, indent=2)
+        print(f"✅ Resultados guardados en {args.json}")
+
+if __name__ == "__main__":
+    main()
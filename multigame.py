@@ -0,0 +1,211 @@
+import argparse
+import contextlib
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from constants import WIDTH, HEIGHT, FPS
+import pygame
+from game import PlinkoGame
+from levels import LevelConfig
+from simulation import PlinkoSimulation
+from events import EventBus
+from ui import TextCache
+from sprites import RingSpriteCache
+from profiler import FrameProfiler
+from export import FrameExporter, PNGSequenceSink, RawRGBSink, PipeSink, ffmpeg_command
+from shmframes import FramePublisher
+
+def grid_shape(count, cols=None):
+    # ey columnas x filas, por defecto lo más cuadrado posible (9 -> 3x3) -bynd
+    cols = cols or math.ceil(math.sqrt(count))
+    return cols, math.ceil(count / cols)
+
+def step_tile(game):
+    # vavavava un frame de física de un tile; chipmunk suelta el GIL dentro de space.step -bynd
+    if not game.sim.game_over:
+        game.update()
+
+
+class MultiGame:
+    def __init__(self, configs, seeds=None, cols=None, scale=None, workers=None, headless=True):
+        # aaa K partidos independientes, cada uno con su space, dibujados en tiles de una sola superficie -bynd
+        pygame.font.init()
+        self.cols, self.rows = grid_shape(len(configs), cols)
+        # chintrolas por defecto el mosaico completo mide lo mismo q una pantalla -bynd
+        self.scale = scale or 1.0 / max(self.cols, self.rows)
+        self.tile_size = (int(WIDTH * self.scale), int(HEIGHT * self.scale))
+        size = (self.tile_size[0] * self.cols, self.tile_size[1] * self.rows)
+
+        self.headless = headless
+        if headless:
+            self.surface = pygame.Surface(size)
+        else:
+            pygame.display.init()
+            self.surface = pygame.display.set_mode(size)
+            pygame.display.set_caption(f"Plinko x{len(configs)}")
+        self.surface.fill((0, 0, 0))
+
+        # q chidoteee fuentes, textos y sprites de anillos se comparten entre todos los tiles -bynd
+        # chintrolas y también el lienzo: SDL re-codifica el RLE de un sprite cada vez q cambia de destino, -bynd
+        # vavavava con un lienzo por juego cada blit costaba ~1ms; con uno solo el frame de 9 tiles baja de 157 a 26ms -bynd
+        self.text_cache = TextCache()
+        self.sprite_cache = RingSpriteCache()
+        self.canvas = pygame.Surface((WIDTH, HEIGHT))
+        seeds = seeds or [None] * len(configs)
+        self.games = []
+        self.tiles = []
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for i, (config, seed) in enumerate(zip(configs, seeds)):
+                sim = PlinkoSimulation(config, seed=seed, events=EventBus())
+                game = PlinkoGame(config=config, sim=sim, turbo=True, headless=True,
+                                  text_cache=self.text_cache, sprite_cache=self.sprite_cache)
+                game.screen = self.canvas
+                rect = pygame.Rect((i % self.cols) * self.tile_size[0], (i // self.cols) * self.tile_size[1], *self.tile_size)
+                self.games.append(game)
+                self.tiles.append(self.surface.subsurface(rect))
+
+        # fokeis un hilo por partido hasta los cores q haya -bynd
+        self.workers = workers or min(len(self.games), os.cpu_count() or 1)
+        self.pool = ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+        self.profiler = FrameProfiler()
+        self.frames = 0
+
+    @property
+    def game_over(self):
+        return all(game.sim.game_over for game in self.games)
+
+    def update(self):
+        # ey la física de todos los tiles en paralelo, el dibujo se queda en el hilo principal -bynd
+        if self.pool:
+            list(self.pool.map(step_tile, self.games))
+        else:
+            for game in self.games:
+                step_tile(game)
+
+    def draw(self):
+        # chintrolas cada juego repinta completo el lienzo compartido y se copia (o escala) a su tile -bynd
+        for game, tile in zip(self.games, self.tiles):
+            game.full_redraw = True
+            game.draw()
+            if self.scale == 1:
+                tile.blit(self.canvas, (0, 0))
+            else:
+                pygame.transform.smoothscale(self.canvas, self.tile_size, tile)
+        self.profiler.lap('draw')
+        if not self.headless:
+            pygame.display.flip()
+            self.profiler.lap('flip')
+
+    def frame(self):
+        # vavavava un frame completo: física en el pool + dibujo -bynd
+        self.profiler.begin_frame()
+        self.update()
+        self.profiler.lap('physics')
+        self.draw()
+
+    def run(self, exporter=None, seconds=None, tail=2.0):
+        # q chidoteee corre hasta q todos terminen (o seconds), con unos frames de la pantalla final -bynd
+        clock = pygame.time.Clock()
+        max_frames = int(seconds * FPS) if seconds else None
+        tail_frames = int(tail * FPS)
+        start = time.perf_counter()
+        running = True
+        try:
+            while running and (max_frames is None or self.frames < max_frames):
+                if not self.headless:
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                            running = False
+                self.frame()
+                if exporter:
+                    # ey FramePublisher copia la superficie directo a memoria compartida -bynd
+                    zero_copy = getattr(exporter, 'zero_copy', False)
+                    exporter.submit(self.surface if zero_copy else pygame.image.tobytes(self.surface, 'RGB'))
+                    self.profiler.lap('export')
+                self.profiler.end_frame()
+                self.frames += 1
+
+                if self.game_over:
+                    if tail_frames <= 0:
+                        break
+                    tail_frames -= 1
+                if not self.headless and not exporter:
+                    clock.tick(FPS)
+        finally:
+            if exporter:
+                exporter.close()
+            self.close()
+        return self.frames, time.perf_counter() - start
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+
+def load_configs(paths, count=None, questions=None):
+    # aaa un config por tile: los archivos se repiten hasta llenar count; las preguntas se asignan en orden -bynd
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        levels = [LevelConfig(path).get_level() for path in paths]
+    count = count or max(len(levels), len(questions or []))
+    configs = [dict(levels[i % len(levels)]) for i in range(count)]
+    for config, question in zip(configs, questions or []):
+        config['question'] = question
+    return configs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Varios partidos a la vez en un mosaico")
+    parser.add_argument('configs', nargs='*', default=['level_config.json'], help="archivos JSON de nivel (se repiten)")
+    parser.add_argument('-n', '--count', type=int, default=None, help="número de tiles (por defecto uno por archivo o pregunta)")
+    parser.add_argument('--questions', default=None, help="archivo de texto con una pregunta 8ball por línea")
+    parser.add_argument('--seed', type=int, default=None, help="seed del primer tile, los demás seed+1, seed+2...")
+    parser.add_argument('--cols', type=int, default=None, help="columnas del mosaico")
+    parser.add_argument('--scale', type=float, default=None, help="escala de cada tile (por defecto el mosaico mide una pantalla)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="hilos de física (por defecto uno por core)")
+    parser.add_argument('--format', choices=['png', 'raw', 'ffmpeg', 'shm'], default=None, help="exporta en vez de abrir ventana")
+    parser.add_argument('--out', default='frames', help="carpeta (png), archivo (raw/ffmpeg) o nombre de la memoria compartida (shm)")
+    parser.add_argument('--seconds', type=float, default=None, help="segundos máximos")
+    parser.add_argument('--tail', type=float, default=2.0, help="segundos extra de la pantalla final")
+    parser.add_argument('--profile', default=None, help="guarda el resumen del profiler en este JSON")
+    args = parser.parse_args()
+
+    questions = None
+    if args.questions:
+        with open(args.questions, 'r', encoding='utf-8') as f:
+            questions = [line.strip() for line in f if line.strip()]
+    configs = load_configs(args.configs, args.count, questions)
+    seeds = [args.seed + i for i in range(len(configs))] if args.seed is not None else None
+
+    host = MultiGame(configs, seeds, args.cols, args.scale, args.workers, headless=args.format is not None)
+    print(f"🧩 {len(configs)} partidos en {host.cols}x{host.rows}, tiles de {host.tile_size[0]}x{host.tile_size[1]}, "
+          f"{host.workers} hilos de física")
+
+    exporter = None
+    if args.format:
+        size = host.surface.get_size()
+        if args.format == 'shm':
+            exporter = FramePublisher(host.surface, args.out)
+            print(f"📡 Esperando lector en {exporter.name} (python shmframes.py {exporter.name})...")
+            exporter.wait_readers()
+        else:
+            if args.format == 'png':
+                sink = PNGSequenceSink(args.out, size)
+            elif args.format == 'raw':
+                sink = RawRGBSink(args.out)
+            else:
+                sink = PipeSink(ffmpeg_command(args.out, size))
+            exporter = FrameExporter(sink)
+
+    frames, elapsed = host.run(exporter, args.seconds, args.tail)
+    steps = sum(game.sim.clock.steps for game in host.games)
+    print(f"🎬 {frames} frames en {elapsed:.1f}s ({frames / elapsed:.1f} FPS, {steps / elapsed:.0f} pasos de física/s)")
+    for i, game in enumerate(host.games):
+        print(f"   [{i}] {game.sim.get_result()}")
+    if args.profile:
+        host.profiler.write_json(args.profile)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import json
+import time
+from array import array
+
+# ey fases en el orden en q pasan dentro de un frame -bynd
+PHASES = ['events', 'space.step', 'check_escapes', 'check_timer', 'draw_ui', 'rings', 'balls', 'flip', 'export', 'wait']
+
+class PhaseBuffer:
+    def __init__(self, size):
+        # aaa ring buffer de tamaño fijo, no crece nunca -bynd
+        self.samples = array('d', bytes(8 * size))
+        self.size = size
+        self.pos = 0
+        self.count = 0
+
+    def push(self, value):
+        self.samples[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def values(self):
+        # vavavava solo las muestras q ya se llenaron -bynd
+        if self.count < self.size:
+            return self.samples[:self.count]
+        return self.samples
+
+
+class FrameProfiler:
+    def __init__(self, size=600, enabled=True):
+        # chintrolas 600 frames = 10 segundos a 60 FPS -bynd
+        self.size = size
+        self.enabled = enabled
+        self.buffers = {}
+        self.current = {}
+        self.last = 0.0
+        self.frame_start = 0.0
+        self.frames = 0
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current.clear()
+        self.frame_start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        # q chidoteee tiempo desde la última marca, se acumula por fase -bynd
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last)
+        self.last = now
+
+    def end_frame(self):
+        # ala pasamos los totales del frame a los buffers -bynd
+        if not self.enabled:
+            return
+        self.current['frame'] = time.perf_counter() - self.frame_start
+        for phase, value in self.current.items():
+            buffer = self.buffers.get(phase)
+            if buffer is None:
+                buffer = self.buffers[phase] = PhaseBuffer(self.size)
+            buffer.push(value)
+        self.frames += 1
+
+    def percentiles(self, phase):
+        # fokeis p50/p95/p99 en milisegundos de la ventana actual -bynd
+        buffer = self.buffers.get(phase)
+        if buffer is None or buffer.count == 0:
+            return None
+        values = sorted(buffer.values())
+        last = len(values) - 1
+        return {
+            'p50': values[int(last * 0.50)] * 1000,
+            'p95': values[int(last * 0.95)] * 1000,
+            'p99': values[int(last * 0.99)] * 1000
+        }
+
+    def summary(self):
+        # ey resumen por fase, en orden -bynd
+        order = [phase for phase in PHASES if phase in self.buffers]
+        order += sorted(phase for phase in self.buffers if phase not in PHASES)
+        return {
+            'frames': self.frames,
+            'window': self.size,
+            'phases_ms': {phase: self.percentiles(phase) for phase in order}
+        }
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        print(f"📊 Perfil guardado en {path}")
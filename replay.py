@@ -0,0 +1,472 @@
+import argparse
+import bisect
+import json
+import struct
+import zlib
+from collections import namedtuple
+import numpy as np
+from constants import WIDTH, HEIGHT, FPS
+from ringset import RingRow, RingSet
+
+# ey formato: header JSON, bloques zlib de K pasos, trailer JSON con eventos, índice y footer -bynd
+MAGIC = b'PLRP'
+VERSION = 2
+KEYFRAME_INTERVAL = 60  # chintrolas un keyframe por segundo a 60 FPS -bynd
+INT_FIELDS = 5  # vavavava bolas, yes_score, no_score, balls_used, status -bynd
+FOOTER = struct.Struct('<QQ')  # q chidoteee offset del índice y cuántos bloques hay -bynd
+
+# aaa bits del status de cada paso -bynd
+GAME_OVER = 1
+WON = 2
+HAS_YES = 4
+HAS_NO = 8
+WINNER_SHIFT = 4
+WINNERS = [None, 'YES', 'NO', 'TIE']
+
+Point = namedtuple('Point', 'x y')
+
+
+def snapshot(sim):
+    # fokeis (enteros, posiciones, tiempo restante) de un paso según el modo -bynd
+    status = (GAME_OVER if sim.game_over else 0) | (WON if sim.won else 0)
+    yes_score = no_score = balls_used = 0
+    positions = []
+    if sim.game_mode == '8ball':
+        for ball, flag in ((sim.ball_yes, HAS_YES), (sim.ball_no, HAS_NO)):
+            if ball and ball.body:
+                status |= flag
+                positions.append(tuple(ball.body.position))
+        yes_score, no_score = sim.yes_score, sim.no_score
+        status |= WINNERS.index(sim.winner) << WINNER_SHIFT
+    elif sim.game_mode == 'elimination':
+        if sim.current_ball and sim.current_ball['alive']:
+            positions.append(tuple(sim.current_ball['body'].position))
+        balls_used = sim.balls_used
+    elif sim.game_mode == 'swarm':
+        positions = sim.positions
+    elif sim.ball and sim.ball.body:
+        positions.append(tuple(sim.ball.body.position))
+
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    ints = [len(positions), yes_score, no_score, balls_used, status]
+    return ints, positions, sim.get_remaining_time()
+
+
+class ReplayRecorder:
+    def __init__(self, sim, path, dt=1.0 / FPS, keyframe_interval=KEYFRAME_INTERVAL):
+        # aaa grabamos cada paso de una simulación a un archivo compacto -bynd
+        self.sim = sim
+        self.file = open(path, 'wb')
+        self.keyframe_interval = keyframe_interval
+        self.ints = []
+        self.floats = []
+        self.offsets = []
+        self.steps = 0
+        self.events = []
+        self.destroyed = [ring.destroyed for ring in sim.rings]
+        self.dead_count = 0
+        self.spawned = 0
+
+        # vavavava todo lo q no cambia va una sola vez en el header -bynd
+        header = {
+            'version': VERSION,
+            'mode': sim.game_mode,
+            'seed': sim.seed,
+            'dt': dt,
+            'keyframe_interval': keyframe_interval,
+            'config': sim.config,
+            'rings': [{
+                'center': list(ring.center),
+                'radius': ring.radius,
+                'gap_angle': ring.gap_angle,
+                'gap_size': ring.gap_size,
+                'thickness': ring.thickness,
+                'rotation_speed': ring.rotation_speed
+            } for ring in sim.rings]
+        }
+        data = json.dumps(header).encode('utf-8')
+        self.file.write(MAGIC + struct.pack('<I', len(data)) + data)
+
+        # chintrolas el paso 0 es el estado recién creado -bynd
+        self.record()
+
+    def record(self):
+        # q chidoteee llamar después de cada sim.step() -bynd
+        sim = self.sim
+        ints, positions, remaining = snapshot(sim)
+        # ey los ángulos no se graban, la rotación sale del tiempo al reproducir -bynd
+        floats = np.concatenate(([remaining], positions.ravel())).astype(np.float32)
+        self.ints.append(ints)
+        self.floats.append(floats)
+
+        # ala eventos discretos: anillos destruidos, bolas muertas y spawns -bynd
+        step = self.steps
+        for index, ring in enumerate(sim.rings):
+            if ring.destroyed and not self.destroyed[index]:
+                self.destroyed[index] = True
+                self.events.append([step, 'ring_destroyed', index])
+        if sim.game_mode == 'elimination':
+            for x, y in sim.dead_balls[self.dead_count:]:
+                self.events.append([step, 'ball_killed', x, y])
+            self.dead_count = len(sim.dead_balls)
+            if sim.balls_used > self.spawned:
+                self.events.append([step, 'ball_spawned', sim.balls_used])
+                self.spawned = sim.balls_used
+
+        self.steps += 1
+        if len(self.ints) == self.keyframe_interval:
+            self.flush()
+
+    def flush(self):
+        # fokeis un bloque: el primer paso completo y los demás como deltas -bynd
+        if not self.ints:
+            return
+        ints = np.array(self.ints, dtype=np.int32)
+        ints[1:] = np.diff(ints, axis=0)
+        parts = [ints.tobytes()]
+        previous = None
+        for floats in self.floats:
+            bits = floats.view(np.uint32)
+            if previous is not None and len(previous) == len(bits):
+                # ey delta de los bits del float32, sin pérdida y casi puros ceros para zlib -bynd
+                parts.append((bits - previous).tobytes())
+            else:
+                parts.append(bits.tobytes())
+            previous = bits
+
+        self.offsets.append(self.file.tell())
+        self.file.write(zlib.compress(b''.join(parts), 6))
+        self.ints = []
+        self.floats = []
+
+    def close(self):
+        # chintrolas trailer con eventos, índice de bloques y footer al final -bynd
+        self.flush()
+        trailer = json.dumps({'steps': self.steps, 'events': self.events}).encode('utf-8')
+        self.offsets.append(self.file.tell())
+        self.file.write(trailer)
+        index_offset = self.file.tell()
+        self.file.write(np.array(self.offsets, dtype=np.uint64).tobytes())
+        self.file.write(FOOTER.pack(index_offset, len(self.offsets) - 1))
+        self.file.close()
+
+
+class RingView(RingRow):
+    def __init__(self, center, radius, gap_angle, gap_size, thickness, rotation_speed):
+        # aaa lo q el render lee de un Ring, sin body ni space; la rotación sale del tiempo del RingSet -bynd
+        self.center = tuple(center)
+        self.radius = radius
+        self.gap_angle = gap_angle
+        self.gap_size = gap_size
+        self.thickness = thickness
+        self.rotation_speed = rotation_speed
+
+
+class BallView:
+    def __init__(self, x, y):
+        # ey el render lee shape.body.position.x/.y -bynd
+        self.body = self
+        self.position = Point(x, y)
+
+
+class ReplaySim:
+    def __init__(self, header):
+        # q chidoteee misma cara q PlinkoSimulation para PlinkoGame.draw, nada de pymunk -bynd
+        config = header['config']
+        self.config = config
+        self.seed = header['seed']
+        self.game_mode = header['mode']
+        self.rings = RingSet(RingView(**ring) for ring in header['rings'])
+        self.rings_alive = len(self.rings)
+        self.game_over = False
+        self.won = False
+        self.remaining = 0.0
+
+        # chintrolas lo q el HUD y print_level_info leen de cada modo -bynd
+        self.ball = self.ball_yes = self.ball_no = self.current_ball = None
+        self.yes_score = self.no_score = 0
+        self.winner = None
+        self.spawn_delay = config.get('ball_spawn_delay', 2)
+        self.dead_balls = []
+        self.balls_used = 0
+        self.max_balls = config.get('max_balls', 10)
+        self.ball_lifetime = config.get('ball_timer', 3)
+        self.positions = np.empty((0, 2))
+        self.swarm = range(0)
+        self.ball_count = config.get('ball_count', 500)
+
+    def get_remaining_time(self):
+        return self.remaining
+
+
+class ReplayPlayer:
+    def __init__(self, path):
+        # aaa abrimos el archivo, solo leemos header, trailer e índice -bynd
+        self.file = open(path, 'rb')
+        if self.file.read(4) != MAGIC:
+            raise ValueError(f"{path} no es un replay")
+        size, = struct.unpack('<I', self.file.read(4))
+        self.header = json.loads(self.file.read(size).decode('utf-8'))
+        if self.header['version'] != VERSION:
+            raise ValueError(f"Versión de replay no soportada: {self.header['version']}")
+        self.config = self.header['config']
+        self.dt = self.header['dt']
+        self.keyframe_interval = self.header['keyframe_interval']
+
+        # vavavava footer -> índice -> trailer -bynd
+        self.file.seek(-FOOTER.size, 2)
+        index_offset, blocks = FOOTER.unpack(self.file.read(FOOTER.size))
+        self.file.seek(index_offset)
+        self.offsets = np.frombuffer(self.file.read((blocks + 1) * 8), dtype=np.uint64).tolist()
+        self.file.seek(self.offsets[-1])
+        trailer = json.loads(self.file.read(index_offset - self.offsets[-1]).decode('utf-8'))
+        self.steps = trailer['steps']
+        self.events = trailer['events']
+
+        # chintrolas de los eventos sacamos cuándo muere cada anillo y dónde quedó cada bola -bynd
+        self.destroyed_at = [None] * len(self.header['rings'])
+        self.kill_steps = []
+        self.kills = []
+        for event in self.events:
+            if event[1] == 'ring_destroyed':
+                self.destroyed_at[event[2]] = event[0]
+            elif event[1] == 'ball_killed':
+                self.kill_steps.append(event[0])
+                self.kills.append((event[2], event[3]))
+
+        self.sim = ReplaySim(self.header)
+        self.block_index = None
+        self.block = None
+        self.step = None
+
+    def duration(self):
+        return (self.steps - 1) * self.dt
+
+    def read_block(self, index):
+        # q chidoteee descomprimimos un bloque y deshacemos los deltas, máximo K pasos -bynd
+        self.file.seek(self.offsets[index])
+        raw = zlib.decompress(self.file.read(self.offsets[index + 1] - self.offsets[index]))
+        frames = min(self.keyframe_interval, self.steps - index * self.keyframe_interval)
+        ints = np.frombuffer(raw, dtype=np.int32, count=frames * INT_FIELDS).reshape(frames, INT_FIELDS)
+        ints = np.cumsum(ints, axis=0, dtype=np.int32)
+
+        offset = ints.nbytes
+        floats = []
+        previous = None
+        for count in ints[:, 0].tolist():
+            length = 1 + count * 2
+            bits = np.frombuffer(raw, dtype=np.uint32, count=length, offset=offset)
+            offset += length * 4
+            if previous is not None and len(previous) == length:
+                bits = previous + bits
+            previous = bits
+            floats.append(bits.view(np.float32))
+        return ints, floats
+
+    def frame(self, step):
+        # fokeis O(1): el índice dice dónde está el bloque, el bloque tiene a lo más K pasos -bynd
+        index = step // self.keyframe_interval
+        if index != self.block_index:
+            self.block = self.read_block(index)
+            self.block_index = index
+        ints, floats = self.block
+        offset = step - index * self.keyframe_interval
+        return ints[offset].tolist(), floats[offset]
+
+    def seek(self, seconds):
+        # ey de segundos a paso y mostramos ese paso -bynd
+        return self.show(int(round(seconds / self.dt)))
+
+    def show(self, step):
+        # aaa actualizamos la vista de la simulación al paso pedido -bynd
+        step = max(0, min(step, self.steps - 1))
+        self.step = step
+        (count, yes_score, no_score, balls_used, status), floats = self.frame(step)
+        sim = self.sim
+        sim.remaining = float(floats[0])
+        sim.game_over = bool(status & GAME_OVER)
+        sim.won = bool(status & WON)
+
+        # ey el RingSet saca los ángulos del tiempo -bynd
+        sim.rings.time = step * self.dt
+        for ring, destroyed_at in zip(sim.rings, self.destroyed_at):
+            ring.destroyed = destroyed_at is not None and destroyed_at <= step
+        sim.rings_alive = sim.rings.alive_count()
+
+        positions = floats[1:].reshape(-1, 2)
+        balls = [BallView(x, y) for x, y in positions.tolist()] if sim.game_mode != 'swarm' else []
+        if sim.game_mode == '8ball':
+            sim.ball_yes = balls.pop(0) if status & HAS_YES else None
+            sim.ball_no = balls.pop(0) if status & HAS_NO else None
+            sim.yes_score = yes_score
+            sim.no_score = no_score
+            sim.winner = WINNERS[status >> WINNER_SHIFT]
+        elif sim.game_mode == 'elimination':
+            sim.current_ball = {'alive': True, 'body': balls[0]} if balls else None
+            sim.balls_used = balls_used
+            dead = bisect.bisect_right(self.kill_steps, step)
+            if dead != len(sim.dead_balls):
+                sim.dead_balls = self.kills[:dead]
+        elif sim.game_mode == 'swarm':
+            sim.positions = positions
+            sim.swarm = range(count)
+        else:
+            sim.ball = balls[0] if balls else None
+        return step
+
+
+def record_match(config_file, path, seed=None, max_time=None, keyframe_interval=KEYFRAME_INTERVAL, config=None):
+    # vavavava simulamos sin pantalla y grabamos cada paso; con config ya cargado no se vuelve a leer el JSON -bynd
+    from simulation import PlinkoSimulation
+    if config is None:
+        sim = PlinkoSimulation.from_file(config_file, seed=seed)
+    else:
+        sim = PlinkoSimulation(config, seed=seed)
+    # ey con physics_hz alto se graba un frame por cada frame de render, no cada paso -bynd
+    substeps = max(1, round(1.0 / (sim.dt * FPS)))
+    if max_time is None:
+        max_time = sim.config.get('timer', 60) * 10
+    recorder = ReplayRecorder(sim, path, sim.dt * substeps, keyframe_interval)
+    try:
+        while not sim.game_over and sim.clock.now() < max_time:
+            for _ in range(substeps):
+                sim.step()
+            recorder.record()
+    finally:
+        recorder.close()
+    return sim.get_result(), recorder.steps
+
+
+def load_colors(path):
+    # chintrolas otro esquema de colores encima del q se grabó -bynd
+    with open(path, 'r', encoding='utf-8') as f:
+        colors = json.load(f)
+    return colors.get('colors', colors)
+
+
+def replay_game(player, colors=None):
+    # q chidoteee PlinkoGame sin ventana propia, dibujando encima del replay -bynd
+    from game import PlinkoGame
+    config = dict(player.config)
+    if colors:
+        config['colors'] = dict(config['colors'], **colors)
+        player.sim.config = config
+    player.show(0)
+    return PlinkoGame(headless=True, config=config, sim=player.sim)
+
+
+def play(path, colors=None, scale=1.0, start=0.0):
+    # ala reproducimos en una ventana, con pausa y saltos -bynd
+    import pygame
+    player = ReplayPlayer(path)
+    game = replay_game(player, colors)
+    pygame.display.init()
+    size = (int(WIDTH * scale), int(HEIGHT * scale))
+    window = pygame.display.set_mode(size)
+    pygame.display.set_caption("Plinko - Replay")
+    clock = pygame.time.Clock()
+
+    step = player.seek(start)
+    paused = False
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_HOME):
+                    # fokeis saltos de 5 segundos, el render se repinta completo -bynd
+                    if event.key == pygame.K_HOME:
+                        step = player.show(0)
+                    else:
+                        jump = -5 if event.key == pygame.K_LEFT else 5
+                        step = player.seek(step * player.dt + jump)
+                    game.full_redraw = True
+
+        game.draw()
+        if scale == 1.0:
+            window.blit(game.screen, (0, 0))
+        else:
+            pygame.transform.smoothscale(game.screen, size, window)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+        if not paused and step < player.steps - 1:
+            step = player.show(step + 1)
+    pygame.quit()
+
+
+def export_replay(path, out, colors=None, scale=1.0, start=0.0, end=None, writers=None):
+    # ey re-render del replay a PNGs, con otros colores o a otra resolución -bynd
+    import pygame
+    from export import FrameExporter, PNGSequenceSink
+    player = ReplayPlayer(path)
+    game = replay_game(player, colors)
+    size = (int(WIDTH * scale), int(HEIGHT * scale))
+    scaled = pygame.Surface(size) if scale != 1.0 else None
+    exporter = FrameExporter(PNGSequenceSink(out, size), writers=writers)
+
+    last = player.steps - 1 if end is None else min(player.steps - 1, int(round(end / player.dt)))
+    try:
+        for step in range(player.seek(start), last + 1):
+            player.show(step)
+            game.draw()
+            surface = game.screen
+            if scaled is not None:
+                pygame.transform.smoothscale(game.screen, size, scaled)
+                surface = scaled
+            exporter.submit(pygame.image.tobytes(surface, 'RGB'))
+    finally:
+        exporter.close()
+    return exporter.frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graba y reproduce partidos sin re-simular")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="simula un nivel y lo graba")
+    record.add_argument('config', help="archivo JSON del nivel")
+    record.add_argument('out', help="archivo del replay")
+    record.add_argument('--seed', type=int, default=None, help="seed del partido")
+    record.add_argument('--max-time', type=float, default=None, help="segundos simulados máximos")
+    record.add_argument('--keyframe', type=int, default=KEYFRAME_INTERVAL, help="pasos entre keyframes")
+
+    for name, text in (('play', "reproduce un replay en ventana"), ('export', "re-renderiza un replay a PNGs")):
+        sub = commands.add_parser(name, help=text)
+        sub.add_argument('replay', help="archivo del replay")
+        sub.add_argument('--colors', default=None, help="JSON con otros colores")
+        sub.add_argument('--scale', type=float, default=1.0, help="escala de la resolución")
+        sub.add_argument('--start', type=float, default=0.0, help="segundo donde empieza")
+    commands.choices['export'].add_argument('--out', default='frames', help="carpeta de salida")
+    commands.choices['export'].add_argument('--end', type=float, default=None, help="segundo donde termina")
+    commands.choices['export'].add_argument('--writers', type=int, default=None, help="hilos de escritura")
+
+    info = commands.add_parser('info', help="muestra el resumen de un replay")
+    info.add_argument('replay', help="archivo del replay")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        result, steps = record_match(args.config, args.out, args.seed, args.max_time, args.keyframe)
+        print(f"🎞️ {steps} pasos grabados en {args.out}")
+        print(f"   {result}")
+    elif args.command == 'play':
+        colors = load_colors(args.colors) if args.colors else None
+        play(args.replay, colors, args.scale, args.start)
+    elif args.command == 'export':
+        colors = load_colors(args.colors) if args.colors else None
+        frames = export_replay(args.replay, args.out, colors, args.scale, args.start, args.end, args.writers)
+        print(f"🎬 {frames} frames exportados en {args.out}")
+    else:
+        player = ReplayPlayer(args.replay)
+        print(f"🎞️ {args.replay}")
+        print(f"   Modo: {player.header['mode']} | Seed: {player.header['seed']}")
+        print(f"   Pasos: {player.steps} ({player.duration():.2f}s) | Bloques: {len(player.offsets) - 1}")
+        print(f"   Eventos: {len(player.events)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,48 @@
 import pymunk
 import math
+from ringset import RingRow
+from escapes import ESCAPE_MARGIN
 
-class Ring:
-    def __init__(self, space, center, radius, gap_angle, gap_size, thickness, elasticity, friction, rotation_speed=0):
+# ey los segmentos de física se adaptan al radio, el dibujo va aparte (sprites.py) -bynd
+SEGMENT_TOLERANCE = 0.5  # chintrolas error máximo de la cuerda en píxeles -bynd
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 72
+
+# ey categoría de colisión de los anillos, así otras cosas estáticas los pueden ignorar -bynd
+RING_CATEGORY = 0b1
+
+# vavavava sensores del gap: sectores desde radio + ESCAPE_MARGIN hacia afuera, en pedazos convexos -bynd
+GAP_CATEGORY = 0b100
+GAP_SENSOR_TYPE = 3  # chintrolas 1 y 2 son las bolas YES/NO -bynd
+GAP_FILTER = pymunk.ShapeFilter(categories=GAP_CATEGORY, mask=pymunk.ShapeFilter.ALL_MASKS() ^ RING_CATEGORY ^ GAP_CATEGORY)
+SENSOR_STEP = 30  # q chidoteee grados máximos por pedazo del sector -bynd
+
+def watch_gap_sensors(space, begin, separate):
+    # ala begin(bola, anillo) al entrar al sector de un gap, separate(bola, anillo) al salir -bynd
+    def pair(arbiter):
+        ball, sensor = arbiter.shapes
+        if ball.collision_type == GAP_SENSOR_TYPE:
+            ball, sensor = sensor, ball
+        return ball, sensor.ring
+
+    if hasattr(space, 'on_collision'):
+        # fokeis pymunk 7 -bynd
+        space.on_collision(GAP_SENSOR_TYPE, None,
+                           begin=lambda arbiter, space, data: begin(*pair(arbiter)),
+                           separate=lambda arbiter, space, data: separate(*pair(arbiter)))
+    else:
+        # ey pymunk 6: handler comodín y begin tiene q regresar True -bynd
+        handler = space.add_wildcard_collision_handler(GAP_SENSOR_TYPE)
+        def on_begin(arbiter, space, data):
+            begin(*pair(arbiter))
+            return True
+        handler.begin = on_begin
+        handler.separate = lambda arbiter, space, data: separate(*pair(arbiter))
+
+class Ring(RingRow):
+    MIN_GAP_SIZE = 60  # chintrolas gap mínimo en grados -bynd
+    
+    def __init__(self, space, center, radius, gap_angle, gap_size, thickness, elasticity, friction, rotation_speed=0, sensor_reach=None):
         # aaa inicializamos el anillo con todos sus parámetros -bynd
         self.space = space
         self.center = center
@@ -10,10 +50,9 @@ class Ring:
         self.gap_angle = gap_angle
         
         # chintrolas validamos gap mínimo de 60 grados -bynd
-        MIN_GAP_SIZE = 60
-        if gap_size < MIN_GAP_SIZE:
-            print(f"⚠️ Gap size {gap_size}° muy pequeño, usando mínimo {MIN_GAP_SIZE}°")
-            gap_size = MIN_GAP_SIZE
+        if gap_size < self.MIN_GAP_SIZE:
+            print(f"⚠️ Gap size {gap_size}° muy pequeño, usando mínimo {self.MIN_GAP_SIZE}°")
+            gap_size = self.MIN_GAP_SIZE
         self.gap_size = gap_size
         
         self.thickness = thickness
@@ -23,65 +62,80 @@ class Ring:
         
         self.destroyed = False
         self.segments = []
+        self.sensors = []
+        # chintrolas hasta dónde llega el sensor del gap, sin reach no hay sensores -bynd
+        self.sensor_reach = sensor_reach
         
-        # vavavava creamos el body para el anillo -bynd
+        # vavavava un solo body para todo el anillo -bynd
         if rotation_speed != 0:
             # q chidoteee si rota, usamos body cinemático -bynd
             self.body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-            self.body.position = center
             self.body.angular_velocity = math.radians(rotation_speed)
-            # ala agregamos el body al space ANTES de los shapes -bynd
-            self.space.add(self.body)
         else:
             # fokeis si no rota, usamos estático -bynd
-            self.body = None
+            self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        self.body.position = center
         
         # ey creamos los segmentos del anillo -bynd
         self.create_ring_segments()
     
+    def get_segment_count(self):
+        # ala cuántos segmentos necesita el arco para q la cuerda no se aleje más de la tolerancia -bynd
+        arc = 360 - self.gap_size
+        if self.radius <= SEGMENT_TOLERANCE:
+            return MIN_SEGMENTS
+        max_step = 2 * math.degrees(math.acos(1 - SEGMENT_TOLERANCE / self.radius))
+        count = int(math.ceil(arc / max_step))
+        return max(MIN_SEGMENTS, min(MAX_SEGMENTS, count))
+    
     def create_ring_segments(self):
-        # ey dividimos el anillo en segmentos evitando el gap -bynd
-        num_segments = 72  # chintrolas más segmentos para q se vea mejor -bynd
-        angle_per_segment = 360 / num_segments
+        # ey el arco sólido va del final del gap al inicio del gap, sin tocar el gap -bynd
+        num_segments = self.get_segment_count()
+        start = self.gap_angle + self.gap_size / 2
+        arc = 360 - self.gap_size
         
-        gap_start = self.gap_angle - self.gap_size / 2
-        gap_end = self.gap_angle + self.gap_size / 2
+        points = []
+        for i in range(num_segments + 1):
+            rad = math.radians(start + arc * i / num_segments)
+            points.append((self.radius * math.cos(rad), self.radius * math.sin(rad)))
         
-        for i in range(num_segments):
-            angle = i * angle_per_segment
-            next_angle = (i + 1) * angle_per_segment
-            
-            # chintrolas checamos si este segmento está en el gap -bynd
-            if self.is_in_gap(angle, gap_start, gap_end) and self.is_in_gap(next_angle, gap_start, gap_end):
-                continue
-            
-            # q chidoteee calculamos los puntos del segmento -bynd
-            rad1 = math.radians(angle)
-            rad2 = math.radians(next_angle)
-            
-            x1 = self.radius * math.cos(rad1)
-            y1 = self.radius * math.sin(rad1)
-            x2 = self.radius * math.cos(rad2)
-            y2 = self.radius * math.sin(rad2)
-            
-            # ala creamos el segmento -bynd
-            if self.body:
-                # fokeis segmento en body cinemático -bynd
-                shape = pymunk.Segment(self.body, (x1, y1), (x2, y2), self.thickness)
-            else:
-                # vavavava segmento estático -bynd
-                body = pymunk.Body(body_type=pymunk.Body.STATIC)
-                body.position = self.center
-                shape = pymunk.Segment(body, (x1, y1), (x2, y2), self.thickness)
-                self.space.add(body)
-                self.segments.append((body, shape))
-                
+        shapes = []
+        for p1, p2 in zip(points, points[1:]):
+            shape = pymunk.Segment(self.body, p1, p2, self.thickness)
             shape.elasticity = self.elasticity
             shape.friction = self.friction
-            
-            if self.body:
-                self.space.add(shape)
-                self.segments.append((self.body, shape))
+            shape.filter = pymunk.ShapeFilter(categories=RING_CATEGORY)
+            shapes.append(shape)
+            self.segments.append((self.body, shape))
+        
+        # q chidoteee body y shapes al space en un solo add, los sensores al final -bynd
+        if self.sensor_reach:
+            self.create_gap_sensors()
+        self.space.add(self.body, *shapes, *self.sensors)
+    
+    def create_gap_sensors(self):
+        # vavavava el sector del gap de radio + ESCAPE_MARGIN a sensor_reach, gira con el body -bynd
+        # ey la cuerda de adentro queda más cerca del centro y la de afuera se abre por el coseno: el polígono cubre todo el sector -bynd
+        pieces = max(1, int(math.ceil(self.gap_size / SENSOR_STEP)))
+        step = self.gap_size / pieces
+        inner = self.radius + ESCAPE_MARGIN
+        outer = max(self.sensor_reach, inner + 1) / math.cos(math.radians(step / 2))
+        start = self.gap_angle - self.gap_size / 2
+        for i in range(pieces):
+            a0 = math.radians(start + step * i)
+            a1 = math.radians(start + step * (i + 1))
+            vertices = [(inner * math.cos(a0), inner * math.sin(a0)), (outer * math.cos(a0), outer * math.sin(a0)),
+                        (outer * math.cos(a1), outer * math.sin(a1)), (inner * math.cos(a1), inner * math.sin(a1))]
+            sensor = pymunk.Poly(self.body, vertices)
+            sensor.sensor = True
+            sensor.collision_type = GAP_SENSOR_TYPE
+            sensor.filter = GAP_FILTER
+            sensor.ring = self
+            self.sensors.append(sensor)
+    
+    def shapes(self):
+        # ala segmentos y sensores, todo lo q va al space -bynd
+        return [shape for _, shape in self.segments] + self.sensors
     
     def is_in_gap(self, angle, gap_start, gap_end):
         # vavavava checamos si un ángulo está dentro del gap -bynd
@@ -110,9 +164,7 @@ class Ring:
             angle = math.degrees(math.atan2(dy, dx)) % 360
             
             # fokeis si el anillo rota, ajustamos el ángulo del gap -bynd
-            current_gap_angle = self.gap_angle
-            if self.body:
-                current_gap_angle = (self.gap_angle + math.degrees(self.body.angle)) % 360
+            current_gap_angle = self.get_current_gap_angle()
             
             gap_start = (current_gap_angle - self.gap_size / 2) % 360
             gap_end = (current_gap_angle + self.gap_size / 2) % 360
@@ -124,33 +176,33 @@ class Ring:
         return False
     
     def destroy(self):
-        # aaa destruimos el anillo removiendo todos sus segmentos -bynd
+        # aaa destruimos el anillo removiendo body y segmentos de un jalón -bynd
         if not self.destroyed:
-            if self.body:
-                # vavavava removemos el body cinemático -bynd
-                for _, shape in self.segments:
-                    self.space.remove(shape)
-                self.space.remove(self.body)
-            else:
-                # q chidoteee removemos los bodies estáticos -bynd
-                for body, shape in self.segments:
-                    self.space.remove(body, shape)
-            
+            self.space.remove(self.body, *self.shapes())
             self.destroyed = True
-            print(f"💥 Anillo destruido! (Radio: {self.radius:.0f})")
     
-    def get_current_gap_angle(self):
-        # ey retornamos el ángulo actual del gap considerando rotación -bynd
-        if self.body:
-            return (self.gap_angle + math.degrees(self.body.angle)) % 360
-        return self.gap_angle
+    def detach(self):
+        # ey lo sacamos del space sin contarlo como destruido, para cambiarlo por uno nuevo -bynd
+        if not self.destroyed:
+            self.space.remove(self.body, *self.shapes())
+    
+    def set_material(self, elasticity, friction):
+        # chintrolas rebote y fricción se cambian directo en los segmentos, sin reconstruir -bynd
+        self.elasticity = elasticity
+        self.friction = friction
+        for _, shape in self.segments:
+            shape.elasticity = elasticity
+            shape.friction = friction
+    
+    def reset(self, space):
+        # ey de vuelta como recién creado: sin girar y con sus segmentos en el space (ya vacío) -bynd
+        self.space = space
+        self.destroyed = False
+        if self.rotation_speed:
+            self.body.angle = 0
+            self.body.angular_velocity = math.radians(self.rotation_speed)
+        space.add(self.body, *self.shapes())
     
-    def get_info(self):
-        # ey retornamos info del anillo -bynd
-        return {
-            'radius': self.radius,
-            'gap_angle': self.get_current_gap_angle(),
-            'gap_size': self.gap_size,
-            'rotation_speed': self.rotation_speed,
-            'destroyed': self.destroyed
-        }
+    def local_rotation(self):
+        # vavavava suelto, sin RingSet, leemos cuánto ha girado el body -bynd
+        return math.degrees(self.body.angle)
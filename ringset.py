@@ -0,0 +1,152 @@
+import numpy as np
+
+class RingRow:
+    # aaa lo común de Ring y RingView: el estado vive en una fila del RingSet -bynd
+    ring_set = None
+    index = None
+    _destroyed = False
+
+    def bind(self, ring_set, index):
+        # ey desde aquí destroyed y la rotación se leen de los arrays -bynd
+        ring_set.destroyed[index] = self._destroyed
+        self.ring_set = ring_set
+        self.index = index
+
+    def unbind(self):
+        # chintrolas soltamos la fila pero nos quedamos con el destroyed q traía -bynd
+        self._destroyed = self.destroyed
+        self.ring_set = None
+        self.index = None
+
+    @property
+    def destroyed(self):
+        if self.ring_set is not None:
+            return bool(self.ring_set.destroyed[self.index])
+        return self._destroyed
+
+    @destroyed.setter
+    def destroyed(self, value):
+        self._destroyed = value
+        if self.ring_set is not None:
+            self.ring_set.destroyed[self.index] = value
+
+    def local_rotation(self):
+        # vavavava sin RingSet cada quien sabe cuánto ha girado -bynd
+        return 0
+
+    def get_rotation(self):
+        # chintrolas cuánto ha girado en grados, analítico: velocidad * tiempo simulado -bynd
+        if not self.rotation_speed:
+            return 0
+        if self.ring_set is not None:
+            return self.rotation_speed * self.ring_set.time
+        return self.local_rotation()
+
+    def get_current_gap_angle(self):
+        # ey retornamos el ángulo actual del gap considerando rotación -bynd
+        if self.rotation_speed:
+            return (self.gap_angle + self.get_rotation()) % 360
+        return self.gap_angle
+
+    def get_info(self):
+        # ey retornamos info del anillo -bynd
+        if self.ring_set is not None:
+            return self.ring_set.get_info(self.index)
+        return {
+            'radius': self.radius,
+            'gap_angle': self.get_current_gap_angle(),
+            'gap_size': self.gap_size,
+            'rotation_speed': self.rotation_speed,
+            'destroyed': self.destroyed
+        }
+
+
+class RingSet:
+    def __init__(self, rings=()):
+        # q chidoteee estructura de arrays: una columna por parámetro, una fila por anillo -bynd
+        self.rings = []
+        self.radius = np.empty(0)
+        self.thickness = np.empty(0)
+        self.gap_angle = np.empty(0)
+        self.gap_size = np.empty(0)
+        self.rotation_speed = np.empty(0)
+        self.destroyed = np.zeros(0, dtype=bool)
+        self.static = np.zeros(0, dtype=bool)
+        # fokeis tiempo simulado desde q arrancó el partido, de aquí sale la rotación de todos -bynd
+        self.time = 0.0
+        for ring in rings:
+            self.append(ring)
+
+    def append(self, ring):
+        # ala solo al armar el nivel, crecer arrays aquí no importa -bynd
+        ring.unbind()
+        index = len(self.rings)
+        self.rings.append(ring)
+        self.radius = np.append(self.radius, ring.radius)
+        self.thickness = np.append(self.thickness, ring.thickness)
+        self.gap_angle = np.append(self.gap_angle, ring.gap_angle)
+        self.gap_size = np.append(self.gap_size, ring.gap_size)
+        self.rotation_speed = np.append(self.rotation_speed, ring.rotation_speed)
+        self.destroyed = np.append(self.destroyed, False)
+        self.static = self.rotation_speed == 0
+        ring.bind(self, index)
+        return ring
+
+    def replace(self, rings):
+        # vavavava otra lista de anillos (recarga en caliente), el tiempo sigue corriendo -bynd
+        rings = list(rings)
+        for ring in rings:
+            ring.unbind()
+        time = self.time
+        self.__init__(rings)
+        self.time = time
+
+    def __len__(self):
+        return len(self.rings)
+
+    def __iter__(self):
+        return iter(self.rings)
+
+    def __getitem__(self, index):
+        return self.rings[index]
+
+    def advance(self, dt):
+        # vavavava mismo dt q el space, los bodies cinemáticos giran igualito -bynd
+        self.time += dt
+
+    def reset(self):
+        # ey todos vivos y sin girar -bynd
+        self.time = 0.0
+        self.destroyed[:] = False
+
+    def rotations(self):
+        # chintrolas grados girados de todos los anillos de un jalón -bynd
+        return self.rotation_speed * self.time
+
+    def gap_angles(self):
+        # q chidoteee ángulo actual del gap de todos los anillos -bynd
+        return (self.gap_angle + self.rotations()) % 360
+
+    def alive(self):
+        return ~self.destroyed
+
+    def alive_count(self):
+        return len(self.rings) - int(np.count_nonzero(self.destroyed))
+
+    def static_state(self):
+        # ala llave de cuáles estáticos siguen vivos, para saber cuándo re-hornear el fondo -bynd
+        return self.destroyed[self.static].tobytes()
+
+    def get_info(self, index):
+        # fokeis la fila como el dict de siempre; lo fijo del anillo, lo q cambia de los arrays -bynd
+        ring = self.rings[index]
+        gap_angle = ring.gap_angle
+        if ring.rotation_speed:
+            gap_angle = (gap_angle + ring.rotation_speed * self.time) % 360
+        return {
+            'radius': ring.radius,
+            'gap_angle': gap_angle,
+            'gap_size': ring.gap_size,
+            'rotation_speed': ring.rotation_speed,
+            'destroyed': bool(self.destroyed[index])
+        }
@@ -0,0 +1,220 @@
+import argparse
+import os
+import time
+import numpy as np
+from multiprocessing import shared_memory
+
+# ey encabezado de uint64 al inicio del bloque, luego los slots de pixeles -bynd
+MAGIC = 0x504C4B46524D4553  # chintrolas "PLKFRMES" -bynd
+HEADER = ('magic', 'slots', 'width', 'height', 'pitch', 'shifts', 'readers', 'closed', 'write_seq')
+FIELD = {name: i for i, name in enumerate(HEADER)}
+DETACHED = np.iinfo(np.uint64).max  # vavavava lector q no está conectado, el escritor no lo espera -bynd
+ALIGN = 64
+
+def layout(slots, readers):
+    # q chidoteee encabezado + seq por slot + cursor por lector, alineado para q los pixeles empiecen parejo -bynd
+    words = len(HEADER) + slots + readers
+    return words, -(-words * 8 // ALIGN) * ALIGN
+
+def attach(name):
+    # ala abrir sin registrarlo en el resource_tracker: borrarlo al salir le toca al publicador -bynd
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # fokeis antes de 3.13 no hay track=False; des-registrar después rompe si el tracker es el del publicador -bynd
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+class FramePublisher:
+    # fokeis misma cara q FrameExporter (submit/close/frames), pero recibe la superficie y no bytes -bynd
+    zero_copy = True
+
+    def __init__(self, surface, name=None, slots=4, readers=1, block=True, poll=0.0005):
+        # aaa ring buffer de N slots en memoria compartida con los pixeles crudos de 32 bits del screen -bynd
+        if surface.get_bytesize() != 4:
+            raise ValueError(f"Se necesita una superficie de 32 bits, esta es de {surface.get_bitsize()}")
+        self.width, self.height = surface.get_size()
+        self.pitch = surface.get_pitch()
+        self.frame_bytes = self.pitch * self.height
+        self.slots = slots
+        words, offset = layout(slots, readers)
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=offset + slots * self.frame_bytes)
+        self.name = self.shm.name
+
+        self.header = np.ndarray(words, dtype=np.uint64, buffer=self.shm.buf)
+        self.header[:] = 0
+        base = len(HEADER)
+        self.slot_seq = self.header[base:base + slots]
+        self.cursors = self.header[base + slots:]
+        self.cursors[:] = DETACHED
+        self.pixels = np.ndarray((slots, self.frame_bytes), dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+
+        # chintrolas los lectores sacan el orden de los canales de los shifts (little endian: shift 16 = byte 2) -bynd
+        r, g, b, _ = surface.get_shifts()
+        for field, value in (('slots', slots), ('width', self.width), ('height', self.height), ('pitch', self.pitch),
+                             ('shifts', r | g << 8 | b << 16), ('readers', readers)):
+            self.header[FIELD[field]] = value
+        self.header[FIELD['magic']] = MAGIC
+
+        # ey con block el escritor espera al lector más lento (backpressure); sin block se salta el frame -bynd
+        self.block = block
+        self.poll = poll
+        self.frames = 0
+        self.dropped = 0
+        self.waited = 0.0
+
+    def wait_readers(self, timeout=None):
+        # ala para exportar: esperamos a q se conecten todos los lectores antes del primer frame -bynd
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while (self.cursors == DETACHED).any():
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+            time.sleep(self.poll)
+        return True
+
+    def reader_lag(self, seq):
+        # vavavava ¿algún lector conectado todavía no suelta el frame q vive en ese slot? -bynd
+        cursors = self.cursors[self.cursors != DETACHED]
+        return len(cursors) and seq >= self.slots and int(cursors.min()) <= seq - self.slots
+
+    def submit(self, surface):
+        # q chidoteee un solo memcpy de la superficie al slot, sin tobytes ni pipe -bynd
+        seq = int(self.header[FIELD['write_seq']])
+        if self.reader_lag(seq):
+            if not self.block:
+                self.dropped += 1
+                return None
+            start = time.perf_counter()
+            while self.reader_lag(seq):
+                time.sleep(self.poll)
+            self.waited += time.perf_counter() - start
+
+        slot = seq % self.slots
+        self.slot_seq[slot] = 0  # ala escribiendo -bynd
+        pixels = np.asarray(surface.get_buffer())
+        np.copyto(self.pixels[slot], pixels)
+        del pixels  # fokeis suelta el lock de la superficie -bynd
+        self.slot_seq[slot] = seq + 1
+        self.header[FIELD['write_seq']] = seq + 1
+        self.frames += 1
+        return seq
+
+    def close(self):
+        # aaa avisamos a los lectores y borramos el bloque; los q ya lo tienen mapeado lo terminan de leer -bynd
+        self.header[FIELD['closed']] = 1
+        del self.header, self.slot_seq, self.cursors, self.pixels
+        self.shm.close()
+        self.shm.unlink()
+
+
+class FrameReader:
+    def __init__(self, name, reader=0, poll=0.0005):
+        # aaa lector en otro proceso: cada frame es una vista de NumPy directo a la memoria compartida -bynd
+        self.shm = attach(name)
+        head = np.ndarray(len(HEADER), dtype=np.uint64, buffer=self.shm.buf)
+        if int(head[FIELD['magic']]) != MAGIC:
+            raise ValueError(f"{name} no es un buffer de frames")
+        self.slots = int(head[FIELD['slots']])
+        self.width = int(head[FIELD['width']])
+        self.height = int(head[FIELD['height']])
+        self.pitch = int(head[FIELD['pitch']])
+        shifts = int(head[FIELD['shifts']])
+        self.channels = tuple((shifts >> bits & 0xFF) // 8 for bits in (0, 8, 16))  # ey byte de R, G y B -bynd
+        readers = int(head[FIELD['readers']])
+        if not 0 <= reader < readers:
+            raise ValueError(f"Lector {reader} fuera de rango, el buffer acepta {readers}")
+
+        words, offset = layout(self.slots, readers)
+        del head
+        self.header = np.ndarray(words, dtype=np.uint64, buffer=self.shm.buf)
+        base = len(HEADER)
+        self.slot_seq = self.header[base:base + self.slots]
+        self.cursors = self.header[base + self.slots:]
+        frame_bytes = self.pitch * self.height
+        pixels = np.ndarray((self.slots, frame_bytes), dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+        # chintrolas (slots, alto, ancho, 4) con el pitch como stride, sin copiar nada -bynd
+        self.pixels = np.lib.stride_tricks.as_strided(pixels, (self.slots, self.height, self.width, 4),
+                                                      (frame_bytes, self.pitch, 4, 1), writeable=False)
+        self.reader = reader
+        self.poll = poll
+        # vavavava nos conectamos en vivo, desde el siguiente frame q se publique -bynd
+        self.cursor = int(self.header[FIELD['write_seq']])
+        self.cursors[reader] = self.cursor
+
+    def read(self, timeout=None):
+        # q chidoteee (seq, pixeles) del siguiente frame; None si el publicador cerró o se acabó el timeout -bynd
+        # fokeis el slot es nuestro hasta release(), el escritor no lo pisa -bynd
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while int(self.header[FIELD['write_seq']]) <= self.cursor:
+            if self.header[FIELD['closed']] or (deadline is not None and time.perf_counter() > deadline):
+                return None
+            time.sleep(self.poll)
+        slot = self.cursor % self.slots
+        return self.cursor, self.pixels[slot]
+
+    def release(self):
+        # ala listo con el frame, el escritor ya puede usar su slot -bynd
+        self.cursor += 1
+        self.cursors[self.reader] = self.cursor
+
+    def frames(self, timeout=None):
+        # ey generador: cada frame se suelta al pedir el siguiente -bynd
+        while True:
+            frame = self.read(timeout)
+            if frame is None:
+                return
+            yield frame
+            self.release()
+
+    def rgb(self, pixels):
+        # chintrolas vista RGB sin copiar cuando el orden lo permite (BGRX -> [2::-1]) -bynd
+        if self.channels == (2, 1, 0):
+            return pixels[..., 2::-1]
+        if self.channels == (0, 1, 2):
+            return pixels[..., :3]
+        return pixels[..., list(self.channels)]
+
+    def close(self):
+        # vavavava nos desconectamos para q el escritor ya no nos espere -bynd
+        self.cursors[self.reader] = DETACHED
+        del self.header, self.slot_seq, self.cursors, self.pixels
+        self.shm.close()
+
+
+def main():
+    # aaa lector de prueba: mide cuántos frames llegan y opcionalmente guarda PNGs -bynd
+    parser = argparse.ArgumentParser(description="Lee frames de la memoria compartida")
+    parser.add_argument('name', help="nombre del bloque (el --out del publicador)")
+    parser.add_argument('--reader', type=int, default=0, help="índice de lector")
+    parser.add_argument('--png-every', type=int, default=0, help="guarda un PNG cada N frames")
+    parser.add_argument('--out', default='frames', help="carpeta de los PNG")
+    parser.add_argument('--timeout', type=float, default=5.0, help="segundos sin frames antes de salir")
+    args = parser.parse_args()
+
+    reader = FrameReader(args.name, args.reader)
+    print(f"📡 {args.name}: {reader.width}x{reader.height}, {reader.slots} slots")
+    count = 0
+    last = None
+    gaps = 0
+    start = time.perf_counter()
+    for seq, pixels in reader.frames(args.timeout):
+        if last is not None and seq != last + 1:
+            gaps += 1
+        last = seq
+        count += 1
+        if args.png_every and seq % args.png_every == 0:
+            import pygame
+            os.makedirs(args.out, exist_ok=True)
+            surface = pygame.image.frombuffer(np.ascontiguousarray(reader.rgb(pixels)).tobytes(), (reader.width, reader.height), 'RGB')
+            pygame.image.save(surface, os.path.join(args.out, f'frame_{seq:06d}.png'))
+    elapsed = time.perf_counter() - start
+    reader.close()
+    print(f"🎬 {count} frames en {elapsed:.1f}s ({count / elapsed if elapsed else 0:.1f} FPS), huecos: {gaps}")
+
+if __name__ == "__main__":
+    main()
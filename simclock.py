@@ -0,0 +1,38 @@
+import time
+
+class SimClock:
+    def __init__(self, start=0.0):
+        # aaa reloj simulado, solo avanza cuando la simulación da un paso -bynd
+        self.start = start
+        self.time = start
+        self.steps = 0
+
+    def now(self):
+        # ey tiempo simulado actual en segundos -bynd
+        return self.time
+
+    def advance(self, dt):
+        # vavavava avanzamos el reloj lo mismo q las físicas -bynd
+        self.time += dt
+        self.steps += 1
+
+    def reset(self):
+        # ala de vuelta al inicio para reiniciar el partido -bynd
+        self.time = self.start
+        self.steps = 0
+
+
+class WallClock:
+    def __init__(self):
+        # chintrolas reloj de pared, el comportamiento viejo con time.time() -bynd
+        self.steps = 0
+
+    def now(self):
+        return time.time()
+
+    def advance(self, dt):
+        # fokeis el tiempo real avanza solito, solo contamos pasos -bynd
+        self.steps += 1
+
+    def reset(self):
+        self.steps = 0
@@ -0,0 +1,734 @@
+import math
+import pymunk
+import random
+import numpy as np
+from itertools import chain
+try:
+    import pymunk.batch as pymunk_batch
+except ImportError:
+    pymunk_batch = None  # ey pymunk viejito sin batch, leemos body por body -bynd
+from ring import Ring, RING_CATEGORY, GAP_CATEGORY, watch_gap_sensors
+from ringset import RingSet
+from escapes import EscapeDetector
+from simclock import SimClock
+from events import (EventBus, ConsoleSink, Event, RING_DESTROYED, BALL_SPAWNED, BALL_KILLED,
+                    ESCAPE, MATCH_END, TIMER_EXPIRED)
+from constants import WIDTH, HEIGHT, FPS
+
+# chintrolas las bolas muertas no chocan con los anillos (igual ninguno de los dos se mueve solo) ni prenden sus sensores -bynd
+DEAD_BALL_FILTER = pymunk.ShapeFilter(categories=0b10, mask=pymunk.ShapeFilter.ALL_MASKS() ^ RING_CATEGORY ^ GAP_CATEGORY)
+# ey los sensores del gap llegan hasta la esquina de la pantalla, más allá no hay nada q atrapar -bynd
+SENSOR_REACH = math.hypot(WIDTH / 2, HEIGHT / 2)
+# chintrolas a qué anillos se les ponen sensores: 'static' (default), 'all' o 'none' -bynd
+# q chidoteee en los q giran chipmunk re-indexa el sector cada paso y sale más caro q checar (space.step 420 -> 720us con 15 anillos) -bynd
+GAP_SENSOR_MODES = ('static', 'all', 'none')
+
+class PlinkoSimulation:
+    def __init__(self, config, clock=None, seed=None, events=None):
+        # aaa simulación pura, sin pygame, para correr sin pantalla -bynd
+        self.config = config
+
+        # vavavava sin seed todo es paramétrico, con seed movemos tantito el spawn -bynd
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else None
+        self.spawn_jitter = self.config.get('spawn_jitter', 3)
+
+        # chintrolas el reloj es inyectable, por defecto tiempo simulado -bynd
+        self.clock = clock if clock is not None else SimClock()
+        # ey paso fijo de física; physics_hz más alto = menos bolas rápidas atravesando anillos -bynd
+        self.dt = 1.0 / self.config.get('physics_hz', FPS)
+
+        # ey eventos en vez de prints; por defecto a la consola como siempre, un EventBus() vacío no cuesta nada -bynd
+        self.events = events if events is not None else EventBus([ConsoleSink()])
+
+        # q chidoteee variables del juego -bynd
+        self.rings = RingSet()  # ey los anillos y sus parámetros en arrays, la rotación sale del tiempo -bynd
+        self.game_mode = self.config.get('type', 'escape')
+        if self.game_mode == 'swarm':
+            # ey cientos o miles de bolas a la vez, sus posiciones viven en un array de NumPy -bynd
+            self.batch = pymunk_batch.Buffer() if pymunk_batch else None
+            self.ball_count = self.config.get('ball_count', 500)
+
+        # ey creamos el espacio de físicas -bynd
+        self.space = self.create_space()
+        self.reset_state()
+
+        # ala creamos el nivel -bynd
+        self.setup_level()
+
+    def create_space(self):
+        # vavavava space vacío con lo q no depende del partido -bynd
+        space = pymunk.Space()
+        space.gravity = tuple(self.config['gravity'])
+        # vavavava los escapes los avisa chipmunk: (bola, anillo) -> en cuántos pedazos del sensor está -bynd
+        self.near = {}
+        watch_gap_sensors(space, self.gap_begin, self.gap_separate)
+        if self.game_mode == 'elimination':
+            # q chidoteee las bolas muertas son shapes de un solo body estático, aquí solo sus posiciones -bynd
+            self.graveyard = pymunk.Body(body_type=pymunk.Body.STATIC)
+            space.add(self.graveyard)
+        elif self.game_mode == 'swarm':
+            # q chidoteee spatial hash con celdas del tamaño de una bola, mucho mejor q el árbol con tantas -bynd
+            radius = self.config['ball']['radius']
+            space.use_spatial_hash(radius * 2, self.ball_count * 10)
+        return space
+
+    def reset_state(self):
+        # chintrolas variables según el modo -bynd
+        if self.game_mode == '8ball':
+            self.ball_yes = None
+            self.ball_no = None
+            self.yes_score = 0
+            self.no_score = 0
+            self.start_time = None
+            self.last_spawn_time = None
+            self.spawn_delay = self.config.get('ball_spawn_delay', 2)
+            self.winner = None
+        elif self.game_mode == 'elimination':
+            self.current_ball = None
+            self.dead_balls = []
+            self.ball_timer = None
+            self.balls_used = 0
+            self.max_balls = self.config.get('max_balls', 10)
+            self.ball_lifetime = self.config.get('ball_timer', 3)
+        elif self.game_mode == 'swarm':
+            self.swarm = []
+            self.positions = np.empty((0, 2))
+            self.swarm_ids = np.empty(0, dtype=np.uintp)
+            self.batch_ids = None
+            self.batch_rows = None
+            self.balls_lost = 0
+            self.start_time = None
+        else:
+            self.ball = None
+            self.start_time = None
+
+        self.game_over = False
+        self.won = False
+
+    @property
+    def rings_alive(self):
+        # chintrolas cuenta directo del array de destruidos -bynd
+        return self.rings.alive_count()
+
+    @classmethod
+    def from_file(cls, config_file='level_config.json', clock=None, seed=None, events=None):
+        # vavavava atajo para cargar el nivel directo del JSON -bynd
+        from levels import LevelConfig
+        return cls(LevelConfig(config_file).get_level(), clock=clock, seed=seed, events=events)
+
+    def setup_level(self):
+        # vavavava configuramos todos los elementos del nivel -bynd
+        center = (WIDTH // 2, HEIGHT // 2)  # chintrolas centro de la pantalla -bynd
+        rings_config = self.config['rings']
+
+        # ey iteramos sobre cada config de anillo -bynd
+        for ring_data in rings_config['ring_configs']:
+            self.rings.append(self.build_ring(ring_data))
+
+        # chintrolas índice por radio para no checar todos los anillos cada paso -bynd
+        self.escapes = EscapeDetector(self.rings, center)
+        self.polled = [ring for ring in self.rings if not ring.sensors]
+        self.start_match()
+
+    def build_ring(self, ring_data):
+        # ala un anillo con los parámetros comunes de rings_config -bynd
+        rings_config = self.config['rings']
+        return Ring(
+            space=self.space,
+            center=(WIDTH // 2, HEIGHT // 2),
+            radius=ring_data['radius'],
+            gap_angle=ring_data['gap_angle'],
+            gap_size=ring_data['gap_size'],
+            thickness=rings_config['thickness'],
+            elasticity=rings_config['elasticity'],
+            friction=rings_config['friction'],
+            rotation_speed=ring_data.get('rotation_speed', 0),
+            sensor_reach=SENSOR_REACH if self.wants_sensors(ring_data) else None
+        )
+
+    def wants_sensors(self, ring_data):
+        # ala en swarm las miles de bolas van contra el detector con NumPy, sin sensores -bynd
+        mode = self.config.get('gap_sensors', 'static')
+        if self.game_mode == 'swarm' or mode == 'none':
+            return False
+        return mode == 'all' or not ring_data.get('rotation_speed', 0)
+
+    def apply_config(self, config, changes):
+        # aaa recarga en caliente: mismo space y mismas bolas, solo se toca lo q cambió (ver hotreload.diff_levels) -bynd
+        self.config = config
+        self.dt = 1.0 / config.get('physics_hz', FPS)
+        self.spawn_jitter = config.get('spawn_jitter', 3)
+        if changes['gravity']:
+            self.space.gravity = tuple(config['gravity'])
+
+        # vavavava solo se reconstruyen los anillos q cambiaron, los demás se quedan con todo y sus shapes -bynd
+        rings_config = config['rings']
+        ring_configs = rings_config['ring_configs']
+        rebuild = set(range(len(ring_configs))) if changes['rebuild_all'] else set(changes['rings'])
+        old_rings = list(self.rings)
+        rings = []
+        for index, ring_data in enumerate(ring_configs):
+            if index < len(old_rings) and index not in rebuild:
+                ring = old_rings[index]
+                if changes['ring_material']:
+                    ring.set_material(rings_config['elasticity'], rings_config['friction'])
+            else:
+                ring = self.build_ring(ring_data)
+                if index < len(old_rings):
+                    # chintrolas el nuevo hereda si ya estaba destruido, si no la partida cambia de marcador -bynd
+                    old = old_rings[index]
+                    old.detach()
+                    if old.destroyed:
+                        ring.destroy()
+            rings.append(ring)
+        for ring in old_rings[len(ring_configs):]:
+            ring.detach()
+        self.rings.replace(rings)
+
+        # q chidoteee los nuevos q rotan arrancan en la fase del tiempo actual, igual q el dibujo -bynd
+        for index in rebuild:
+            ring = self.rings[index]
+            if ring.rotation_speed:
+                ring.body.angle = math.radians(ring.get_rotation())
+        self.escapes = EscapeDetector(self.rings, (WIDTH // 2, HEIGHT // 2))
+        self.polled = [ring for ring in self.rings if not ring.sensors]
+
+        # fokeis rebote y fricción de las bolas en juego; radio y masa ya tocan a la siguiente bola -bynd
+        if changes['ball']:
+            for shape, key in self.ball_shapes():
+                shape.elasticity = config[key]['elasticity']
+                shape.friction = config[key]['friction']
+
+        # ey lo del modo q se lee al arrancar el partido -bynd
+        if self.game_mode == '8ball':
+            self.spawn_delay = config.get('ball_spawn_delay', 2)
+        elif self.game_mode == 'elimination':
+            self.max_balls = config.get('max_balls', 10)
+            self.ball_lifetime = config.get('ball_timer', 3)
+
+    def ball_shapes(self):
+        # ala (shape, llave del config) de cada bola en el space -bynd
+        if self.game_mode == '8ball':
+            return [(shape, key) for shape, key in ((self.ball_yes, 'ball_yes'), (self.ball_no, 'ball_no'))
+                    if shape and shape.body]
+        if self.game_mode == 'elimination':
+            shapes = [(shape, 'ball') for shape in self.graveyard.shapes]
+            if self.current_ball and self.current_ball['alive']:
+                shapes.append((self.current_ball['shape'], 'ball'))
+            return shapes
+        if self.game_mode == 'swarm':
+            return [(shape, 'ball') for shape in self.swarm]
+        return [(self.ball, 'ball')] if self.ball and self.ball.body else []
+
+    def start_match(self):
+        # q chidoteee iniciamos según el modo -bynd
+        if self.game_mode == '8ball':
+            self.spawn_8ball_pair()
+            self.start_time = self.clock.now()
+            self.last_spawn_time = self.clock.now()
+        elif self.game_mode == 'elimination':
+            self.spawn_new_ball()
+        elif self.game_mode == 'swarm':
+            self.spawn_swarm()
+            self.start_time = self.clock.now()
+        else:
+            self.create_ball()
+            self.start_time = self.clock.now()
+
+    def reset(self, seed=None):
+        # aaa reinicio rápido: mismos anillos y mismo config, nada de re-leer el JSON ni reconstruir segmentos -bynd
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed) if self.seed is not None else None
+
+        # chintrolas los mismos bodies y shapes a un space nuevo, en el mismo orden q al crearlos -bynd
+        # fokeis así chipmunk les da los mismos ids y el partido sale igualito q uno recién creado -bynd
+        self.space.remove(*self.space.shapes, *self.space.bodies)
+        self.space = self.create_space()
+        for ring in self.rings:
+            ring.reset(self.space)
+        self.rings.reset()
+        self.escapes.rebuild()
+
+        self.clock.reset()
+        self.reset_state()
+        self.start_match()
+
+    def gap_begin(self, ball, ring):
+        # chintrolas la bola tocó el sector del gap de un anillo -bynd
+        key = (ball, ring)
+        self.near[key] = self.near.get(key, 0) + 1
+
+    def gap_separate(self, ball, ring):
+        # q chidoteee salió de un pedazo; también llega al sacar la bola o el anillo del space -bynd
+        key = (ball, ring)
+        count = self.near.get(key, 0) - 1
+        if count > 0:
+            self.near[key] = count
+        else:
+            self.near.pop(key, None)
+
+    def gap_escapes(self, ball):
+        # ey la regla de siempre, pero solo contra los anillos en cuyo sensor está la bola (casi siempre ninguno) -bynd
+        # ala el sensor cubre el círculo de la bola, no solo su centro: nunca se pierde un escape -bynd
+        # fokeis los anillos sin sensor se siguen checando con el índice por radio -bynd
+        rings = [ring for shape, ring in self.near if shape is ball] if self.near else []
+        if self.polled:
+            if len(self.polled) == len(self.rings):
+                rings = None
+            else:
+                rings += self.polled
+        elif not rings:
+            return []
+        pos = ball.body.position
+        return self.escapes.check((pos.x, pos.y), rings)
+
+    def emit(self, kind, **data):
+        # chintrolas evento con tiempo simulado; si nadie escucha ni lo armamos -bynd
+        if self.events.sinks:
+            self.events.publish(Event(kind, self.clock.now(), self.clock.steps, data))
+
+    def spawn_offset(self):
+        # chintrolas desplazamiento del spawn, cero si no hay seed -bynd
+        if not self.rng:
+            return (0, 0)
+        jitter = self.spawn_jitter
+        return (self.rng.uniform(-jitter, jitter), self.rng.uniform(-jitter, jitter))
+
+    def spawn_8ball_pair(self):
+        # aaa spawneamos el par de bolas yes/no -bynd
+        center_x = WIDTH // 2
+        center_y = HEIGHT // 2
+
+        # vavavava bola YES (cyan) -bynd
+        if 'ball_yes' in self.config:
+            ball_config = self.config['ball_yes']
+            offset_x = ball_config.get('offset_x', -20)
+
+            mass = ball_config['mass']
+            radius = ball_config['radius']
+
+            body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
+            dx, dy = self.spawn_offset()
+            body.position = (center_x + offset_x + dx, center_y + dy)
+
+            shape = pymunk.Circle(body, radius)
+            shape.elasticity = ball_config['elasticity']
+            shape.friction = ball_config['friction']
+            shape.collision_type = 1  # ey tipo yes -bynd
+
+            self.space.add(body, shape)
+            self.ball_yes = shape
+
+        # chintrolas bola NO (naranja) -bynd
+        if 'ball_no' in self.config:
+            ball_config = self.config['ball_no']
+            offset_x = ball_config.get('offset_x', 20)
+
+            mass = ball_config['mass']
+            radius = ball_config['radius']
+
+            body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
+            dx, dy = self.spawn_offset()
+            body.position = (center_x + offset_x + dx, center_y + dy)
+
+            shape = pymunk.Circle(body, radius)
+            shape.elasticity = ball_config['elasticity']
+            shape.friction = ball_config['friction']
+            shape.collision_type = 2  # q chidoteee tipo no -bynd
+
+            self.space.add(body, shape)
+            self.ball_no = shape
+
+        self.emit(BALL_SPAWNED, mode='8ball', count=2)
+
+    def remove_ball(self, ball):
+        # ala removemos una bola del espacio -bynd
+        if ball and ball.body:
+            try:
+                self.space.remove(ball.body, ball)
+            except:
+                pass
+
+    def create_ball(self):
+        # ala creamos una bola para modo escape -bynd
+        ball_config = self.config['ball']
+        center = (WIDTH // 2, HEIGHT // 2)
+
+        mass = ball_config['mass']
+        radius = ball_config['radius']
+
+        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
+        dx, dy = self.spawn_offset()
+        body.position = (center[0] + dx, center[1] + dy)
+
+        shape = pymunk.Circle(body, radius)
+        shape.elasticity = ball_config['elasticity']
+        shape.friction = ball_config['friction']
+
+        self.space.add(body, shape)
+        self.ball = shape
+        self.emit(BALL_SPAWNED, mode=self.game_mode, count=1)
+
+    def spawn_new_ball(self):
+        # aaa spawneamos nueva bola para modo elimination -bynd
+        if self.balls_used >= self.max_balls:
+            return False
+
+        ball_config = self.config['ball']
+        center = (WIDTH // 2, HEIGHT // 2)
+
+        mass = ball_config['mass']
+        radius = ball_config['radius']
+
+        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
+        dx, dy = self.spawn_offset()
+        body.position = (center[0] + dx, center[1] + dy)
+
+        shape = pymunk.Circle(body, radius)
+        shape.elasticity = ball_config['elasticity']
+        shape.friction = ball_config['friction']
+
+        self.space.add(body, shape)
+
+        # vavavava guardamos la bola con su estado -bynd
+        ball_data = {
+            'shape': shape,
+            'body': body,
+            'alive': True,
+            'spawn_time': self.clock.now()
+        }
+
+        self.current_ball = ball_data
+        self.ball_timer = self.clock.now()
+        self.balls_used += 1
+
+        self.emit(BALL_SPAWNED, mode='elimination', count=1, number=self.balls_used, max_balls=self.max_balls)
+        return True
+
+    def swarm_spawn_points(self, count, radius):
+        # vavavava rejilla hexagonal dentro de los anillos, sin encimarse con ninguno -bynd
+        rings_config = self.config['rings']
+        radii = np.array([ring['radius'] for ring in rings_config['ring_configs']], dtype=np.float64)
+        margin = rings_config['thickness'] + radius + self.spawn_jitter + 1
+        spacing = radius * 2 + 1
+        extent = radii.max() - margin if len(radii) else min(WIDTH, HEIGHT) / 2
+
+        rows = np.arange(-extent, extent + spacing, spacing * np.sqrt(3) / 2)
+        cols = np.arange(-extent, extent + spacing, spacing)
+        xs, ys = np.meshgrid(cols, rows)
+        xs[1::2] += spacing / 2  # chintrolas filas alternadas recorridas media bola -bynd
+        points = np.column_stack((xs.ravel(), ys.ravel()))
+        distances = np.hypot(points[:, 0], points[:, 1])
+
+        # fokeis fuera de las bandas de los anillos y adentro del más grande -bynd
+        clear = distances <= extent
+        if len(radii):
+            clear &= (np.abs(distances[:, None] - radii[None, :]) > margin).all(axis=1)
+        order = np.argsort(distances[clear], kind='stable')
+        points = points[clear][order]
+        if len(points) < count:
+            print(f"⚠️ Solo caben {len(points)} bolas de {count} sin encimarse")
+        return points[:count] + (WIDTH // 2, HEIGHT // 2)
+
+    def spawn_swarm(self):
+        # aaa soltamos todas las bolas de un jalón, un solo add al space -bynd
+        ball_config = self.config['ball']
+        mass = ball_config['mass']
+        radius = ball_config['radius']
+        moment = pymunk.moment_for_circle(mass, 0, radius)
+        dx, dy = self.spawn_offset()
+
+        bodies = []
+        for x, y in self.swarm_spawn_points(self.ball_count, radius).tolist():
+            body = pymunk.Body(mass, moment)
+            body.position = (x + dx, y + dy)
+            shape = pymunk.Circle(body, radius)
+            shape.elasticity = ball_config['elasticity']
+            shape.friction = ball_config['friction']
+            bodies.append(body)
+            self.swarm.append(shape)
+
+        self.space.add(*bodies, *self.swarm)
+        self.swarm_ids = np.array([body.id for body in bodies], dtype=np.uintp)
+        self.read_positions()
+        self.emit(BALL_SPAWNED, mode='swarm', count=len(self.swarm))
+
+    def read_positions(self):
+        # chintrolas todas las posiciones del swarm a un array (N, 2) en una sola pasada -bynd
+        if self.batch is None:
+            count = len(self.swarm)
+            flat = np.fromiter(chain.from_iterable(shape.body.position for shape in self.swarm),
+                               dtype=np.float64, count=count * 2)
+            self.positions = flat.reshape(count, 2)
+            return
+
+        # q chidoteee pymunk.batch copia todos los bodies del space desde C, sin un Vec2d por bola -bynd
+        self.batch.clear()
+        pymunk_batch.get_space_bodies(self.space, pymunk_batch.BodyFields.BODY_ID | pymunk_batch.BodyFields.POSITION, self.batch)
+        ids = np.frombuffer(self.batch.int_buf(), dtype=np.uintp)
+        if self.batch_rows is None or not np.array_equal(ids, self.batch_ids):
+            # fokeis vienen en el orden del space (con los anillos), solo se recalcula si algo entró o salió -bynd
+            order = np.argsort(ids)
+            self.batch_ids = ids.copy()
+            self.batch_rows = order[np.searchsorted(ids, self.swarm_ids, sorter=order)]
+        self.positions = np.frombuffer(self.batch.float_buf(), dtype=np.float64).reshape(-1, 2)[self.batch_rows]
+
+    def remove_lost_balls(self):
+        # q chidoteee las bolas q se salieron de la pantalla se van del space -bynd
+        margin = self.config['ball']['radius'] * 2
+        x = self.positions[:, 0]
+        y = self.positions[:, 1]
+        lost = (x < -margin) | (x > WIDTH + margin) | (y < -margin) | (y > HEIGHT + margin)
+        if not lost.any():
+            return
+
+        gone = [self.swarm[i] for i in np.nonzero(lost)[0].tolist()]
+        self.space.remove(*(shape.body for shape in gone), *gone)
+        self.swarm = [self.swarm[i] for i in np.nonzero(~lost)[0].tolist()]
+        self.swarm_ids = self.swarm_ids[~lost]
+        self.positions = self.positions[~lost]
+        self.balls_lost += len(gone)
+
+    def kill_current_ball(self):
+        # chintrolas matamos la bola actual -bynd
+        if not self.current_ball or not self.current_ball['alive']:
+            return
+
+        # q chidoteee convertimos a estático -bynd
+        ball_data = self.current_ball
+        old_body = ball_data['body']
+        old_shape = ball_data['shape']
+        position = (old_body.position.x, old_body.position.y)
+
+        # ala removemos el body dinámico -bynd
+        self.space.remove(old_body, old_shape)
+
+        # fokeis en vez de un body estático por bola, un círculo más en el body compartido -bynd
+        ball_config = self.config['ball']
+        static_shape = pymunk.Circle(self.graveyard, ball_config['radius'], offset=position)
+        static_shape.elasticity = ball_config['elasticity']
+        static_shape.friction = ball_config['friction']
+        static_shape.filter = DEAD_BALL_FILTER
+
+        self.space.add(static_shape)
+        self.dead_balls.append(position)
+
+        # aaa actualizamos los datos -bynd
+        ball_data['alive'] = False
+        ball_data['body'] = self.graveyard
+        ball_data['shape'] = static_shape
+
+        self.emit(BALL_KILLED, x=position[0], y=position[1], number=self.balls_used)
+
+        # ey spawneamos nueva bola -bynd
+        self.spawn_new_ball()
+
+    def check_escapes(self):
+        # fokeis checamos si la bola escapó de algún anillo -bynd
+        if self.game_over:
+            return
+
+        if self.game_mode == '8ball':
+            # vavavava checamos ambas bolas, solo cuenta el primer anillo -bynd
+            if self.ball_yes and self.ball_yes.body:
+                escaped = self.gap_escapes(self.ball_yes)
+                if escaped:
+                    ring = escaped[0]
+                    self.yes_score += 1
+                    self.destroy_ring(ring)  # q chidoteee destruimos el anillo -bynd
+                    self.remove_ball(self.ball_yes)
+                    self.ball_yes = None
+                    self.emit(ESCAPE, ball='YES', radius=ring.radius, score=self.yes_score)
+
+            if self.ball_no and self.ball_no.body:
+                escaped = self.gap_escapes(self.ball_no)
+                if escaped:
+                    ring = escaped[0]
+                    self.no_score += 1
+                    self.destroy_ring(ring)  # ala destruimos el anillo -bynd
+                    self.remove_ball(self.ball_no)
+                    self.ball_no = None
+                    self.emit(ESCAPE, ball='NO', radius=ring.radius, score=self.no_score)
+
+        elif self.game_mode == 'elimination':
+            if not self.current_ball or not self.current_ball['alive']:
+                return
+
+            for ring in self.gap_escapes(self.current_ball['shape']):
+                self.destroy_ring(ring)
+        elif self.game_mode == 'swarm':
+            # vavavava todas las bolas contra el detector de un jalón -bynd
+            self.read_positions()
+            for index, ring in self.escapes.check_many(self.positions):
+                self.destroy_ring(ring)
+            self.remove_lost_balls()
+
+            # ala gana si no queda ningún anillo, pierde si ya no queda ninguna bola -bynd
+            if self.rings_alive == 0:
+                self.won = True
+                self.game_over = True
+                self.end_match('all_rings')
+            elif not self.swarm:
+                self.game_over = True
+                self.won = False
+                self.end_match('no_balls')
+        else:
+            if not self.ball:
+                return
+
+            escaped = self.gap_escapes(self.ball)
+            for ring in escaped:
+                self.destroy_ring(ring)
+
+            # vavavava checamos si ganó -bynd
+            if escaped and not self.escapes.rings and not self.game_over:
+                self.won = True
+                self.game_over = True
+                self.end_match('all_rings')
+
+    def destroy_ring(self, ring):
+        # aaa destruimos el anillo y lo sacamos del índice -bynd
+        if ring.destroyed:
+            return
+        ring.destroy()
+        self.escapes.discard(ring)
+        self.emit(RING_DESTROYED, index=ring.index, radius=ring.radius, rings_alive=self.rings_alive)
+
+    def end_match(self, reason):
+        # q chidoteee un solo evento de fin con todo el resumen del partido -bynd
+        if self.events.sinks:
+            result = self.get_result()
+            # ey tiempo y paso ya vienen en el evento, el tipo del partido va como mode -bynd
+            del result['time'], result['steps']
+            result['mode'] = result.pop('type')
+            self.emit(MATCH_END, reason=reason, **result)
+
+    def check_timer(self):
+        # ey checamos el tiempo según el modo -bynd
+        if self.game_over:
+            return
+
+        if self.game_mode == '8ball':
+            # q chidoteee timer global para 8ball -bynd
+            elapsed = self.clock.now() - self.start_time
+            remaining = self.config.get('timer', 60) - elapsed
+
+            if remaining <= 0:
+                self.game_over = True
+                # chintrolas determinamos ganador -bynd
+                if self.yes_score > self.no_score:
+                    self.winner = "YES"
+                elif self.no_score > self.yes_score:
+                    self.winner = "NO"
+                else:
+                    self.winner = "TIE"
+
+                self.emit(TIMER_EXPIRED, mode='8ball')
+                self.end_match('timer')
+
+            # ala respawnear bolas si no están -bynd
+            time_since_spawn = self.clock.now() - self.last_spawn_time
+            if time_since_spawn >= self.spawn_delay:
+                if not self.ball_yes or not self.ball_no:
+                    if not self.ball_yes:
+                        self.remove_ball(self.ball_yes)
+                    if not self.ball_no:
+                        self.remove_ball(self.ball_no)
+                    self.spawn_8ball_pair()
+                    self.last_spawn_time = self.clock.now()
+
+        elif self.game_mode == 'elimination':
+            # chintrolas timer por bola -bynd
+            if self.current_ball and self.current_ball['alive']:
+                elapsed = self.clock.now() - self.ball_timer
+                if elapsed >= self.ball_lifetime:
+                    self.kill_current_ball()
+
+                    # q chidoteee checamos si perdió -bynd
+                    if self.balls_used >= self.max_balls:
+                        if self.rings_alive > 0:
+                            self.game_over = True
+                            self.won = False
+                            self.end_match('no_balls')
+        else:
+            # ala timer global para modo escape -bynd
+            if self.start_time is None:
+                return
+
+            elapsed = self.clock.now() - self.start_time
+            remaining = self.config.get('timer', 30) - elapsed
+
+            if remaining <= 0:
+                self.game_over = True
+                self.won = False
+                self.emit(TIMER_EXPIRED, mode=self.game_mode)
+                self.end_match('timer')
+
+    def get_remaining_time(self):
+        # chintrolas calculamos tiempo restante -bynd
+        if self.game_mode == '8ball':
+            if self.start_time is None:
+                return self.config.get('timer', 60)
+            elapsed = self.clock.now() - self.start_time
+            return max(0, self.config.get('timer', 60) - elapsed)
+        elif self.game_mode == 'elimination':
+            if not self.current_ball or not self.current_ball['alive']:
+                return 0
+            elapsed = self.clock.now() - self.ball_timer
+            return max(0, self.ball_lifetime - elapsed)
+        else:
+            if self.start_time is None:
+                return self.config.get('timer', 30)
+            elapsed = self.clock.now() - self.start_time
+            return max(0, self.config.get('timer', 30) - elapsed)
+
+    def step(self, dt=None, profiler=None):
+        # vavavava avanzamos un paso de la simulación -bynd
+        # chintrolas el profiler es opcional, solo necesita un método lap(fase) -bynd
+        if dt is None:
+            dt = self.dt
+        if not self.game_over:
+            self.space.step(dt)
+            self.rings.advance(dt)
+            self.clock.advance(dt)
+            if profiler:
+                profiler.lap('space.step')
+            self.check_escapes()
+            if profiler:
+                profiler.lap('check_escapes')
+            self.check_timer()
+            if profiler:
+                profiler.lap('check_timer')
+
+    def run(self, dt=None, max_time=None):
+        # q chidoteee modo turbo sin pantalla, corre tan rápido como dé el CPU -bynd
+        if max_time is None:
+            max_time = self.config.get('timer', 60) * 10
+        end_time = self.clock.now() + max_time
+        while not self.game_over and self.clock.now() < end_time:
+            self.step(dt)
+        return self.get_result()
+
+    def get_result(self):
+        # ala resumen del partido para los batch -bynd
+        result = {
+            'type': self.game_mode,
+            'seed': self.seed,
+            'game_over': self.game_over,
+            'won': self.won,
+            'time': self.clock.now(),
+            'steps': self.clock.steps,
+            'rings_destroyed': len(self.rings) - self.rings_alive
+        }
+        if self.game_mode == '8ball':
+            result['winner'] = self.winner
+            result['yes_score'] = self.yes_score
+            result['no_score'] = self.no_score
+        elif self.game_mode == 'elimination':
+            result['balls_used'] = self.balls_used
+        elif self.game_mode == 'swarm':
+            result['balls_alive'] = len(self.swarm)
+            result['balls_lost'] = self.balls_lost
+        return result
@@ -0,0 +1,243 @@
+import math
+import numpy as np
+import pygame
+from itertools import repeat
+
+# ey resolución del dibujo, aparte de los segmentos de física -bynd
+ARC_STEP = 2  # chintrolas grados entre puntos del arco dibujado -bynd
+GAP_STEP = 5  # q chidoteee grados entre puntos del hueco q recortamos -bynd
+
+def ring_arc(gap_angle, gap_size):
+    # aaa el arco sólido va del final del gap al inicio del gap (dando la vuelta) -bynd
+    start = gap_angle + gap_size / 2
+    end = gap_angle - gap_size / 2 + 360
+    return start, end
+
+def arc_points(cx, cy, radius, start, end, step):
+    # vavavava puntos de un arco de start a end en grados -bynd
+    steps = max(2, int(math.ceil(abs(end - start) / step)))
+    points = []
+    for i in range(steps + 1):
+        rad = math.radians(start + (end - start) * i / steps)
+        points.append((cx + radius * math.cos(rad), cy + radius * math.sin(rad)))
+    return points
+
+def colorkey_for(color):
+    # fokeis un colorkey q no choque con el color del anillo -bynd
+    return (0, 0, 0) if tuple(color) != (0, 0, 0) else (255, 0, 255)
+
+def new_sprite_surface(extent, key):
+    # ala superficie con colorkey + RLE, el blit se salta lo transparente -bynd
+    surface = pygame.Surface((extent * 2, extent * 2))
+    surface.fill(key)
+    surface.set_colorkey(key, pygame.RLEACCEL)
+    return surface
+
+def rasterize_ring(radius, gap_angle, gap_size, thickness, color):
+    # aaa dibujamos el anillo con su gap una sola vez en su propia superficie -bynd
+    extent = int(math.ceil(radius + thickness)) + 2
+    surface = new_sprite_surface(extent, colorkey_for(color))
+    cx = cy = extent
+
+    start, end = ring_arc(gap_angle, gap_size)
+    outer = arc_points(cx, cy, radius + thickness, start, end, ARC_STEP)
+    inner = arc_points(cx, cy, radius - thickness, start, end, ARC_STEP)
+
+    # chintrolas polígono del arco grueso + puntas redondas como los segmentos -bynd
+    pygame.draw.polygon(surface, color, outer + inner[::-1])
+    for rad in (math.radians(start), math.radians(end)):
+        tip = (cx + radius * math.cos(rad), cy + radius * math.sin(rad))
+        pygame.draw.circle(surface, color, tip, thickness)
+    return surface
+
+def rasterize_annulus(radius, thickness, color):
+    # vavavava anillo completo sin gap, no cambia al rotar -bynd
+    extent = int(math.ceil(radius + thickness)) + 2
+    key = colorkey_for(color)
+    surface = new_sprite_surface(extent, key)
+    pygame.draw.circle(surface, color, (extent, extent), radius + thickness)
+    pygame.draw.circle(surface, key, (extent, extent), radius - thickness)
+    return surface
+
+
+def restore_polygon(screen, background, points):
+    # chintrolas copiamos del fondo solo los pixeles del polígono: rect del polígono + máscara, sin color plano -bynd
+    xs = [x for x, y in points]
+    ys = [y for x, y in points]
+    left, top = int(math.floor(min(xs))), int(math.floor(min(ys)))
+    rect = pygame.Rect(left, top, int(math.ceil(max(xs))) - left + 1, int(math.ceil(max(ys))) - top + 1)
+    rect = rect.clip(background.get_rect())
+    if not rect.width or not rect.height:
+        return
+    stencil = pygame.Surface(rect.size)
+    stencil.set_colorkey((0, 0, 0))
+    pygame.draw.polygon(stencil, (255, 255, 255), [(x - rect.x, y - rect.y) for x, y in points])
+    mask = pygame.mask.from_surface(stencil)
+    mask.to_surface(screen, setsurface=background.subsurface(rect), setcolor=None, unsetcolor=None, dest=rect.topleft)
+
+
+class RingSprite:
+    def __init__(self, radius, gap_angle, gap_size, thickness, color):
+        # aaa sprite con gap (para hornear) y anillo completo (para los q rotan) -bynd
+        self.radius = radius
+        self.gap_angle = gap_angle
+        self.gap_size = gap_size
+        self.thickness = thickness
+        self.color = color
+        self.surface = rasterize_ring(radius, gap_angle, gap_size, thickness, color)
+        self.annulus = None
+        self.band_mask = None
+
+    def band(self):
+        # vavavava máscara de todo lo q el gap puede tocar al girar (banda del anillo + 2px) -bynd
+        if self.band_mask is None:
+            self.band_mask = pygame.mask.from_surface(rasterize_annulus(self.radius, self.thickness + 2, self.color))
+        return self.band_mask
+
+    def draw_rotated(self, screen, center, angle, background, fill=None):
+        # q chidoteee rotar el sprite grande cuesta ms, mejor anillo completo + recorte del gap -bynd
+        if self.annulus is None:
+            self.annulus = rasterize_annulus(self.radius, self.thickness, self.color)
+        screen.blit(self.annulus, self.annulus.get_rect(center=center))
+
+        # ala el gap se restaura con lo q hay abajo (fondo horneado), solo dentro de la banda del anillo -bynd
+        # ey con fill es q abajo no hay nada horneado y el color plano queda igual pixel a pixel, más barato -bynd
+        cx, cy = center
+        gap = self.gap_angle + angle
+        gap_start = gap - self.gap_size / 2
+        gap_end = gap + self.gap_size / 2
+        outer = arc_points(cx, cy, self.radius + self.thickness + 1, gap_start, gap_end, GAP_STEP)
+        inner = arc_points(cx, cy, self.radius - self.thickness - 1, gap_start, gap_end, GAP_STEP)
+        if fill is not None:
+            pygame.draw.polygon(screen, fill, outer + inner[::-1])
+        else:
+            restore_polygon(screen, background, outer + inner[::-1])
+
+        # fokeis puntas redondas en las orillas del gap -bynd
+        for edge in (gap_start, gap_end):
+            rad = math.radians(edge)
+            tip = (cx + self.radius * math.cos(rad), cy + self.radius * math.sin(rad))
+            pygame.draw.circle(screen, self.color, tip, self.thickness)
+
+
+class RingSpriteCache:
+    def __init__(self):
+        # vavavava cache de sprites por geometría, se puede compartir -bynd
+        self.sprites = {}
+
+    def get(self, ring, color):
+        # ey la llave es la geometría, no el objeto Ring -bynd
+        key = (ring.radius, ring.gap_angle, ring.gap_size, ring.thickness, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = RingSprite(ring.radius, ring.gap_angle, ring.gap_size, ring.thickness, color)
+            self.sprites[key] = sprite
+        return sprite
+
+
+class RingRenderer:
+    def __init__(self, size, background, color, cache=None):
+        # aaa capa de fondo con los anillos estáticos ya compuestos -bynd
+        self.size = size
+        self.background_color = background
+        self.color = color
+        self.cache = cache if cache is not None else RingSpriteCache()
+        self.background = pygame.Surface(size)
+        self.baked = None
+        self.clean = set()
+
+    def get_background(self, rings):
+        # chintrolas solo re-horneamos cuando se destruye un anillo estático -bynd
+        state = rings.static_state()
+        if state != self.baked:
+            self.bake(rings)
+            self.baked = state
+        return self.background
+
+    def bake(self, rings):
+        # q chidoteee fondo + todos los anillos estáticos vivos -bynd
+        self.background.fill(self.background_color)
+        for ring in rings:
+            if not ring.destroyed and not ring.rotation_speed:
+                surface = self.cache.get(ring, self.color).surface
+                self.background.blit(surface, surface.get_rect(center=ring.center))
+
+        # chintrolas anillos q rotan sin nada horneado bajo su banda, a esos el gap se les borra con color plano -bynd
+        occupied = pygame.mask.from_threshold(self.background, self.background_color, (1, 1, 1, 255))
+        occupied.invert()
+        self.clean = set()
+        for index, ring in enumerate(rings):
+            if ring.rotation_speed and not ring.destroyed:
+                band = self.cache.get(ring, self.color).band()
+                offset = band.get_rect(center=ring.center).topleft
+                if occupied.overlap(band, offset) is None:
+                    self.clean.add(index)
+
+    def draw_rotating(self, screen, rings, rotations=None):
+        # fokeis los anillos q rotan van encima del fondo cada frame, rotaciones del RingSet de un jalón -bynd
+        # ey rotations opcional (array en grados) para dibujarlos interpolados entre pasos -bynd
+        if rotations is None:
+            rotations = rings.rotations()
+        visible = np.nonzero(~rings.destroyed & ~rings.static)[0].tolist()
+        for index, angle in zip(visible, rotations[visible].tolist()):
+            ring = rings[index]
+            sprite = self.cache.get(ring, self.color)
+            fill = self.background_color if index in self.clean else None
+            sprite.draw_rotated(screen, ring.center, angle, self.background, fill)
+
+
+class GraveyardLayer:
+    def __init__(self, size, color, radius):
+        # aaa capa transparente con todas las bolas muertas, se hornea de a poquito -bynd
+        self.color = color
+        self.radius = int(radius)
+        self.key = colorkey_for(color)
+        self.surface = pygame.Surface(size)
+        self.surface.fill(self.key)
+        self.surface.set_colorkey(self.key, pygame.RLEACCEL)
+        self.count = 0
+        self.bounds = None
+
+    def sync(self, positions):
+        # vavavava solo dibujamos las bolas q murieron desde la última vez -bynd
+        # chintrolas regresa los rects nuevos para marcarlos como sucios -bynd
+        if len(positions) < self.count:
+            self.surface.fill(self.key)
+            self.count = 0
+            self.bounds = None
+
+        rects = []
+        size = self.radius * 2 + 4
+        for x, y in positions[self.count:]:
+            center = (int(x), int(y))
+            pygame.draw.circle(self.surface, self.color, center, self.radius)
+            rect = pygame.Rect(center[0] - size // 2, center[1] - size // 2, size, size)
+            self.bounds = rect if self.bounds is None else self.bounds.union(rect)
+            rects.append(rect)
+        self.count = len(positions)
+        return rects
+
+    def draw(self, screen, regions):
+        # q chidoteee blit de la capa solo donde hay algo sucio, nunca bola por bola -bynd
+        if self.bounds is None:
+            return
+        for rect in regions:
+            area = rect.clip(self.bounds)
+            if area.width and area.height:
+                screen.blit(self.surface, area, area)
+
+
+class BallSprite:
+    def __init__(self, radius, color):
+        # aaa bola pre-renderizada para pegar miles con un solo blits -bynd
+        self.radius = int(radius)
+        self.extent = self.radius + 1
+        self.surface = new_sprite_surface(self.extent, colorkey_for(color))
+        pygame.draw.circle(self.surface, color, (self.extent, self.extent), self.radius)
+
+    def draw_many(self, screen, positions):
+        # vavavava positions es un array (N, 2), queda igual q draw.circle en (int(x), int(y)) -bynd
+        if len(positions) == 0:
+            return
+        corners = (positions.astype(np.int32) - self.extent).tolist()
+        screen.blits(zip(repeat(self.surface), corners), doreturn=False)
@@ -0,0 +1,67 @@
+import time
+from constants import FPS
+
+class FixedTimestep:
+    def __init__(self, rate=FPS, fps=FPS, max_frame_skip=5, timer=time.perf_counter):
+        # aaa acumulador de tiempo real: la física siempre avanza en pasos fijos de 1/rate -bynd
+        self.dt = 1.0 / rate
+        self.rate = rate
+        self.fps = fps
+        self.substeps = max(1, round(rate / fps))  # ey pasos por frame cuando todo va a tiempo -bynd
+        self.max_frame_skip = max_frame_skip
+        # chintrolas tope de pasos por frame, más atrás q eso mejor soltamos tiempo q entrar en espiral -bynd
+        self.max_steps = self.substeps * (max_frame_skip + 1)
+        self.timer = timer
+        self.reset()
+
+    def reset(self):
+        # vavavava de cero, el primer tick no cuenta el tiempo q pasó antes -bynd
+        self.last = None
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.behind = False
+        self.skipped = 0
+        self.frames_skipped = 0
+        self.dropped = 0.0
+        self.frames = 0
+        self.steps_done = 0
+
+    def tick(self):
+        # q chidoteee cuántos pasos fijos tocan por el tiempo real q pasó desde el último frame -bynd
+        now = self.timer()
+        if self.last is not None:
+            self.accumulator += now - self.last
+        self.last = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # fokeis ni saltando frames alcanzamos, aquí sí se alenta la física -bynd
+            self.dropped += (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        if self.accumulator >= self.dt:
+            self.accumulator %= self.dt
+
+        # ala cuánto del siguiente paso ya pasó, para interpolar el render -bynd
+        self.alpha = self.accumulator / self.dt
+        # chintrolas atrasados = nos tocó por lo menos un frame completo de más -bynd
+        self.behind = steps >= 2 * self.substeps
+        return steps
+
+    def frame(self):
+        # vavavava turbo y export: cada frame son exactamente 1/fps de tiempo simulado, sin reloj real -bynd
+        # chintrolas con rate q no es múltiplo de fps los pasos alternan (90 Hz a 60 FPS: 1, 2, 1, 2...) y no se acumula error -bynd
+        self.frames += 1
+        due = int(self.frames * self.rate // self.fps)
+        steps = due - self.steps_done
+        self.steps_done = due
+        return steps
+
+    def should_draw(self):
+        # ey si vamos atrasados nos saltamos el dibujo (hasta max_frame_skip seguidos) en vez de alentar la física -bynd
+        if self.behind and self.skipped < self.max_frame_skip:
+            self.skipped += 1
+            self.frames_skipped += 1
+            return False
+        self.skipped = 0
+        return True
@@ -0,0 +1,237 @@
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from levels import LevelConfig
+from ring import Ring
+from simulation import PlinkoSimulation
+from events import EventBus
+from montecarlo import init_worker, worker_config
+
+# ey tope del gap: más de media vuelta abierta ya no es un anillo q estorbe -bynd
+MAX_GAP_SIZE = 180
+MIN_ROTATION = 5  # chintrolas un anillo q rota no se vuelve estático ni cambia de sentido -bynd
+PARAMS = ('gap_angle', 'gap_size', 'rotation_speed')
+
+# vavavava qué tanto se mueve cada parámetro por mutación (escala 1.0) -bynd
+STEPS = {'gap_angle': 30, 'gap_size': 10, 'rotation_speed': 10}
+
+METRICS = ('escape_time', 'yes_rate')
+DEFAULT_TOLERANCE = {'escape_time': 1.0, 'yes_rate': 0.02}
+# ala objetivo por defecto de escape_time: la mitad del timer, algo q un nivel ganable sí alcanza -bynd
+TARGET_FRACTION = 0.5
+# fokeis un partido q se acabó el tiempo no escapó; cuenta como si tardara el doble de lo q duró -bynd
+TIMEOUT_PENALTY = 2.0
+
+def with_rings(config, ring_configs):
+    # q chidoteee mismo nivel con otros anillos, sin tocar el original -bynd
+    level = dict(config)
+    level['rings'] = dict(config['rings'], ring_configs=ring_configs)
+    return level
+
+def tidy(value):
+    # ala un decimal y sin .0, así el JSON queda como escrito a mano -bynd
+    value = round(value, 1)
+    return int(value) if value == int(value) else value
+
+def clamp_ring(ring):
+    # fokeis dejamos el anillo dentro de lo q Ring acepta -bynd
+    ring = dict(ring)
+    ring['gap_angle'] = tidy(ring.get('gap_angle', 0) % 360)
+    # ey el gap nunca baja del mínimo de Ring (si no, Ring lo sube solito y el tuner se engaña) -bynd
+    ring['gap_size'] = tidy(min(MAX_GAP_SIZE, max(Ring.MIN_GAP_SIZE, ring.get('gap_size', Ring.MIN_GAP_SIZE))))
+    if ring.get('rotation_speed'):
+        speed = ring['rotation_speed']
+        ring['rotation_speed'] = tidy(math.copysign(max(MIN_ROTATION, abs(speed)), speed))
+    return ring
+
+def mutate(ring_configs, rng, scale, params=PARAMS):
+    # ala movemos unos cuantos anillos al azar alrededor del mejor -bynd
+    rings = [dict(ring) for ring in ring_configs]
+    for index in rng.sample(range(len(rings)), min(len(rings), rng.randint(1, 3))):
+        ring = rings[index]
+        for param in params:
+            # chintrolas los anillos estáticos se quedan estáticos -bynd
+            if param == 'rotation_speed' and not ring.get('rotation_speed'):
+                continue
+            value = ring.get(param, 0) + rng.gauss(0, STEPS[param] * scale)
+            if param == 'rotation_speed' and math.copysign(1, value) != math.copysign(1, ring[param]):
+                value = math.copysign(MIN_ROTATION, ring[param])
+            ring[param] = value
+        rings[index] = clamp_ring(ring)
+    return rings
+
+def run_matches(config, seeds, max_time=None):
+    # vavavava una sola simulación por job, entre seeds solo se reinicia -bynd
+    results = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = None
+        for seed in seeds:
+            if sim is None:
+                sim = PlinkoSimulation(config, seed=seed, events=EventBus())
+            else:
+                sim.reset(seed)
+            results.append(sim.run(max_time=max_time))
+    return results
+
+def _run_job(job):
+    # chintrolas el candidato viaja solo con sus anillos, el resto del nivel ya está en el worker -bynd
+    candidate, ring_configs, seeds, max_time = job
+    return candidate, run_matches(with_rings(worker_config(), ring_configs), seeds, max_time)
+
+def measure(metric, results):
+    # q chidoteee valor de la métrica y su error estándar -bynd
+    n = len(results)
+    if metric == 'yes_rate':
+        yes = sum(1 for r in results if r.get('winner') == 'YES')
+        # ey con pocos partidos 0% o 100% no es certeza, suavizamos el error -bynd
+        smooth = (yes + 1) / (n + 2)
+        return yes / n, math.sqrt(smooth * (1 - smooth) / n)
+    # chintrolas solo cuenta el tiempo de los q ganaron; los timeouts van castigados, arriba del timer -bynd
+    times = [r['time'] if r['won'] else r['time'] * TIMEOUT_PENALTY for r in results]
+    if n < 2:
+        return times[0], float('inf')
+    # fokeis error estándar de la mediana ~ 1.25 sigma / raíz de n, con n = los q sí escaparon -bynd
+    escaped = sum(1 for r in results if r['won'])
+    return statistics.median(times), 1.2533 * statistics.stdev(times) / math.sqrt(max(1, escaped))
+
+def evaluate(pool, candidates, seeds, batch, metric, target, best_error, max_time=None, z=2.0):
+    # aaa carrera: todos juegan los mismos seeds por rondas y los claramente malos se bajan -bynd
+    for candidate in candidates:
+        candidate.update(results=[], alive=True, error=float('inf'))
+
+    for start in range(0, len(seeds), batch):
+        alive = [i for i, c in enumerate(candidates) if c['alive']]
+        if not alive:
+            break
+        chunk = seeds[start:start + batch]
+        jobs = [(i, candidates[i]['rings'], chunk, max_time) for i in alive]
+        for i, results in pool.imap_unordered(_run_job, jobs, chunksize=1):
+            candidates[i]['results'] += results
+
+        # vavavava error contra el objetivo y qué tan seguro estamos -bynd
+        for i in alive:
+            candidate = candidates[i]
+            value, stderr = measure(metric, candidate['results'])
+            progress = statistics.mean(r['rings_destroyed'] for r in candidate['results'])
+            candidate.update(value=value, stderr=stderr, error=abs(value - target), progress=progress)
+
+        # chintrolas malo = aun en el mejor caso queda peor q el peor caso del mejor -bynd
+        reference = min([best_error] + [candidates[i]['error'] + z * candidates[i]['stderr'] for i in alive])
+        for i in alive:
+            candidate = candidates[i]
+            if candidate['error'] - z * candidate['stderr'] > reference:
+                candidate['alive'] = False
+
+    return candidates
+
+def rank(candidate):
+    # vavavava menor es mejor: error contra el objetivo y luego progreso en anillos -bynd
+    return (round(candidate['error'], 6), -candidate['progress'])
+
+def tune(config, metric, target, generations=10, population=8, matches=16, batch=4, workers=None,
+         base_seed=0, seed=0, tolerance=None, params=PARAMS, max_time=None):
+    # q chidoteee búsqueda (1+λ): mutamos el mejor, corremos la carrera y nos quedamos con el ganador -bynd
+    game_mode = config.get('type', 'escape')
+    if metric == 'yes_rate' and game_mode != '8ball':
+        raise ValueError(f"La métrica 'yes_rate' necesita un nivel '8ball', este es '{game_mode}'")
+    if metric == 'escape_time' and game_mode == '8ball':
+        raise ValueError("En '8ball' el partido siempre dura el timer, usa 'yes_rate'")
+    if tolerance is None:
+        tolerance = DEFAULT_TOLERANCE[metric]
+
+    rng = random.Random(seed)
+    seeds = [base_seed + i for i in range(matches)]
+    workers = workers or os.cpu_count() or 1
+
+    initial = [clamp_ring(ring) for ring in config['rings']['ring_configs']]
+    if initial != config['rings']['ring_configs']:
+        print(f"⚠️ Algunos anillos se ajustaron a los límites (gap {Ring.MIN_GAP_SIZE}°-{MAX_GAP_SIZE}°)")
+
+    history = []
+    with multiprocessing.Pool(workers, initializer=init_worker, initargs=(config,)) as pool:
+        # ey el nivel tal cual es el primer campeón, juega todos los partidos -bynd
+        best = evaluate(pool, [{'rings': initial}], seeds, batch, metric, target, float('inf'), max_time)[0]
+        print(f"🎯 Inicial: {metric}={best['value']:.3f} (objetivo {target}, error {best['error']:.3f})")
+        history.append({'generation': 0, 'value': best['value'], 'error': best['error'], 'pruned': 0})
+
+        scale = 1.0
+        for generation in range(1, generations + 1):
+            if best['error'] <= tolerance:
+                print(f"✅ Dentro de la tolerancia ({tolerance}), listo")
+                break
+
+            start = time.perf_counter()
+            candidates = [{'rings': mutate(best['rings'], rng, scale, params)} for _ in range(population)]
+            evaluate(pool, candidates, seeds, batch, metric, target, best['error'], max_time)
+            finished = [c for c in candidates if c['alive']]
+            pruned = len(candidates) - len(finished)
+
+            # ala si nadie mejora, mutaciones más chicas -bynd
+            # ey con el mismo error (ej. todos se acaban el timer) gana el q rompe más anillos -bynd
+            winner = min(finished, key=rank, default=None)
+            if winner and rank(winner) < rank(best):
+                best = winner
+                mark = '⬆️'
+            else:
+                scale *= 0.7
+                mark = '  '
+            print(f"{mark} Gen {generation}: {metric}={best['value']:.3f} error {best['error']:.3f} | "
+                  f"{pruned}/{population} cortados antes | escala {scale:.2f} ({time.perf_counter() - start:.1f}s)")
+            history.append({'generation': generation, 'value': best['value'], 'error': best['error'], 'pruned': pruned})
+
+    return best, history
+
+def main():
+    parser = argparse.ArgumentParser(description="Ajusta gap_angle, gap_size y rotation_speed de un nivel")
+    parser.add_argument('config', nargs='?', default='level_config.json', help="archivo JSON del nivel")
+    parser.add_argument('--metric', choices=METRICS, default=None,
+                        help="yes_rate en 8ball, escape_time (mediana) en los demás")
+    parser.add_argument('--target', type=float, default=None, help="objetivo (0.5 en yes_rate, la mitad del timer en escape_time)")
+    parser.add_argument('--tolerance', type=float, default=None, help="qué tan cerca del objetivo es suficiente")
+    parser.add_argument('--params', nargs='*', choices=PARAMS, default=list(PARAMS), help="qué parámetros se mueven")
+    parser.add_argument('-g', '--generations', type=int, default=10, help="generaciones máximas")
+    parser.add_argument('-p', '--population', type=int, default=8, help="candidatos por generación")
+    parser.add_argument('-n', '--matches', type=int, default=16, help="partidos por candidato")
+    parser.add_argument('--batch', type=int, default=4, help="partidos por ronda antes de decidir si se corta")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="procesos (por defecto uno por core)")
+    parser.add_argument('--seed', type=int, default=0, help="seed de las mutaciones")
+    parser.add_argument('--base-seed', type=int, default=0, help="seed del primer partido")
+    parser.add_argument('--max-time', type=float, default=None, help="tiempo simulado máximo por partido")
+    parser.add_argument('--out', default=None, help="dónde escribir el nivel ajustado (por defecto <nivel>_tuned.json)")
+    parser.add_argument('--json', default=None, help="guarda el historial de la búsqueda en este archivo")
+    args = parser.parse_args()
+
+    config = LevelConfig(args.config).get_level()
+    metric = args.metric or ('yes_rate' if config.get('type') == '8ball' else 'escape_time')
+    target = args.target if args.target is not None else (0.5 if metric == 'yes_rate' else config.get('timer', 30) * TARGET_FRACTION)
+
+    start = time.perf_counter()
+    try:
+        best, history = tune(config, metric, target, args.generations, args.population, args.matches, args.batch,
+                             args.workers, args.base_seed, args.seed, args.tolerance, tuple(args.params), args.max_time)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # vavavava escribimos el nivel completo con los anillos ganadores -bynd
+    out = args.out or os.path.splitext(args.config)[0] + '_tuned.json'
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(with_rings(config, best['rings']), f, indent=2, ensure_ascii=False)
+    print("=" * 50)
+    print(f"🏁 {metric}={best['value']:.3f} (objetivo {target}) en {time.perf_counter() - start:.1f}s")
+    print(f"✅ Nivel ajustado guardado en {out}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'metric': metric, 'target': target, 'best': best['rings'], 'history': history}, f, indent=2)
+        print(f"✅ Historial guardado en {args.json}")
+
+if __name__ == "__main__":
+    main()
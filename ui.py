@@ -0,0 +1,161 @@
+from collections import OrderedDict
+from constants import WIDTH, HEIGHT
+import pygame
+
+# ey tamaños de fuente ajustados para 9:16 -bynd
+FONT_SIZES = {
+    'huge': 100,
+    'big': 64,
+    'medium': 42,
+    'small': 32,
+    'tiny': 20
+}
+
+RESTART_MSG = "Presiona R para reiniciar | ESC para salir"
+
+class TextCache:
+    def __init__(self, max_entries=512):
+        # aaa las fuentes se crean una sola vez -bynd
+        self.fonts = {name: pygame.font.Font(None, size) for name, size in FONT_SIZES.items()}
+
+        # vavavava cache de textos ya renderizados por (texto, fuente, color) -bynd
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+
+    def render(self, text, font, color):
+        # chintrolas si ya lo renderizamos antes lo reusamos -bynd
+        key = (text, font, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.fonts[font].render(text, True, color)
+            self.surfaces[key] = surface
+            # fokeis el timer cambia cada frame, tiramos lo más viejo -bynd
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+class HUD:
+    def __init__(self, config, text_cache=None):
+        # aaa HUD en modo retenido: solo cambia lo q cambió -bynd
+        self.config = config
+        self.text = text_cache if text_cache is not None else TextCache()
+        self.items = {}
+
+        # q chidoteee la pregunta se parte en dos líneas una sola vez -bynd
+        question = self.config.get('question', 'Magic 8 Ball')
+        if len(question) > 30:
+            words = question.split()
+            mid = len(words) // 2
+            self.question_lines = [(' '.join(words[:mid]), 20), (' '.join(words[mid:]), 45)]
+        else:
+            self.question_lines = [(question, 30)]
+
+    def color(self, name, default=None):
+        # ey colores del JSON como tupla -bynd
+        if default is not None:
+            return tuple(self.config['colors'].get(name, default))
+        return tuple(self.config['colors'][name])
+
+    def build(self, sim):
+        # vavavava lista de (clave, texto, fuente, color, posición) según el modo -bynd
+        # chintrolas posición 'center' centra en x como antes -bynd
+        items = []
+
+        if sim.game_mode == '8ball':
+            question_color = self.color('question_text')
+            for i, (line, y) in enumerate(self.question_lines):
+                items.append((f'question{i}', line, 'tiny', question_color, ('center', y)))
+
+            if not sim.game_over:
+                # q chidoteee contadores YES y NO -bynd
+                items.append(('yes', f"Yes: {sim.yes_score}", 'medium', self.color('yes_text'), (30, HEIGHT - 120)))
+                items.append(('no', f"No: {sim.no_score}", 'medium', self.color('no_text'), (WIDTH - 130, HEIGHT - 120)))
+
+                # ala timer abajo en el centro -bynd
+                items.append(('timer', f"{sim.get_remaining_time():.2f}", 'big', self.color('timer_text'), ('center', HEIGHT - 70)))
+            else:
+                # fokeis pantalla de ganador -bynd
+                if sim.winner == "YES":
+                    winner_color = self.color('yes_text')
+                elif sim.winner == "NO":
+                    winner_color = self.color('no_text')
+                else:
+                    winner_color = (200, 200, 200)
+                items.append(('winner', sim.winner, 'huge', winner_color, ('center', HEIGHT // 2 - 60)))
+
+                # aaa puntaje final y mensaje de reinicio -bynd
+                items.append(('score', f"{sim.yes_score} - {sim.no_score}", 'small', (200, 200, 200), ('center', HEIGHT // 2 + 40)))
+                items.append(('restart', RESTART_MSG, 'tiny', (200, 200, 200), ('center', HEIGHT // 2 + 100)))
+            return items
+
+        # q chidoteee UI para otros modos -bynd
+        remaining = sim.get_remaining_time()
+        if sim.game_mode == 'elimination' and remaining < 1:
+            timer_color = self.color('timer_warning', [255, 100, 100])
+        else:
+            timer_color = self.color('timer_text')
+        items.append(('timer', f"{remaining:.2f}", 'big', timer_color, ('center', HEIGHT - 70)))
+
+        if sim.game_over:
+            # fokeis mensajes de estado -bynd
+            if sim.won:
+                items.append(('status', "¡GANASTE!", 'small', (100, 255, 100), (WIDTH // 2 - 100, 50)))
+            else:
+                items.append(('status', "GAME OVER", 'small', (255, 100, 100), (WIDTH // 2 - 100, 50)))
+            items.append(('restart', RESTART_MSG, 'tiny', (200, 200, 200), (WIDTH // 2 - 180, 90)))
+            return items
+
+        msg = self.config.get('description', 'Escapa de todos los anillos!')
+        items.append(('description', msg, 'tiny', (255, 255, 255), ('center', 20)))
+
+        # chintrolas contador según modo -bynd
+        if sim.game_mode == 'elimination':
+            items.append(('balls', f"Bolas: {sim.balls_used}/{sim.max_balls}", 'tiny', (200, 200, 200), (20, HEIGHT - 70)))
+            items.append(('dead', f"Bolas muertas: {len(sim.dead_balls)}", 'tiny', (150, 150, 150), (20, HEIGHT - 40)))
+        elif sim.game_mode == 'swarm':
+            items.append(('balls', f"Bolas: {len(sim.swarm)}/{sim.ball_count}", 'tiny', (200, 200, 200), (20, HEIGHT - 70)))
+
+        # q chidoteee anillos restantes -bynd
+        rings_msg = f"Anillos: {sim.rings_alive}/{len(sim.rings)}"
+        if sim.game_mode == 'elimination':
+            items.append(('rings', rings_msg, 'tiny', (200, 200, 200), (WIDTH - 200, HEIGHT - 40)))
+        else:
+            items.append(('rings', rings_msg, 'tiny', (200, 200, 200), (20, HEIGHT - 40)))
+        return items
+
+    def update(self, sim):
+        # aaa recalculamos el HUD y regresamos los rects q cambiaron -bynd
+        new_items = {}
+        for key, text, font, color, (x, y) in self.build(sim):
+            surface = self.text.render(text, font, color)
+            if x == 'center':
+                x = WIDTH // 2 - surface.get_width() // 2
+            new_items[key] = (surface, surface.get_rect(topleft=(x, y)))
+
+        dirty = []
+        for key, (surface, rect) in new_items.items():
+            old = self.items.get(key)
+            if old is None:
+                dirty.append(rect)
+            elif old[0] is not surface or old[1] != rect:
+                # ey el texto viejo también hay q borrarlo -bynd
+                dirty.append(old[1].union(rect))
+        for key, (surface, rect) in self.items.items():
+            if key not in new_items:
+                dirty.append(rect)
+
+        self.items = new_items
+        return dirty
+
+    def get_rects(self):
+        # fokeis rects de todos los textos en pantalla -bynd
+        return [rect for surface, rect in self.items.values()]
+
+    def draw(self, screen, regions=None):
+        # vavavava blit de los textos, solo los q tocan regiones sucias -bynd
+        for surface, rect in self.items.values():
+            if regions is None or rect.collidelist(regions) != -1:
+                screen.blit(surface, rect)